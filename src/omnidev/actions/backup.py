@@ -5,15 +5,109 @@ Provides automatic backup creation, session-based organization,
 backup restoration, and retention policies.
 """
 
+import errno
+import functools
+import os
 import shutil
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
+from urllib.parse import quote, unquote
 
 from omnidev.core.exceptions import FileOperationError
 from omnidev.core.logger import get_logger
 from omnidev.core.session import SessionManager
 
+_BACKUP_SUFFIX = ".backup"
+
+# Bytes requested per copy_file_range call
+_COPY_CHUNK_SIZE = 1024 * 1024 * 1024
+
+# Errors meaning the kernel cannot copy between these files; fall back to shutil
+_COPY_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF}
+
+
+@functools.lru_cache(maxsize=4096)
+def _backup_name(rel_posix: str) -> str:
+    """Build the backup filename for a project-relative POSIX path.
+
+    The path is percent-encoded (including ``_``) so it can be decoded back
+    exactly by ``_restore_rel_path``.
+
+    Args:
+        rel_posix: File path relative to the project root, in POSIX form.
+
+    Returns:
+        Flat backup filename stored inside a session directory.
+    """
+    return quote(rel_posix, safe="").replace("_", "%5F") + _BACKUP_SUFFIX
+
+
+def _restore_rel_path(backup_name: str) -> str:
+    """Recover the project-relative POSIX path from a backup filename.
+
+    Args:
+        backup_name: Backup filename produced by ``_backup_name``.
+
+    Returns:
+        Original file path relative to the project root.
+    """
+    encoded = backup_name.removesuffix(_BACKUP_SUFFIX)
+    if "_" in encoded:
+        # Legacy backups joined path parts with "_"
+        return encoded.replace("_", "/")
+    return unquote(encoded)
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """Copy a file and its metadata, letting the kernel move the data.
+
+    Uses ``os.copy_file_range`` where available so the copy stays in kernel
+    space (and may become a reflink on CoW filesystems), falling back to
+    ``shutil.copy2`` when the platform or filesystem does not support it.
+    Some filesystems report 0 bytes copied instead of failing; a non-empty
+    source that copied nothing also falls back, as ``shutil`` does.
+
+    Args:
+        src: Source file path.
+        dst: Destination file path.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                copied = 0
+                while True:
+                    sent = os.copy_file_range(fsrc.fileno(), fdst.fileno(), _COPY_CHUNK_SIZE)
+                    if not sent:
+                        break
+                    copied += sent
+                source_empty = os.fstat(fsrc.fileno()).st_size == 0
+            if copied or source_empty:
+                shutil.copystat(src, dst)
+                return
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+
+    shutil.copy2(src, dst)
+
+
+def _is_session_dir(name: str) -> bool:
+    """Check whether a directory name is a backup session directory.
+
+    Args:
+        name: Directory name inside the backup root.
+
+    Returns:
+        True for ``session_<id>`` and ``YYYYMMDD_HHMMSS`` directories.
+    """
+    if name.startswith("session_"):
+        return True
+    date_part, _, time_part = name.partition("_")
+    return len(date_part) == 8 and len(time_part) == 6 and (date_part + time_part).isdigit()
+
 
 class BackupManager:
     """Manages file backups for safe operations."""
@@ -59,24 +153,77 @@ class BackupManager:
             return None
 
         try:
-            # Determine backup location
-            if self.current_session_dir:
-                backup_dir = self.current_session_dir
-            else:
-                # Create timestamped backup directory
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_dir = self.backup_root / timestamp
-                backup_dir.mkdir(parents=True, exist_ok=True)
+            backup_dir = self._ensure_backup_dir()
+        except Exception as e:
+            raise FileOperationError(f"Failed to create backup for {file_path}: {e}") from e
+        return self._copy_to_backup(file_path, backup_dir)
 
-            # Create backup file path
-            rel_path = file_path.relative_to(self.project_root)
-            backup_path = backup_dir / f"{rel_path.as_posix().replace('/', '_')}.backup"
+    def create_backups(self, file_paths: Iterable[Path]) -> list[Optional[Path]]:
+        """Back up several files concurrently.
 
-            # Ensure backup directory exists
-            backup_path.parent.mkdir(parents=True, exist_ok=True)
+        The backup directory is prepared once up front, then the copies are
+        spread over a thread pool so their I/O latency overlaps.
 
-            # Copy file to backup
-            shutil.copy2(file_path, backup_path)
+        Args:
+            file_paths: Paths of the files to backup.
+
+        Returns:
+            Backup paths in the same order as ``file_paths``; None for files
+            that don't exist.
+
+        Raises:
+            FileOperationError: If any backup creation fails.
+        """
+        paths = list(file_paths)
+        existing = [path.exists() for path in paths]
+        if not any(existing):
+            return [None] * len(paths)
+
+        try:
+            backup_dir = self._ensure_backup_dir()
+        except Exception as e:
+            raise FileOperationError(f"Failed to prepare backup directory: {e}") from e
+
+        def backup_one(path: Path, exists: bool) -> Optional[Path]:
+            return self._copy_to_backup(path, backup_dir) if exists else None
+
+        max_workers = min(32, (os.cpu_count() or 4) * 2, len(paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(backup_one, paths, existing))
+
+    def _ensure_backup_dir(self) -> Path:
+        """Get the directory new backups should be written to, creating it if needed.
+
+        Returns:
+            Current session directory, or a new timestamped directory.
+        """
+        if self.current_session_dir:
+            backup_dir = self.current_session_dir
+        else:
+            # Create timestamped backup directory
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            backup_dir = self.backup_root / timestamp
+
+        backup_dir.mkdir(parents=True, exist_ok=True)
+        return backup_dir
+
+    def _copy_to_backup(self, file_path: Path, backup_dir: Path) -> Path:
+        """Copy a file into an existing backup directory.
+
+        Args:
+            file_path: Path to the file to backup.
+            backup_dir: Directory to write the backup into.
+
+        Returns:
+            Path to the backup file.
+
+        Raises:
+            FileOperationError: If the copy fails.
+        """
+        try:
+            rel_path = file_path.relative_to(self.project_root)
+            backup_path = backup_dir / _backup_name(rel_path.as_posix())
+            _fast_copy(file_path, backup_path)
 
             self.logger.debug(f"Created backup: {file_path} -> {backup_path}")
             return backup_path
@@ -102,11 +249,8 @@ class BackupManager:
         try:
             # Determine destination
             if destination is None:
-                # Try to infer from backup filename
-                backup_name = backup_path.stem.replace(".backup", "")
-                # Convert back to relative path
-                parts = backup_name.split("_")
-                destination = self.project_root / Path(*parts)
+                # Infer the original relative path from the backup filename
+                destination = self.project_root / _restore_rel_path(backup_path.name)
             else:
                 destination = destination.resolve()
 
@@ -130,27 +274,39 @@ class BackupManager:
         Returns:
             List of backup file paths.
         """
-        backups: list[Path] = []
-
-        # Search all session directories
-        for session_dir in self.backup_root.iterdir():
-            if not session_dir.is_dir():
-                continue
-
-            if file_path:
-                # Filter by file path
-                rel_path = file_path.relative_to(self.project_root)
-                backup_name = f"{rel_path.as_posix().replace('/', '_')}.backup"
-                backup_file = session_dir / backup_name
-                if backup_file.exists():
-                    backups.append(backup_file)
-            else:
-                # List all backups in session
-                backups.extend(session_dir.glob("*.backup"))
+        # (mtime, path) pairs so sorting never has to stat a backup twice
+        backups: list[tuple[float, Path]] = []
+
+        if file_path:
+            # Filter by file path: probe each session for the one backup name
+            rel_path = file_path.relative_to(self.project_root)
+            backup_name = _backup_name(rel_path.as_posix())
+            with os.scandir(self.backup_root) as session_entries:
+                for session_entry in session_entries:
+                    if not session_entry.is_dir(follow_symlinks=False):
+                        continue
+                    backup_file = os.path.join(session_entry.path, backup_name)
+                    try:
+                        mtime = os.stat(backup_file).st_mtime
+                    except FileNotFoundError:
+                        continue
+                    backups.append((mtime, Path(backup_file)))
+        else:
+            # List all backups, descending only into session directories
+            root_dir = os.fspath(self.backup_root)
+            for current_dir, dir_names, file_names in os.walk(root_dir):
+                if current_dir == root_dir:
+                    dir_names[:] = [name for name in dir_names if _is_session_dir(name)]
+                    continue
+                dir_names[:] = []
+                for name in file_names:
+                    if name.endswith(_BACKUP_SUFFIX):
+                        backup_file = os.path.join(current_dir, name)
+                        backups.append((os.stat(backup_file).st_mtime, Path(backup_file)))
 
         # Sort by modification time (newest first)
-        backups.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        return backups
+        backups.sort(key=lambda item: item[0], reverse=True)
+        return [path for _, path in backups]
 
     def get_latest_backup(self, file_path: Path) -> Optional[Path]:
         """Get the latest backup for a file.
@@ -161,6 +317,13 @@ class BackupManager:
         Returns:
             Path to latest backup if found, None otherwise.
         """
+        # Backups are written to the current session, so check it before scanning all sessions
+        if self.current_session_dir:
+            rel_path = file_path.relative_to(self.project_root)
+            candidate = self.current_session_dir / _backup_name(rel_path.as_posix())
+            if candidate.exists():
+                return candidate
+
         backups = self.list_backups(file_path)
         return backups[0] if backups else None
 
@@ -178,15 +341,20 @@ class BackupManager:
         deleted_count = 0
 
         # Clean up old session directories
-        session_dirs = sorted(
-            [d for d in self.backup_root.iterdir() if d.is_dir()],
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,
-        )
+        with os.scandir(self.backup_root) as entries:
+            session_dirs = sorted(
+                (
+                    (entry.stat().st_mtime, Path(entry.path))
+                    for entry in entries
+                    if entry.is_dir(follow_symlinks=False)
+                ),
+                key=lambda item: item[0],
+                reverse=True,
+            )
 
         # Keep only recent sessions
-        for i, session_dir in enumerate(session_dirs):
-            if i >= self.MAX_SESSIONS or session_dir.stat().st_mtime < cutoff_time:
+        for i, (mtime, session_dir) in enumerate(session_dirs):
+            if i >= self.MAX_SESSIONS or mtime < cutoff_time:
                 try:
                     shutil.rmtree(session_dir)
                     deleted_count += 1
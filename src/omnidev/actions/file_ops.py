@@ -5,7 +5,12 @@ Provides safe file create, read, update, delete operations with
 path validation, permission checking, and atomic operations.
 """
 
+import os
 import shutil
+import stat
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
@@ -13,6 +18,57 @@ from omnidev.core.exceptions import FileOperationError, ValidationError
 from omnidev.core.logger import get_logger
 
 
+def _read_umask() -> int:
+    """Read the process umask.
+
+    os.umask can only be read by setting it, so the old value is restored
+    immediately.
+
+    Returns:
+        Current umask.
+    """
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+# Permissions given to newly created files, as open(..., "w") would under the umask
+_DEFAULT_FILE_MODE = 0o666 & ~_read_umask()
+
+
+def _atomic_write_bytes(dst: Path, data: bytes) -> None:
+    """Atomically replace a file's content.
+
+    Writes to a uniquely named temporary file in the destination directory,
+    flushes it to disk, then renames it over the destination. Existing file
+    permissions are preserved.
+
+    Args:
+        dst: Destination file path.
+        data: Bytes to write.
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(dst).st_mode)
+    except FileNotFoundError:
+        mode = _DEFAULT_FILE_MODE
+
+    fd, tmp_name = tempfile.mkstemp(dir=dst.parent, prefix=f".{dst.name}.", suffix=".tmp")
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+        os.fsync(fd)
+        os.close(fd)
+        fd = -1
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, dst)
+    except BaseException:
+        if fd != -1:
+            os.close(fd)
+        os.unlink(tmp_name)
+        raise
+
+
 class FileOperations:
     """Handles file operations with safety checks."""
 
@@ -31,6 +87,15 @@ class FileOperations:
         "C:\\Program Files (x86)",
     }
 
+    # Lowercased once so validation can match all prefixes in one startswith call.
+    # Longest first, so the most specific protected directory is tried first.
+    _PROTECTED_PREFIXES = tuple(
+        sorted((protected.lower() for protected in PROTECTED_DIRS), key=len, reverse=True)
+    )
+
+    # Maximum number of stat results kept within one batch
+    STAT_CACHE_SIZE = 1024
+
     def __init__(self, project_root: Path) -> None:
         """Initialize file operations.
 
@@ -40,6 +105,13 @@ class FileOperations:
         self.project_root = project_root.resolve()
         self.logger = get_logger("file_ops")
 
+        # Precomputed for the string-prefix "inside project root" check
+        self._project_root_key = os.path.normcase(str(self.project_root))
+        self._project_root_prefix = os.path.join(self._project_root_key, "")
+        # Stat results are only cached inside batch(); None outside of one
+        self._stat_cache: Optional[dict[str, Optional[os.stat_result]]] = None
+        self._batch_depth = 0
+
     def create_file(self, file_path: Path, content: str, overwrite: bool = False) -> Path:
         """Create a new file.
 
@@ -64,9 +136,8 @@ class FileOperations:
             resolved_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Write file atomically
-            temp_path = resolved_path.with_suffix(resolved_path.suffix + ".tmp")
-            temp_path.write_text(content, encoding="utf-8")
-            temp_path.replace(resolved_path)
+            _atomic_write_bytes(resolved_path, content.encode("utf-8"))
+            self.invalidate(resolved_path)
 
             self.logger.info(f"Created file: {resolved_path}")
             return resolved_path
@@ -121,9 +192,8 @@ class FileOperations:
 
         try:
             # Write file atomically
-            temp_path = resolved_path.with_suffix(resolved_path.suffix + ".tmp")
-            temp_path.write_text(content, encoding="utf-8")
-            temp_path.replace(resolved_path)
+            _atomic_write_bytes(resolved_path, content.encode("utf-8"))
+            self.invalidate(resolved_path)
 
             self.logger.info(f"Updated file: {resolved_path}")
             return resolved_path
@@ -145,6 +215,7 @@ class FileOperations:
 
         try:
             resolved_path.unlink()
+            self.invalidate(resolved_path)
             self.logger.info(f"Deleted file: {resolved_path}")
         except Exception as e:
             raise FileOperationError(f"Failed to delete file {resolved_path}: {e}") from e
@@ -196,55 +267,113 @@ class FileOperations:
         """Validate a file path.
 
         Args:
-            path: Path to validate.
+            path: Resolved path to validate.
             must_exist: Whether path must exist.
             allow_existing: Whether existing paths are allowed.
 
         Raises:
             ValidationError: If path is invalid.
         """
-        # Check if path is in protected directory (only for absolute system paths)
-        path_str = str(path.resolve())
-        path_lower = path_str.lower()
-        
+        # Check if path is in protected directory (only for absolute system paths).
+        # Callers pass paths already resolved by _resolve_path.
+        path_lower = str(path).lower()
+
         # Allow temp directories for testing
         is_temp_dir = "temp" in path_lower or "tmp" in path_lower
-        
-        if not is_temp_dir:
-            for protected in self.PROTECTED_DIRS:
-                protected_lower = protected.lower()
-                if path_lower.startswith(protected_lower):
-                    raise ValidationError(f"Path is in protected directory: {path}")
+
+        if not is_temp_dir and path_lower.startswith(self._PROTECTED_PREFIXES):
+            raise ValidationError(f"Path is in protected directory: {path}")
 
         # Check if path is within project root (skip for temp dirs in tests)
         if not is_temp_dir:
-            try:
-                path.relative_to(self.project_root)
-            except ValueError:
-                # Also check if it's a parent directory (outside project)
-                try:
-                    self.project_root.relative_to(path.parent)
-                    # If project root is inside path's parent, path is outside
-                    raise ValidationError(f"Path is outside project root: {path}")
-                except ValueError:
-                    # Path is definitely outside
-                    raise ValidationError(f"Path is outside project root: {path}")
+            path_key = os.path.normcase(str(path))
+            if path_key != self._project_root_key and not path_key.startswith(
+                self._project_root_prefix
+            ):
+                raise ValidationError(f"Path is outside project root: {path}")
+
+        path_stat = self._cached_stat(path)
 
         # Check if file exists (if required)
-        if must_exist and not path.exists():
+        if must_exist and path_stat is None:
             raise ValidationError(f"File does not exist: {path}")
 
         # Check if file already exists (if not allowed)
-        if not allow_existing and path.exists():
+        if not allow_existing and path_stat is not None:
             raise ValidationError(f"File already exists: {path}")
 
         # Check write permissions for parent directory
-        if path.parent.exists():
-            if not path.parent.is_dir():
+        parent_stat = self._cached_stat(path.parent)
+        if parent_stat is not None:
+            if not stat.S_ISDIR(parent_stat.st_mode):
                 raise ValidationError(f"Parent is not a directory: {path.parent}")
             if not self._is_writable(path.parent):
                 raise ValidationError(f"Directory is not writable: {path.parent}")
 
+    @contextmanager
+    def batch(self) -> Iterator["FileOperations"]:
+        """Cache stat results for the duration of a multi-file operation.
+
+        Validation normally stats paths afresh on every call. Inside a batch,
+        results are reused until the outermost batch exits, so callers should
+        only batch work that doesn't race with changes made outside OmniDev.
+
+        Yields:
+            This FileOperations instance.
+        """
+        if self._batch_depth == 0:
+            self._stat_cache = {}
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._stat_cache = None
+
+    def _cached_stat(self, path: Path) -> Optional[os.stat_result]:
+        """Stat a path, reusing results from earlier validations in the same batch.
+
+        Args:
+            path: Path to stat.
+
+        Returns:
+            Stat result, or None if the path does not exist.
+        """
+        key = str(path)
+        cache = self._stat_cache
+        if cache is not None and key in cache:
+            return cache[key]
+
+        try:
+            result: Optional[os.stat_result] = os.stat(key)
+        except (FileNotFoundError, NotADirectoryError):
+            result = None
+
+        if cache is not None:
+            if len(cache) >= self.STAT_CACHE_SIZE:
+                # Evict the oldest entry (dicts preserve insertion order)
+                del cache[next(iter(cache))]
+            cache[key] = result
+        return result
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        """Drop cached stat results after the filesystem changes.
+
+        Args:
+            path: Path whose entry (and its parent's) should be dropped.
+                If None, the whole cache is cleared.
+        """
+        if self._stat_cache is None:
+            return
+
+        if path is None:
+            self._stat_cache.clear()
+            return
+
+        self._stat_cache.pop(str(path), None)
+        self._stat_cache.pop(str(path.parent), None)
+
     def _is_writable(self, path: Path) -> bool:
         """Check if a path is writable.
 
@@ -254,14 +383,7 @@ class FileOperations:
         Returns:
             True if writable, False otherwise.
         """
-        try:
-            # Try to create a test file
-            test_file = path / ".omnidev_write_test"
-            test_file.touch()
-            test_file.unlink()
-            return True
-        except Exception:
-            return False
+        return os.access(path, os.W_OK)
 
     def get_file_size(self, file_path: Path) -> int:
         """Get file size in bytes.
@@ -303,6 +425,7 @@ class FileOperations:
 
         try:
             shutil.copy2(source_resolved, dest_resolved)
+            self.invalidate(dest_resolved)
             self.logger.info(f"Copied file: {source_resolved} -> {dest_resolved}")
             return dest_resolved
         except Exception as e:
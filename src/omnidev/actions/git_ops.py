@@ -5,18 +5,51 @@ Provides Git repository detection, auto-commit functionality,
 smart commit message generation, branch management, and rollback support.
 """
 
+import functools
+from collections import Counter
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Optional
-
-try:
-    import git
-except ImportError:
-    git = None  # type: ignore
+from types import ModuleType
+from typing import Any, Optional
 
 from omnidev.core.exceptions import FileOperationError
 from omnidev.core.logger import get_logger
 
 
+@functools.lru_cache(maxsize=1)
+def _import_git() -> Optional[ModuleType]:
+    """Import GitPython on first use.
+
+    GitPython is slow to import, so it is only loaded once Git operations
+    are actually needed.
+
+    Returns:
+        The ``git`` module, or None if GitPython is not installed.
+    """
+    try:
+        import git
+    except ImportError:
+        return None
+    return git
+
+
+@functools.lru_cache(maxsize=4)
+def _open_repo(project_root: str) -> Any:
+    """Open (and cache) the repository containing a project root.
+
+    Caching avoids repeating the parent-directory search each time a
+    ``GitOperations`` is created for the same project.
+
+    Args:
+        project_root: Resolved project root path.
+
+    Returns:
+        GitPython ``Repo`` for the enclosing repository.
+    """
+    git = _import_git()
+    return git.Repo(project_root, search_parent_directories=True)
+
+
 class GitOperations:
     """Handles Git operations for version control."""
 
@@ -32,13 +65,14 @@ class GitOperations:
         self.project_root = project_root.resolve()
         self.logger = get_logger("git")
 
+        git = _import_git()
         if git is None:
             self.repo = None
             self.logger.warning("GitPython not installed - Git operations disabled")
             return
 
         try:
-            self.repo = git.Repo(self.project_root, search_parent_directories=True)
+            self.repo = _open_repo(str(self.project_root))
             self.logger.info(f"Initialized Git operations for: {self.repo.working_dir}")
         except git.InvalidGitRepositoryError:
             self.repo = None
@@ -86,10 +120,12 @@ class GitOperations:
             raise FileOperationError("Not a Git repository")
 
         try:
-            # Check if branch already exists
-            if branch_name in [ref.name for ref in self.repo.heads]:
+            # Check the ref directly rather than scanning repo.heads, whose
+            # name lookup also matches list attributes such as "count"
+            existing = _import_git().Head(self.repo, f"refs/heads/{branch_name}")
+            if existing.is_valid():
                 if checkout:
-                    self.repo.heads[branch_name].checkout()
+                    existing.checkout()
                 return branch_name
 
             # Create new branch
@@ -111,6 +147,13 @@ class GitOperations:
         if not self.repo:
             return []
 
+        try:
+            return self._parse_porcelain_status(
+                self.repo.git.status("--porcelain=v1", "-z", "--untracked-files=all")
+            )
+        except Exception:
+            pass
+
         try:
             changed_files = []
             for item in self.repo.index.diff(None):
@@ -122,6 +165,27 @@ class GitOperations:
         except Exception:
             return []
 
+    def _parse_porcelain_status(self, raw: str) -> list[Path]:
+        """Parse ``git status --porcelain=v1 -z`` output into file paths.
+
+        Args:
+            raw: NUL-separated status output.
+
+        Returns:
+            List of changed file paths.
+        """
+        changed_files = []
+        entries = iter(raw.split("\0"))
+        for entry in entries:
+            if len(entry) < 4:
+                continue
+            status, path = entry[:2], entry[3:]
+            changed_files.append(self.project_root / path)
+            if "R" in status or "C" in status:
+                # Renames and copies are followed by their source path
+                next(entries, None)
+        return changed_files
+
     def generate_commit_message(self, files: list[Path], operation: str = "update") -> str:
         """Generate a smart commit message based on changes.
 
@@ -142,14 +206,11 @@ class GitOperations:
             return f"{operation}: {file_name}"
         else:
             # Group by file type
-            extensions: dict[str, int] = {}
-            for file_path in files:
-                ext = file_path.suffix or "no extension"
-                extensions[ext] = extensions.get(ext, 0) + 1
+            extensions = Counter(file_path.suffix or "no extension" for file_path in files)
 
             # Generate summary
             if len(extensions) == 1:
-                ext = list(extensions.keys())[0]
+                ext = next(iter(extensions))
                 return f"{operation}: {file_count} {ext} files"
             else:
                 return f"{operation}: {file_count} files"
@@ -180,25 +241,24 @@ class GitOperations:
             # Stage files
             if auto_stage:
                 if files:
-                    # Stage specific files
-                    for file_path in files:
-                        rel_path = file_path.relative_to(self.project_root)
-                        self.repo.index.add([str(rel_path)])
+                    # Stage specific files in a single index write
+                    rel_paths = [str(file_path.relative_to(self.project_root)) for file_path in files]
+                    self.repo.index.add(rel_paths)
                 else:
-                    # Stage all changes
-                    self.repo.index.add(self.repo.untracked_files)
-                    self.repo.index.add([item.a_path for item in self.repo.index.diff(None)])
-
-            # Generate commit message if not provided
-            if not message:
-                changed = self.get_changed_files()
-                message = self.generate_commit_message(changed)
+                    # Stage all changes in a single index write
+                    modified = [item.a_path for item in self.repo.index.diff(None)]
+                    self.repo.index.add(self.repo.untracked_files + modified)
 
-            # Check if there are changes to commit
-            if not self.repo.is_dirty() and not self.repo.untracked_files:
+            # Check if there are staged changes to commit (index vs HEAD)
+            staged = self._get_staged_paths()
+            if not staged:
                 self.logger.debug("No changes to commit")
                 return None
 
+            # Generate commit message if not provided
+            if not message:
+                message = self.generate_commit_message([self.project_root / path for path in staged])
+
             # Create commit
             commit = self.repo.index.commit(message)
             self.logger.info(f"Created commit: {commit.hexsha[:8]} - {message}")
@@ -206,6 +266,17 @@ class GitOperations:
         except Exception as e:
             raise FileOperationError(f"Failed to commit changes: {e}") from e
 
+    def _get_staged_paths(self) -> list[str]:
+        """Get paths whose staged content differs from HEAD.
+
+        Returns:
+            Repository-relative paths of staged changes.
+        """
+        if not self.repo.head.is_valid():
+            # No commits yet: everything in the index is new
+            return [path for path, _stage in self.repo.index.entries]
+        return [item.a_path or item.b_path for item in self.repo.index.diff("HEAD")]
+
     def rollback_to_commit(self, commit_hash: str) -> None:
         """Rollback to a specific commit.
 
@@ -238,18 +309,31 @@ class GitOperations:
             return []
 
         try:
-            commits = []
-            for commit in self.repo.iter_commits(max_count=limit):
-                commits.append({
-                    "hash": commit.hexsha,
-                    "message": commit.message.strip(),
-                    "author": commit.author.name,
-                    "date": commit.committed_datetime.isoformat(),
-                })
-            return commits
+            return [self._commit_info(commit) for commit in self.repo.iter_commits(max_count=limit)]
         except Exception:
             return []
 
+    def iter_recent_commits(self, limit: int = 10) -> Iterator[dict[str, str]]:
+        """Lazily iterate over recent commit history.
+
+        Commits are read from the object database only as the caller
+        consumes them, so breaking out early avoids parsing the rest.
+
+        Args:
+            limit: Maximum number of commits to yield.
+
+        Yields:
+            Commit dictionaries with hash, message, author, and date.
+        """
+        if not self.repo:
+            return
+
+        try:
+            for commit in self.repo.iter_commits(max_count=limit):
+                yield self._commit_info(commit)
+        except Exception:
+            return
+
     def get_file_history(self, file_path: Path, limit: int = 10) -> list[dict[str, str]]:
         """Get commit history for a specific file.
 
@@ -265,15 +349,27 @@ class GitOperations:
 
         try:
             rel_path = file_path.relative_to(self.project_root)
-            commits = []
-            for commit in self.repo.iter_commits(paths=str(rel_path), max_count=limit):
-                commits.append({
-                    "hash": commit.hexsha,
-                    "message": commit.message.strip(),
-                    "author": commit.author.name,
-                    "date": commit.committed_datetime.isoformat(),
-                })
-            return commits
+            return [
+                self._commit_info(commit)
+                for commit in self.repo.iter_commits(paths=str(rel_path), max_count=limit)
+            ]
         except Exception:
             return []
 
+    @staticmethod
+    def _commit_info(commit: Any) -> dict[str, str]:
+        """Convert a GitPython commit into a plain dictionary.
+
+        Args:
+            commit: GitPython commit object.
+
+        Returns:
+            Commit dictionary with hash, message, author, and date.
+        """
+        return {
+            "hash": commit.hexsha,
+            "message": commit.message.strip(),
+            "author": commit.author.name,
+            "date": commit.committed_datetime.isoformat(),
+        }
+
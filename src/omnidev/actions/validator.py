@@ -6,17 +6,182 @@ to ensure code quality before applying changes.
 """
 
 import ast
+import hashlib
 import importlib.util
+import os
+import re
+import sys
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from omnidev.core.exceptions import ValidationError
 from omnidev.core.logger import get_logger
 
+# Every byte value except the six bracket characters, for bytes.translate(delete=...)
+_NON_BRACKET_BYTES = bytes(b for b in range(256) if b not in b"()[]{}")
+
+# Opening bracket bytes, and the opener each closing bracket byte must match
+_BRACKET_OPENERS = frozenset(b"([{")
+_BRACKET_MATCH = {ord(")"): ord("("), ord("]"): ord("["), ord("}"): ord("{")}
+
+# Pair-cancelling passes before falling back to the stack scan (bounds deep-nesting cost)
+_MAX_BRACKET_REDUCTIONS = 32
+
+# Statement nodes whose bodies can contain import statements
+_BLOCK_TYPES: frozenset[type] = frozenset(
+    node_type
+    for node_type in (
+        ast.Module,
+        ast.FunctionDef,
+        ast.AsyncFunctionDef,
+        ast.ClassDef,
+        ast.If,
+        ast.For,
+        ast.AsyncFor,
+        ast.While,
+        ast.With,
+        ast.AsyncWith,
+        ast.Try,
+        getattr(ast, "TryStar", None),
+        ast.ExceptHandler,
+        ast.Match,
+        ast.match_case,
+    )
+    if node_type is not None
+)
+
+# Node types worth visiting when looking for imports
+_IMPORT_SCOPE_TYPES = _BLOCK_TYPES | {ast.Import, ast.ImportFrom}
+
+# Every import statement contains this keyword, so sources without it have no imports.
+# Matched anywhere (not just at line start) to also catch "if x: import y" and "a; import b".
+_IMPORT_KEYWORD_RE = re.compile(r"\bimport\b")
+
+# Top-level standard library modules, which always resolve without a find_spec call
+_STDLIB_MODULES = frozenset(sys.stdlib_module_names) | frozenset(sys.builtin_module_names)
+
+# Upper bound on threads used to resolve imports concurrently
+_MAX_IMPORT_WORKERS = 16
+
+# (module, project root) pairs known to resolve, shared by every CodeValidator
+_RESOLVED_IMPORTS: set[tuple[str, str]] = set()
+
+# Upper bound on remembered (module, project root) pairs
+_MAX_RESOLVED_IMPORTS = 8192
+
+# JavaScript/TypeScript extensions, checked with the basic bracket validator
+_JS_SUFFIXES = (".js", ".jsx", ".ts", ".tsx")
+
+# Extensions whose validation needs the full decoded content
+_CODE_SUFFIXES = (".py", *_JS_SUFFIXES)
+
+# Chunk size used when scanning files for non-whitespace content
+_SCAN_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_imports(tree: ast.AST) -> Iterator[ast.Import | ast.ImportFrom]:
+    """Yield import statements in source order without visiting expressions.
+
+    Only block statements are descended into, since imports can't appear
+    inside expressions.
+
+    Args:
+        tree: Parsed module tree.
+
+    Yields:
+        Import and ImportFrom nodes.
+    """
+    stack: list[ast.AST] = [tree]
+    while stack:
+        node = stack.pop()
+        if type(node) is ast.Import or type(node) is ast.ImportFrom:
+            yield node
+            continue
+        children = [
+            child for child in ast.iter_child_nodes(node) if type(child) in _IMPORT_SCOPE_TYPES
+        ]
+        # Reverse so the stack pops children in source order
+        stack.extend(reversed(children))
+
+
+def _iter_import_names(tree: ast.AST) -> Iterator[str]:
+    """Yield imported module names in source order.
+
+    Args:
+        tree: Parsed module tree.
+
+    Yields:
+        Module names from ``import x`` and ``from x import y`` statements.
+    """
+    for node in _iter_imports(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield alias.name
+        elif node.module:
+            yield node.module
+
+
+def _is_nonblank_file(file_path: Path) -> bool:
+    """Check whether a file contains any non-whitespace byte.
+
+    Reads in chunks and stops at the first non-whitespace byte, so large
+    files are usually decided after the first chunk.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        True if the file has non-whitespace content, False otherwise.
+    """
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_SCAN_CHUNK_SIZE), b""):
+            if chunk.strip():
+                return True
+    return False
+
+
+def _can_import_cached(module_name: str, project_root_str: str) -> bool:
+    """Check if a module can be imported from the environment or the project.
+
+    Arguments are plain strings so results are shared by every
+    ``CodeValidator`` in the process. Only successful lookups are remembered:
+    a module the agent creates later in the session must still be found, so
+    misses are always checked again. Clear ``_RESOLVED_IMPORTS`` to forget
+    them (e.g. between tests).
+
+    Args:
+        module_name: Fully qualified module name.
+        project_root_str: Resolved project root, used for the local-file probe.
+
+    Returns:
+        True if module can be imported, False otherwise.
+    """
+    key = (module_name, project_root_str)
+    if key in _RESOLVED_IMPORTS:
+        return True
+
+    try:
+        # Try to find the module (find_spec walks sys.path and stats the filesystem)
+        found = importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError, ModuleNotFoundError):
+        # Also check if it's a local file
+        module_path = os.path.join(project_root_str, module_name.replace(".", os.sep))
+        found = os.path.exists(module_path) or os.path.exists(module_path + ".py")
+
+    if found and len(_RESOLVED_IMPORTS) < _MAX_RESOLVED_IMPORTS:
+        _RESOLVED_IMPORTS.add(key)
+    return found
+
 
 class CodeValidator:
     """Validates code before writing to files."""
 
+    # Number of parsed syntax trees kept for reuse between validation steps
+    AST_CACHE_SIZE = 64
+
     def __init__(self, project_root: Path) -> None:
         """Initialize the code validator.
 
@@ -24,14 +189,65 @@ class CodeValidator:
             project_root: Root directory of the project.
         """
         self.project_root = project_root.resolve()
+        self._project_root_str = str(self.project_root)
         self.logger = get_logger("validator")
+        self._ast_cache: OrderedDict[bytes, ast.Module] = OrderedDict()
+
+    def _parse_cached(
+        self,
+        content: str,
+        file_path: Optional[Path] = None,
+        content_bytes: Optional[bytes] = None,
+    ) -> ast.Module:
+        """Parse Python source, reusing the tree if this content was parsed before.
+
+        Args:
+            content: Python code content.
+            file_path: Optional file path for error reporting.
+            content_bytes: Optional UTF-8 encoding of ``content``, used for
+                the cache key to avoid encoding it again.
+
+        Returns:
+            Parsed module tree.
 
-    def validate_python(self, content: str, file_path: Optional[Path] = None) -> bool:
+        Raises:
+            SyntaxError: If the code cannot be parsed.
+        """
+        source = content.encode("utf-8") if content_bytes is None else content_bytes
+        key = hashlib.blake2b(source, digest_size=16).digest()
+        tree = self._ast_cache.get(key)
+        if tree is not None:
+            self._ast_cache.move_to_end(key)
+            return tree
+
+        # Call compile directly: no type comments, no inherited __future__ flags.
+        # The str is compiled, not the bytes: compiling bytes would apply any
+        # PEP 263 coding cookie to text that is already decoded.
+        tree = compile(
+            content,
+            str(file_path) if file_path else "<string>",
+            "exec",
+            flags=ast.PyCF_ONLY_AST,
+            dont_inherit=True,
+            optimize=0,
+        )
+        self._ast_cache[key] = tree
+        if len(self._ast_cache) > self.AST_CACHE_SIZE:
+            self._ast_cache.popitem(last=False)
+        return tree
+
+    def validate_python(
+        self,
+        content: str,
+        file_path: Optional[Path] = None,
+        content_bytes: Optional[bytes] = None,
+    ) -> bool:
         """Validate Python code syntax.
 
         Args:
             content: Python code content.
             file_path: Optional file path for error reporting.
+            content_bytes: Optional UTF-8 encoding of ``content``.
 
         Returns:
             True if valid, False otherwise.
@@ -40,7 +256,7 @@ class CodeValidator:
             ValidationError: If code has syntax errors.
         """
         try:
-            ast.parse(content, filename=str(file_path) if file_path else "<string>")
+            self._parse_cached(content, file_path, content_bytes)
             return True
         except SyntaxError as e:
             error_msg = f"Python syntax error: {e.msg} at line {e.lineno}"
@@ -50,33 +266,58 @@ class CodeValidator:
         except Exception as e:
             raise ValidationError(f"Failed to validate Python code: {e}") from e
 
-    def validate_imports(self, content: str, file_path: Optional[Path] = None) -> list[str]:
+    def validate_imports(
+        self,
+        content: str,
+        file_path: Optional[Path] = None,
+        fast: bool = False,
+    ) -> list[str]:
         """Validate that imports can be resolved.
 
         Args:
             content: Code content to check.
             file_path: Optional file path for context.
+            fast: Stop at the first unresolved import and raise instead of
+                collecting all of them.
 
         Returns:
-            List of unresolved import names.
+            List of unresolved import names (always empty when ``fast`` is set).
 
         Raises:
-            ValidationError: If code cannot be parsed.
+            ValidationError: If code containing imports cannot be parsed, or
+                if ``fast`` is set and an import cannot be resolved.
         """
         try:
-            tree = ast.parse(content, filename=str(file_path) if file_path else "<string>")
-            unresolved: list[str] = []
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        if not self._can_import(alias.name):
-                            unresolved.append(alias.name)
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module and not self._can_import(node.module):
-                        unresolved.append(node.module)
-
-            return unresolved
+            if not _IMPORT_KEYWORD_RE.search(content):
+                # No import keyword anywhere, so there is nothing to resolve
+                return []
+
+            tree = self._parse_cached(content, file_path)
+
+            if fast:
+                # Resolve lazily in source order so the walk stops at the first failure
+                seen: set[str] = set()
+                for name in _iter_import_names(tree):
+                    if name in seen:
+                        continue
+                    seen.add(name)
+                    if not self._can_import(name):
+                        location = f" in {file_path}" if file_path else ""
+                        raise ValidationError(f"Unresolved import: {name}{location}")
+                return []
+
+            # Collect distinct module names (first-seen order) so each resolves once
+            names = dict.fromkeys(_iter_import_names(tree))
+
+            if len(names) <= 1:
+                return [name for name in names if not self._can_import(name)]
+
+            # find_spec mostly waits on filesystem stats, so resolve names concurrently
+            with ThreadPoolExecutor(max_workers=min(_MAX_IMPORT_WORKERS, len(names))) as executor:
+                resolved = executor.map(self._can_import, names)
+                return [name for name, ok in zip(names, resolved) if not ok]
+        except ValidationError:
+            raise
         except SyntaxError as e:
             raise ValidationError(f"Cannot validate imports - syntax error: {e}") from e
         except Exception as e:
@@ -91,23 +332,23 @@ class CodeValidator:
         Returns:
             True if module can be imported, False otherwise.
         """
-        try:
-            # Try to find the module
-            spec = importlib.util.find_spec(module_name)
-            return spec is not None
-        except (ImportError, ValueError, ModuleNotFoundError):
-            # Also check if it's a local file
-            module_path = self.project_root / module_name.replace(".", "/")
-            if module_path.exists() or (module_path.with_suffix(".py")).exists():
-                return True
-            return False
-
-    def validate_file(self, file_path: Path, content: Optional[str] = None) -> bool:
+        if module_name in _STDLIB_MODULES:
+            return True
+        return _can_import_cached(module_name, self._project_root_str)
+
+    def validate_file(
+        self,
+        file_path: Path,
+        content: Optional[str] = None,
+        content_bytes: Optional[bytes] = None,
+    ) -> bool:
         """Validate a file based on its extension.
 
         Args:
             file_path: Path to the file.
             content: Optional content. If None, reads from file.
+            content_bytes: Optional UTF-8 encoding of ``content``, passed
+                through so it isn't encoded again.
 
         Returns:
             True if valid, False otherwise.
@@ -115,54 +356,77 @@ class CodeValidator:
         Raises:
             ValidationError: If validation fails.
         """
+        # Validate based on file extension
+        suffix = file_path.suffix.lower()
+
         if content is None:
             if not file_path.exists():
                 raise ValidationError(f"File does not exist: {file_path}")
+            if suffix not in _CODE_SUFFIXES:
+                # Only emptiness is checked, so avoid reading the whole file
+                return _is_nonblank_file(file_path)
             content = file_path.read_text(encoding="utf-8")
 
-        # Validate based on file extension
-        suffix = file_path.suffix.lower()
-
         if suffix == ".py":
-            return self.validate_python(content, file_path)
-        elif suffix in (".js", ".jsx", ".ts", ".tsx"):
+            return self.validate_python(content, file_path, content_bytes)
+        elif suffix in _JS_SUFFIXES:
             # JavaScript/TypeScript validation would go here
             # For now, just check basic syntax
-            return self._validate_js_basic(content)
+            return self._validate_js_basic(content, content_bytes)
         else:
             # For other file types, just check that content is not empty
             return len(content.strip()) > 0
 
-    def _validate_js_basic(self, content: str) -> bool:
+    def _validate_js_basic(self, content: str, content_bytes: Optional[bytes] = None) -> bool:
         """Basic JavaScript/TypeScript validation.
 
         Args:
             content: Code content.
+            content_bytes: Optional UTF-8 encoding of ``content``.
 
         Returns:
             True if passes basic checks, False otherwise.
         """
-        # Basic checks: balanced braces, parentheses, brackets
-        stack: list[str] = []
-        pairs = {"(": ")", "[": "]", "{": "}"}
-
-        for char in content:
-            if char in pairs:
-                stack.append(char)
-            elif char in pairs.values():
-                if not stack or pairs[stack.pop()] != char:
-                    raise ValidationError("Unbalanced brackets, braces, or parentheses")
+        # Basic checks: balanced braces, parentheses, brackets.
+        # Strip every non-bracket byte in C first so the loop only sees brackets
+        # (multi-byte UTF-8 sequences never contain ASCII bracket bytes).
+        if content_bytes is None:
+            content_bytes = content.encode("utf-8", "surrogatepass")
+        brackets = content_bytes.translate(None, _NON_BRACKET_BYTES)
+
+        # Cancel innermost matched pairs with C-level replaces; each pass peels one
+        # nesting level, so typical code is fully reduced in a handful of passes.
+        for _ in range(_MAX_BRACKET_REDUCTIONS):
+            reduced = brackets.replace(b"()", b"").replace(b"[]", b"").replace(b"{}", b"")
+            if len(reduced) == len(brackets):
+                break
+            brackets = reduced
+
+        # Whatever is left (mismatches or unusually deep nesting) is checked exactly
+        stack: list[int] = []
+        for byte in brackets:
+            if byte in _BRACKET_OPENERS:
+                stack.append(byte)
+            elif not stack or stack.pop() != _BRACKET_MATCH[byte]:
+                raise ValidationError("Unbalanced brackets, braces, or parentheses")
         if stack:
             raise ValidationError("Unbalanced brackets, braces, or parentheses")
 
         return True
 
-    def pre_write_validation(self, file_path: Path, content: str) -> bool:
+    def pre_write_validation(
+        self,
+        file_path: Path,
+        content: str,
+        content_bytes: Optional[bytes] = None,
+    ) -> bool:
         """Validate content before writing to file.
 
         Args:
             file_path: Destination file path.
             content: Content to write.
+            content_bytes: Optional UTF-8 encoding of ``content``, for callers
+                that already hold the bytes they are about to write.
 
         Returns:
             True if validation passes.
@@ -175,5 +439,5 @@ class CodeValidator:
             raise ValidationError("Content cannot be empty")
 
         # Validate based on file type
-        return self.validate_file(file_path, content)
+        return self.validate_file(file_path, content, content_bytes)
 
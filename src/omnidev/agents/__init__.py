@@ -4,8 +4,39 @@ CrewAI agent system for OmniDev.
 Provides agent-based orchestration for all internal operations.
 """
 
-from omnidev.agents.base import BaseOmniDevAgent
-from omnidev.agents.manager import AgentManager
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from omnidev.agents.base import BaseOmniDevAgent
+    from omnidev.agents.manager import AgentManager
 
 __all__ = ["BaseOmniDevAgent", "AgentManager"]
 
+# Exported names and the submodules that define them. Importing them pulls in
+# CrewAI, so they are loaded on first access rather than with the package.
+_LAZY_EXPORTS = {
+    "BaseOmniDevAgent": "omnidev.agents.base",
+    "AgentManager": "omnidev.agents.manager",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported agent classes on first access (PEP 562).
+
+    Args:
+        name: Attribute name being looked up on the package.
+
+    Returns:
+        The requested class.
+
+    Raises:
+        AttributeError: If the name is not exported by this package.
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
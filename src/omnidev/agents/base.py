@@ -4,27 +4,104 @@ Base agent class for OmniDev agents.
 Extends CrewAI Agent with OmniDev-specific functionality.
 """
 
-from typing import Any, Optional
+import functools
+from typing import Any, ClassVar, Optional
 
 from crewai import Agent, LLM
+from pydantic import PrivateAttr
 
 from omnidev.core.config import ConfigManager
 from omnidev.models.providers.openrouter import OpenRouterProvider
 from omnidev.prompts.loader import PromptLoader
 
 
+@functools.lru_cache(maxsize=None)
+def _load_prompt_pair(prompt_name: str) -> tuple[str, str]:
+    """Load the shared base prompt and an agent-specific prompt once per process.
+
+    Args:
+        prompt_name: Agent prompt file name (without .txt).
+
+    Returns:
+        Tuple of (base agent prompt, agent-specific prompt).
+
+    Raises:
+        ConfigurationError: If a prompt file cannot be loaded.
+    """
+    prompt_loader = PromptLoader()
+    return prompt_loader.load("agents", "base_agent"), prompt_loader.load("agents", prompt_name)
+
+
+@functools.lru_cache(maxsize=64)
+def _combine_prompts(base_prompt: str, agent_prompt: str) -> str:
+    """Join the base and agent-specific prompts into one system prompt.
+
+    Args:
+        base_prompt: Shared base agent prompt.
+        agent_prompt: Agent-specific prompt.
+
+    Returns:
+        Combined system prompt, shared by every agent using the same pair.
+    """
+    return f"{base_prompt}\n\n{agent_prompt}"
+
+
+@functools.lru_cache(maxsize=64)
+def _enhance_backstory(backstory: str, system_prompt: str) -> str:
+    """Append the system prompt to an agent backstory.
+
+    Args:
+        backstory: Agent backstory.
+        system_prompt: Combined system prompt.
+
+    Returns:
+        Backstory followed by a System Guidelines section.
+    """
+    return f"{backstory}\n\n## System Guidelines\n{system_prompt}"
+
+
+@functools.lru_cache(maxsize=16)
+def _make_llm(model_name: str, base_url: str, api_key: str) -> LLM:
+    """Create (or reuse) a CrewAI LLM for a model and endpoint.
+
+    Agents in the same crew usually share a model, so they share one LLM.
+
+    Args:
+        model_name: LiteLLM model identifier.
+        base_url: API base URL.
+        api_key: API key for the endpoint.
+
+    Returns:
+        CrewAI LLM instance.
+    """
+    return LLM(model=model_name, base_url=base_url, api_key=api_key)
+
+
 class BaseOmniDevAgent(Agent):
     """Base agent class for all OmniDev agents.
 
     Extends CrewAI Agent with OpenRouter integration and OmniDev-specific utilities.
+    Subclasses describe themselves through the ``ROLE``, ``GOAL``, ``BACKSTORY``
+    and ``PROMPT_NAME`` class attributes, which are used when the matching
+    constructor arguments are omitted.
     """
 
+    ROLE: ClassVar[Optional[str]] = None
+    GOAL: ClassVar[Optional[str]] = None
+    BACKSTORY: ClassVar[Optional[str]] = None
+    PROMPT_NAME: ClassVar[Optional[str]] = None
+
+    _omnidev_config: Optional[ConfigManager] = PrivateAttr(default=None)
+    _omnidev_agent_model: Optional[str] = PrivateAttr(default=None)
+    _omnidev_system_prompt: Optional[str] = PrivateAttr(default=None)
+
     def __init__(
         self,
-        role: str,
-        goal: str,
-        backstory: str,
         config: ConfigManager,
+        *,
+        role: Optional[str] = None,
+        goal: Optional[str] = None,
+        backstory: Optional[str] = None,
         model: Optional[str] = None,
         prompt_name: Optional[str] = None,
         **kwargs: Any,
@@ -32,14 +109,21 @@ class BaseOmniDevAgent(Agent):
         """Initialize base OmniDev agent.
 
         Args:
-            role: Agent role description.
-            goal: Agent goal.
-            backstory: Agent backstory.
             config: ConfigManager instance.
+            role: Agent role description (defaults to the class ``ROLE``).
+            goal: Agent goal (defaults to the class ``GOAL``).
+            backstory: Agent backstory (defaults to the class ``BACKSTORY``).
             model: Optional model override (defaults to config agent_model).
-            prompt_name: Optional prompt file name (without .txt) to load.
+            prompt_name: Optional prompt file name (without .txt) to load
+                (defaults to the class ``PROMPT_NAME``).
             **kwargs: Additional CrewAI Agent parameters.
         """
+        cls = type(self)
+        role = role or cls.ROLE
+        goal = goal or cls.GOAL
+        backstory = backstory or cls.BACKSTORY
+        prompt_name = prompt_name or cls.PROMPT_NAME
+
         # Get OpenRouter API key
         api_key = config.get_api_key("openrouter")
         if not api_key:
@@ -52,13 +136,10 @@ class BaseOmniDevAgent(Agent):
         system_prompt = None
         if prompt_name:
             try:
-                prompt_loader = PromptLoader()
-                # Load base agent prompt
-                base_prompt = prompt_loader.load("agents", "base_agent")
-                # Load agent-specific prompt
-                agent_prompt = prompt_loader.load("agents", prompt_name)
+                # Load base and agent-specific prompts (cached per process)
+                base_prompt, agent_prompt = _load_prompt_pair(prompt_name)
                 # Combine prompts
-                system_prompt = f"{base_prompt}\n\n{agent_prompt}"
+                system_prompt = _combine_prompts(base_prompt, agent_prompt)
             except Exception as e:
                 # Log but don't fail - use default behavior
                 import logging
@@ -75,16 +156,12 @@ class BaseOmniDevAgent(Agent):
             # Format: openrouter/<provider>/<model> (e.g., openrouter/deepseek/deepseek-r1)
             model_name = f"openrouter/{agent_model}"
         
-        llm = LLM(
-            model=model_name,
-            base_url="https://openrouter.ai/api/v1",
-            api_key=api_key,
-        )
+        llm = _make_llm(model_name, OpenRouterProvider.BASE_URL, api_key)
         
         # Enhance backstory with system prompt if available
         enhanced_backstory = backstory
         if system_prompt:
-            enhanced_backstory = f"{backstory}\n\n## System Guidelines\n{system_prompt}"
+            enhanced_backstory = _enhance_backstory(backstory, system_prompt)
         
         # Initialize CrewAI Agent
         super().__init__(
@@ -97,20 +174,48 @@ class BaseOmniDevAgent(Agent):
             **kwargs,
         )
         
-        # Store metadata in a way compatible with Pydantic models
-        # Use object.__setattr__ to bypass Pydantic validation for metadata
-        object.__setattr__(self, "_omnidev_config", config)
-        object.__setattr__(self, "_omnidev_agent_model", agent_model)
-        object.__setattr__(self, "_omnidev_system_prompt", system_prompt)
-    
-    def __getattribute__(self, name: str) -> Any:
-        """Override to handle custom attributes before Pydantic intercepts."""
-        if name == "config":
-            return object.__getattribute__(self, "_omnidev_config")
-        elif name == "agent_model":
-            return object.__getattribute__(self, "_omnidev_agent_model")
-        elif name == "system_prompt":
-            return object.__getattribute__(self, "_omnidev_system_prompt")
-        # For all other attributes, use normal Pydantic behavior
-        return super().__getattribute__(name)
+        # Store metadata as Pydantic private attributes
+        self._omnidev_config = config
+        self._omnidev_agent_model = agent_model
+        self._omnidev_system_prompt = system_prompt
+
+    def _set_private(self, **values: Any) -> None:
+        """Set subclass-specific private attributes.
+
+        Each name must be declared on the subclass as a Pydantic ``PrivateAttr``
+        so the value lives in the model's private storage.
+
+        Args:
+            **values: Attribute names (``_omnidev_*``) and their values.
+
+        Raises:
+            AttributeError: If a name is not a declared private attribute.
+        """
+        for name, value in values.items():
+            if name not in self.__private_attributes__:
+                raise AttributeError(f"{type(self).__name__} has no private attribute {name!r}")
+            setattr(self, name, value)
+
+    @property
+    def omnidev_config(self) -> Optional[ConfigManager]:
+        """Get the OmniDev ConfigManager this agent was built from.
+
+        Named apart from CrewAI's own ``config`` field, which it must not shadow.
+        """
+        return self._omnidev_config
+
+    @omnidev_config.setter
+    def omnidev_config(self, config: ConfigManager) -> None:
+        """Replace the OmniDev ConfigManager for this agent."""
+        self._omnidev_config = config
+
+    @property
+    def agent_model(self) -> Optional[str]:
+        """Get the model this agent was configured with."""
+        return self._omnidev_agent_model
+
+    @property
+    def system_prompt(self) -> Optional[str]:
+        """Get the combined system prompt, if one was loaded."""
+        return self._omnidev_system_prompt
 
@@ -7,6 +7,8 @@ Handles intelligent context building and file selection.
 from pathlib import Path
 from typing import Any, Optional
 
+from pydantic import PrivateAttr
+
 from omnidev.agents.base import BaseOmniDevAgent
 from omnidev.context.manager import ContextManager
 from omnidev.core.config import ConfigManager
@@ -15,6 +17,16 @@ from omnidev.core.config import ConfigManager
 class ContextAgent(BaseOmniDevAgent):
     """Agent responsible for context management."""
 
+    ROLE = "Context Management Specialist"
+    GOAL = "Intelligently select and organize relevant files for AI context, optimize token usage, and ensure the most important information is included"
+    BACKSTORY = """You are an expert at understanding codebases and determining 
+            which files are most relevant to a given task. You excel at balancing 
+            context completeness with token efficiency, always including the most 
+            important files while staying within token limits."""
+    PROMPT_NAME = "context_agent"
+
+    _omnidev_context_manager: Optional[ContextManager] = PrivateAttr(default=None)
+
     def __init__(self, config: ConfigManager, context_manager: ContextManager) -> None:
         """Initialize context agent.
 
@@ -22,17 +34,10 @@ class ContextAgent(BaseOmniDevAgent):
             config: ConfigManager instance.
             context_manager: ContextManager instance.
         """
-        super().__init__(
-            role="Context Management Specialist",
-            goal="Intelligently select and organize relevant files for AI context, optimize token usage, and ensure the most important information is included",
-            backstory="""You are an expert at understanding codebases and determining 
-            which files are most relevant to a given task. You excel at balancing 
-            context completeness with token efficiency, always including the most 
-            important files while staying within token limits.""",
-            config=config,
-            prompt_name="context_agent",
+        super().__init__(config)
+        self._set_private(
+            _omnidev_context_manager=context_manager,
         )
-        object.__setattr__(self, "_omnidev_context_manager", context_manager)
     
     @property
     def context_manager(self) -> ContextManager:
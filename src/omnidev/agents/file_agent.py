@@ -7,6 +7,8 @@ Handles all file operations with intelligent decision-making using OpenRouter.
 from pathlib import Path
 from typing import Any, Optional
 
+from pydantic import PrivateAttr
+
 from omnidev.actions.file_ops import FileOperations
 from omnidev.agents.base import BaseOmniDevAgent
 from omnidev.core.config import ConfigManager
@@ -15,6 +17,17 @@ from omnidev.core.config import ConfigManager
 class FileProcessingAgent(BaseOmniDevAgent):
     """Agent responsible for file operations."""
 
+    ROLE = "File Operations Specialist"
+    GOAL = "Safely and intelligently handle all file operations including creation, reading, updating, and deletion with proper validation and backup coordination"
+    BACKSTORY = """You are an expert file system manager with deep understanding of 
+            software project structures. You always prioritize safety, validation, and 
+            maintainability when performing file operations. You coordinate with backup 
+            systems and ensure no critical files are accidentally modified or deleted."""
+    PROMPT_NAME = "file_agent"
+
+    _omnidev_file_ops: Optional[FileOperations] = PrivateAttr(default=None)
+    _omnidev_project_root: Optional[Path] = PrivateAttr(default=None)
+
     def __init__(self, config: ConfigManager, project_root: Path) -> None:
         """Initialize file processing agent.
 
@@ -22,18 +35,11 @@ class FileProcessingAgent(BaseOmniDevAgent):
             config: ConfigManager instance.
             project_root: Project root directory.
         """
-        super().__init__(
-            role="File Operations Specialist",
-            goal="Safely and intelligently handle all file operations including creation, reading, updating, and deletion with proper validation and backup coordination",
-            backstory="""You are an expert file system manager with deep understanding of 
-            software project structures. You always prioritize safety, validation, and 
-            maintainability when performing file operations. You coordinate with backup 
-            systems and ensure no critical files are accidentally modified or deleted.""",
-            config=config,
-            prompt_name="file_agent",
+        super().__init__(config)
+        self._set_private(
+            _omnidev_file_ops=FileOperations(project_root),
+            _omnidev_project_root=project_root,
         )
-        object.__setattr__(self, "_omnidev_file_ops", FileOperations(project_root))
-        object.__setattr__(self, "_omnidev_project_root", project_root)
     
     @property
     def file_ops(self) -> FileOperations:
@@ -4,6 +4,7 @@ Agent Manager for OmniDev.
 Manages agent lifecycle, orchestration, and resource pooling.
 """
 
+from collections.abc import Callable
 from typing import Any, Optional
 
 from omnidev.core.config import ConfigManager
@@ -22,6 +23,8 @@ class AgentManager:
         self.config = config
         self.agents: dict[str, Any] = {}
         self.crews: dict[str, Any] = {}
+        # Crews built on first use by get_crew
+        self._crew_factories: dict[str, Callable[[], Any]] = {}
 
     def get_agent(self, agent_name: str) -> Optional[Any]:
         """Get an agent by name.
@@ -52,6 +55,16 @@ class AgentManager:
         """
         self.crews[name] = crew
 
+    def register_crew_factory(self, name: str, factory: Callable[[], Any]) -> None:
+        """Register a crew that is only built when it is first needed.
+
+        Args:
+            name: Crew name.
+            factory: Callable returning the crew instance.
+        """
+        self.crews.pop(name, None)
+        self._crew_factories[name] = factory
+
     def get_crew(self, crew_name: str) -> Optional[Any]:
         """Get a crew by name.
 
@@ -61,7 +74,10 @@ class AgentManager:
         Returns:
             Crew instance if found, None otherwise.
         """
-        return self.crews.get(crew_name)
+        crew = self.crews.get(crew_name)
+        if crew is None and crew_name in self._crew_factories:
+            crew = self.crews[crew_name] = self._crew_factories.pop(crew_name)()
+        return crew
 
     async def execute_crew(self, crew_name: str, task: str, **kwargs: Any) -> Any:
         """Execute a crew with a task.
@@ -86,4 +102,3 @@ class AgentManager:
             return result
         except Exception as e:
             raise OmniDevError(f"Crew execution failed: {e}") from e
-
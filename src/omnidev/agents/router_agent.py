@@ -6,6 +6,8 @@ Handles model selection and task routing.
 
 from typing import Any, Optional
 
+from pydantic import PrivateAttr
+
 from omnidev.agents.base import BaseOmniDevAgent
 from omnidev.core.config import ConfigManager
 from omnidev.models.registry import ProviderRegistry
@@ -14,6 +16,16 @@ from omnidev.models.registry import ProviderRegistry
 class RouterAgent(BaseOmniDevAgent):
     """Agent responsible for model selection and routing."""
 
+    ROLE = "Model Selection and Routing Specialist"
+    GOAL = "Select the optimal AI model for each task based on complexity, cost, availability, and task requirements"
+    BACKSTORY = """You are an expert at analyzing tasks and matching them with 
+            the most appropriate AI models. You understand model capabilities, costs, 
+            and performance characteristics. You always optimize for both quality and 
+            cost-effectiveness."""
+    PROMPT_NAME = "router_agent"
+
+    _omnidev_provider_registry: Optional[ProviderRegistry] = PrivateAttr(default=None)
+
     def __init__(self, config: ConfigManager, provider_registry: ProviderRegistry) -> None:
         """Initialize router agent.
 
@@ -21,17 +33,10 @@ class RouterAgent(BaseOmniDevAgent):
             config: ConfigManager instance.
             provider_registry: ProviderRegistry instance.
         """
-        super().__init__(
-            role="Model Selection and Routing Specialist",
-            goal="Select the optimal AI model for each task based on complexity, cost, availability, and task requirements",
-            backstory="""You are an expert at analyzing tasks and matching them with 
-            the most appropriate AI models. You understand model capabilities, costs, 
-            and performance characteristics. You always optimize for both quality and 
-            cost-effectiveness.""",
-            config=config,
-            prompt_name="router_agent",
+        super().__init__(config)
+        self._set_private(
+            _omnidev_provider_registry=provider_registry,
         )
-        object.__setattr__(self, "_omnidev_provider_registry", provider_registry)
     
     @property
     def provider_registry(self) -> ProviderRegistry:
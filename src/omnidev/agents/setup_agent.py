@@ -14,23 +14,21 @@ from omnidev.core.config import ConfigManager
 class SetupAgent(BaseOmniDevAgent):
     """Agent responsible for setup and configuration."""
 
+    ROLE = "Setup and Configuration Specialist"
+    GOAL = "Guide users through initial setup, configure API keys, validate settings, and ensure OmniDev is properly configured for optimal use"
+    BACKSTORY = """You are a helpful onboarding specialist who makes setup processes 
+            smooth and intuitive. You understand the importance of proper configuration 
+            and guide users step-by-step through the setup wizard. You validate all 
+            inputs and provide clear feedback."""
+    PROMPT_NAME = "setup_agent"
+
     def __init__(self, config: ConfigManager) -> None:
         """Initialize setup agent.
 
         Args:
             config: ConfigManager instance.
         """
-        super().__init__(
-            role="Setup and Configuration Specialist",
-            goal="Guide users through initial setup, configure API keys, validate settings, and ensure OmniDev is properly configured for optimal use",
-            backstory="""You are a helpful onboarding specialist who makes setup processes 
-            smooth and intuitive. You understand the importance of proper configuration 
-            and guide users step-by-step through the setup wizard. You validate all 
-            inputs and provide clear feedback.""",
-            config=config,
-            prompt_name="setup_agent",
-        )
-        # Config is already stored in BaseOmniDevAgent, no need to set again
+        super().__init__(config)
 
     def run_setup_wizard(self) -> dict[str, Any]:
         """Run the setup wizard.
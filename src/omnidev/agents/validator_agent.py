@@ -7,6 +7,8 @@ Handles code validation and quality checks.
 from typing import Any, Optional
 from pathlib import Path
 
+from pydantic import PrivateAttr
+
 from omnidev.actions.validator import CodeValidator
 from omnidev.agents.base import BaseOmniDevAgent
 from omnidev.core.config import ConfigManager
@@ -15,6 +17,17 @@ from omnidev.core.config import ConfigManager
 class ValidatorAgent(BaseOmniDevAgent):
     """Agent responsible for code validation."""
 
+    ROLE = "Code Quality and Validation Specialist"
+    GOAL = "Validate code for syntax errors, import issues, and quality problems, providing actionable feedback for improvements"
+    BACKSTORY = """You are a meticulous code reviewer with deep knowledge of 
+            programming languages, best practices, and common pitfalls. You catch 
+            errors before they cause problems and provide clear, helpful feedback 
+            for code improvements."""
+    PROMPT_NAME = "validator_agent"
+
+    _omnidev_validator: Optional[CodeValidator] = PrivateAttr(default=None)
+    _omnidev_project_root: Optional[Path] = PrivateAttr(default=None)
+
     def __init__(self, config: ConfigManager, project_root: Path) -> None:
         """Initialize validator agent.
 
@@ -22,18 +35,11 @@ class ValidatorAgent(BaseOmniDevAgent):
             config: ConfigManager instance.
             project_root: Project root directory.
         """
-        super().__init__(
-            role="Code Quality and Validation Specialist",
-            goal="Validate code for syntax errors, import issues, and quality problems, providing actionable feedback for improvements",
-            backstory="""You are a meticulous code reviewer with deep knowledge of 
-            programming languages, best practices, and common pitfalls. You catch 
-            errors before they cause problems and provide clear, helpful feedback 
-            for code improvements.""",
-            config=config,
-            prompt_name="validator_agent",
+        super().__init__(config)
+        self._set_private(
+            _omnidev_validator=CodeValidator(project_root),
+            _omnidev_project_root=project_root,
         )
-        object.__setattr__(self, "_omnidev_validator", CodeValidator(project_root))
-        object.__setattr__(self, "_omnidev_project_root", project_root)
     
     @property
     def validator(self) -> CodeValidator:
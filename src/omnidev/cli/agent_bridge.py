@@ -4,6 +4,7 @@ CLI-Agent bridge for routing commands to agents.
 Bridges between CLI commands and CrewAI agent system.
 """
 
+import re
 from pathlib import Path
 from typing import Any, Optional
 
@@ -14,10 +15,27 @@ from omnidev.core.config import ConfigManager
 from omnidev.core.exceptions import OmniDevError
 from omnidev.models.registry import ProviderRegistry
 
+# Keywords that route a query to the file operations crew
+_FILE_KEYWORDS = frozenset(("create", "delete", "edit", "update", "write", "file", "remove"))
+
+# All keywords as one case-insensitive alternation, so a query is scanned once in C
+# and no lowercased copy of it is made
+_FILE_KEYWORD_RE = re.compile("|".join(map(re.escape, sorted(_FILE_KEYWORDS))), re.IGNORECASE)
+
+# Characters every keyword contains, in both cases. A query holding none of them
+# cannot match, which str's fast substring search decides before the regex runs.
+_FILE_KEYWORD_REQUIRED = tuple(
+    variant
+    for char in sorted(set.intersection(*(set(keyword) for keyword in _FILE_KEYWORDS)))
+    for variant in (char, char.upper())
+)
+
 
 class CLIAgentBridge:
     """Bridge between CLI and agent system."""
 
+    __slots__ = ("config", "project_root", "agent_manager", "crews_manager")
+
     def __init__(
         self,
         config: ConfigManager,
@@ -40,12 +58,12 @@ class CLIAgentBridge:
             config, project_root, context_manager, provider_registry
         )
         
-        # Register crews
-        self.agent_manager.register_crew(
-            "code_generation", self.crews_manager.create_code_generation_crew()
+        # Register crews; each is built on its first query rather than at startup
+        self.agent_manager.register_crew_factory(
+            "code_generation", self.crews_manager.create_code_generation_crew
         )
-        self.agent_manager.register_crew(
-            "file_operations", self.crews_manager.create_file_operation_crew()
+        self.agent_manager.register_crew_factory(
+            "file_operations", self.crews_manager.create_file_operation_crew
         )
 
     async def execute_query(self, query: str, mode: str = "auto") -> dict[str, Any]:
@@ -60,30 +78,50 @@ class CLIAgentBridge:
         """
         try:
             # Route to appropriate crew based on query type
-            if self._is_file_operation(query):
-                crew_name = "file_operations"
-            else:
-                crew_name = "code_generation"
-            
+            crew_name = self._crew_for(query)
+
             result = await self.agent_manager.execute_crew(crew_name, query)
-            
             return {
                 "success": True,
-                "response": str(result),
+                # Crew outputs render themselves; plain strings are used as-is
+                "response": result if isinstance(result, str) else str(result),
                 "crew": crew_name,
             }
-        except OmniDevError as e:
-            return {
-                "success": False,
-                "error": e.message,
-                "response": f"Error: {e.message}",
-            }
         except Exception as e:
+            return self._error_response(e)
+
+    def _crew_for(self, query: str) -> str:
+        """Get the name of the crew a query routes to.
+
+        Args:
+            query: User query.
+
+        Returns:
+            Crew name.
+        """
+        return "file_operations" if self._is_file_operation(query) else "code_generation"
+
+    @staticmethod
+    def _error_response(error: Exception) -> dict[str, Any]:
+        """Build the response for a failed query.
+
+        Args:
+            error: Exception raised while executing the query.
+
+        Returns:
+            Execution result dictionary describing the failure.
+        """
+        if isinstance(error, OmniDevError):
             return {
                 "success": False,
-                "error": str(e),
-                "response": f"Unexpected error: {e}",
+                "error": error.message,
+                "response": f"Error: {error.message}",
             }
+        return {
+            "success": False,
+            "error": str(error),
+            "response": f"Unexpected error: {error}",
+        }
 
     def _is_file_operation(self, query: str) -> bool:
         """Check if query is a file operation.
@@ -94,7 +132,7 @@ class CLIAgentBridge:
         Returns:
             True if query appears to be a file operation.
         """
-        file_keywords = ["create", "delete", "edit", "update", "write", "file", "remove"]
-        query_lower = query.lower()
-        return any(keyword in query_lower for keyword in file_keywords)
+        if _FILE_KEYWORD_REQUIRED and not any(char in query for char in _FILE_KEYWORD_REQUIRED):
+            return False
+        return _FILE_KEYWORD_RE.search(query) is not None
 
@@ -2,52 +2,161 @@
 CLI commands package for OmniDev.
 
 This package contains command handlers and utilities.
+
+Heavy dependencies (CrewAI via the agent bridge, the modes, providers and the
+setup wizard) are imported where they are used, so commands such as
+``omnidev version`` or ``omnidev config list-keys`` start without loading them.
 """
 
 import asyncio
+import importlib
+from collections.abc import Coroutine, Mapping
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
 import click
 
-from omnidev.actions.backup import BackupManager
-from omnidev.actions.file_ops import FileOperations
-from omnidev.actions.git_ops import GitOperations
-from omnidev.cli.agent_bridge import CLIAgentBridge
-from omnidev.cli.commands.slash import SlashCommandRegistry
-from omnidev.cli.setup_wizard import SetupWizard
-from omnidev.cli.ui.components import ActionBlock, Logo, ResponseHeader, TipsPanel
-from rich.console import Console
-from omnidev.context.manager import ContextManager
-from omnidev.core.config import ConfigManager, ProjectConfig
-from omnidev.core.exceptions import ConfigurationError, OmniDevError
-from omnidev.core.logger import LoggerManager, get_logger
-from omnidev.core.session import SessionManager
-from omnidev.modes.agent import AgentMode
-from omnidev.modes.auto_select import AutoSelectMode
-from omnidev.modes.manual import ManualMode
-from omnidev.modes.planning import PlanningMode
-from omnidev.models.registry import ProviderRegistry
-from omnidev.models.router import ModelRouter
+from omnidev.core.exceptions import OmniDevError
+
+if TYPE_CHECKING:
+    from omnidev.core.config import ConfigManager
+
+T = TypeVar("T")
+
+# Mode name -> (module, class); classes are imported the first time a mode is used
+_MODE_CLASSES: Mapping[str, tuple[str, str]] = MappingProxyType(
+    {
+        "agent": ("omnidev.modes.agent", "AgentMode"),
+        "planning": ("omnidev.modes.planning", "PlanningMode"),
+        "auto": ("omnidev.modes.auto_select", "AutoSelectMode"),
+        "manual": ("omnidev.modes.manual", "ManualMode"),
+    }
+)
+
+# CLI components every mode is constructed with
+_MODE_REQUIREMENTS = ("config", "session_manager", "context_manager", "model_router")
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, using uvloop when it is installed.
+
+    Returns:
+        New event loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel the tasks still pending on a loop and wait for them to finish.
+
+    Mirrors the cleanup ``asyncio.run`` performs before closing its loop.
+
+    Args:
+        loop: Event loop whose tasks should be cancelled.
+    """
+    to_cancel = asyncio.all_tasks(loop)
+    if not to_cancel:
+        return
+
+    for task in to_cancel:
+        task.cancel()
+
+    loop.run_until_complete(asyncio.gather(*to_cancel, return_exceptions=True))
+
+    for task in to_cancel:
+        if task.cancelled():
+            continue
+        if task.exception() is not None:
+            loop.call_exception_handler(
+                {
+                    "message": "unhandled exception during _run_async() shutdown",
+                    "exception": task.exception(),
+                    "task": task,
+                }
+            )
+
+
+def _run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a fresh event loop.
+
+    Like ``asyncio.run``, including its shutdown sequence (pending tasks are
+    cancelled, async generators closed and the default executor joined), but
+    lets the loop come from ``_new_event_loop``.
+
+    Args:
+        coro: Coroutine to run.
+
+    Returns:
+        The coroutine's result.
+    """
+    loop = _new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            _cancel_all_tasks(loop)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
 
 
 class OmniDevCLI:
     """Main CLI application class."""
 
-    def __init__(self, project_root: Optional[Path] = None) -> None:
+    __slots__ = (
+        "project_root",
+        "logger_manager",
+        "logger",
+        "config",
+        "session_manager",
+        "context_manager",
+        "provider_registry",
+        "model_router",
+        "agent_bridge",
+        "slash_registry",
+        "_mode_cache",
+    )
+
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        config: Optional["ConfigManager"] = None,
+    ) -> None:
         """Initialize the CLI.
 
         Args:
             project_root: Optional project root directory.
+            config: Optional already-loaded ConfigManager to reuse.
         """
+        from omnidev.cli.agent_bridge import CLIAgentBridge
+        from omnidev.cli.commands.slash import SlashCommandRegistry
+        from omnidev.context.manager import ContextManager
+        from omnidev.core.config import ConfigManager
+        from omnidev.core.logger import LoggerManager, get_logger
+        from omnidev.core.session import SessionManager
+        from omnidev.models.registry import ProviderRegistry
+        from omnidev.models.router import ModelRouter
+
         self.project_root = (project_root or Path.cwd()).resolve()
         self.logger_manager = LoggerManager()
         self.logger = get_logger("cli")
+        # Mode instances keyed by lowercased name; modes hold no per-query state
+        self._mode_cache: dict[str, object] = {}
 
         # Initialize core components
         try:
-            self.config = ConfigManager(self.project_root)
-            self.config.load()
+            if config is None:
+                config = ConfigManager(self.project_root)
+                config.load()
+            self.config = config
 
             self.session_manager = SessionManager(self.project_root, self.config)
             self.session_manager.create_session()
@@ -108,30 +217,34 @@ class OmniDevCLI:
             mode_name: Mode name (agent, planning, auto, manual).
 
         Returns:
-            Mode instance if found, None otherwise.
+            Mode instance if found, None if the name is unknown or the CLI
+            components a mode needs are missing. Errors raised by the mode
+            constructor itself propagate.
         """
-        modes = {
-            "agent": AgentMode,
-            "planning": PlanningMode,
-            "auto": AutoSelectMode,
-            "manual": ManualMode,
-        }
-
-        mode_class = modes.get(mode_name.lower())
-        if not mode_class:
-            return None
+        key = mode_name.lower()
+        mode = self._mode_cache.get(key)
+        if mode is not None:
+            return mode
 
-        try:
-            return mode_class(
-                self.project_root,
-                self.config,
-                self.session_manager,
-                self.context_manager,
-                self.model_router,
-            )
-        except Exception as e:
-            self.logger.error(f"Failed to create mode {mode_name}: {e}")
+        mode_path = _MODE_CLASSES.get(key)
+        if not mode_path:
             return None
+        missing = [name for name in _MODE_REQUIREMENTS if getattr(self, name, None) is None]
+        if missing:
+            self.logger.error(f"Cannot create mode {mode_name}: missing {', '.join(missing)}")
+            return None
+
+        module_name, class_name = mode_path
+        mode_class = getattr(importlib.import_module(module_name), class_name)
+        mode = mode_class(
+            self.project_root,
+            self.config,
+            self.session_manager,
+            self.context_manager,
+            self.model_router,
+        )
+        self._mode_cache[key] = mode
+        return mode
 
     async def execute_query(self, query: str, mode: str = "auto", use_agents: bool = True) -> dict:
         """Execute a query in the specified mode.
@@ -189,6 +302,10 @@ def run_command(
     Execute a query or start interactive mode.
     """
     from omnidev.cli.repl import OmniDevREPL
+    from omnidev.cli.setup_wizard import SetupWizard
+    from omnidev.cli.ui.components import ActionBlock, Logo, ResponseHeader, TipsPanel
+    from omnidev.cli.ui.console import console
+    from omnidev.core.config import ConfigManager
     
     try:
         # Show logo with tagline for startup
@@ -202,7 +319,6 @@ def run_command(
         configured_provider = config.get_config().models.fallback
         if not configured_provider:
             # No provider configured - run setup wizard
-            console = Console()
             console.print("[yellow]No provider configured. Starting setup wizard...[/yellow]\n")
             wizard = SetupWizard(config, project_root or Path.cwd())
             setup_result = wizard.run()
@@ -223,7 +339,7 @@ def run_command(
                 model = setup_result.get("model")
         
         # Initialize CLI with project root
-        cli = OmniDevCLI(project_root)
+        cli = OmniDevCLI(project_root, config=config)
         
         # Use default mode if not specified
         if not mode:
@@ -249,7 +365,7 @@ def run_command(
                 execute_callback=execute_callback,
                 provider_registry=cli.provider_registry,
             )
-            asyncio.run(repl.run())
+            _run_async(repl.run())
             return
 
         # Execute single query
@@ -270,7 +386,7 @@ def run_command(
             
             # Execute query with agents
             with cli.logger_manager:
-                result = asyncio.run(cli.execute_query(query, mode, use_agents=True))
+                result = _run_async(cli.execute_query(query, mode, use_agents=True))
                 
                 # Show action block
                 if result.get("success"):
@@ -283,6 +399,9 @@ def run_command(
                     ErrorPanel(Exception(result.get("error", "Unknown error"))).render()
     except KeyboardInterrupt:
         click.echo("\nInterrupted by user", err=True)
+    except click.Abort:
+        # Cancelled prompts (e.g. in the setup wizard) already explained themselves
+        raise
     except Exception as e:
         from omnidev.cli.ui.components import ErrorPanel
         ErrorPanel(e).render()
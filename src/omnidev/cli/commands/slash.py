@@ -5,19 +5,36 @@ Handles slash commands like /help, /exit, /config, etc.
 Works in both interactive and command-line modes.
 """
 
+import bisect
+from collections.abc import Sequence
+from operator import attrgetter
 from typing import Any, Callable, Optional
 
-from rich.console import Console
 from rich.table import Table
 
 from omnidev.cli.ui.components import StatusBar
+from omnidev.cli.ui.console import console
 
-console = Console()
+# Sort key for the canonical command list
+_COMMAND_NAME = attrgetter("name")
+
+# Shared argument tuple for commands invoked without arguments
+_NO_ARGS: tuple[str, ...] = ()
+
+# Built-in commands: (name, registry handler attribute, description, usage, aliases)
+_DEFAULT_COMMANDS: tuple[tuple[str, str, str, Optional[str], tuple[str, ...]], ...] = (
+    ("help", "_help_handler", "Show all available commands", "/help [command]", ()),
+    ("exit", "_exit_handler", "Exit interactive mode", None, ("quit",)),
+    ("clear", "_clear_handler", "Clear the screen", None, ()),
+    ("status", "_status_handler", "Show current status", None, ()),
+)
 
 
 class SlashCommand:
     """Represents a slash command."""
 
+    __slots__ = ("name", "handler", "description", "usage", "aliases")
+
     def __init__(
         self,
         name: str,
@@ -45,9 +62,18 @@ class SlashCommand:
 class SlashCommandRegistry:
     """Registry for slash commands."""
 
+    __slots__ = ("commands", "_canonical", "_sorted_names", "_help_table_cache", "_help_per_cmd")
+
     def __init__(self) -> None:
         """Initialize command registry."""
         self.commands: dict[str, SlashCommand] = {}
+        # Each command once, sorted by name (aliases only live in self.commands)
+        self._canonical: list[SlashCommand] = []
+        # Command names and aliases kept sorted, so prefix completion is a bisection
+        self._sorted_names: list[str] = []
+        # Help tables built on first use; the command set rarely changes
+        self._help_table_cache: Optional[Table] = None
+        self._help_per_cmd: dict[str, Table] = {}
         self._register_default_commands()
 
     def register(self, command: SlashCommand) -> None:
@@ -56,10 +82,22 @@ class SlashCommandRegistry:
         Args:
             command: SlashCommand instance.
         """
-        self.commands[command.name] = command
-        # Register aliases
-        for alias in command.aliases:
-            self.commands[alias] = command
+        previous = self.commands.get(command.name)
+        if previous is not None and previous.name == command.name:
+            # Re-registering a command replaces it in place
+            self._canonical[self._canonical.index(previous)] = command
+        else:
+            bisect.insort(self._canonical, command, key=_COMMAND_NAME)
+
+        # Register the name and aliases
+        for name in (command.name, *command.aliases):
+            if name not in self.commands:
+                bisect.insort(self._sorted_names, name)
+            self.commands[name] = command
+
+        # Cached help tables may describe the previous command set
+        self._help_table_cache = None
+        self._help_per_cmd.clear()
 
     def get(self, name: str) -> Optional[SlashCommand]:
         """Get a command by name.
@@ -78,58 +116,36 @@ class SlashCommandRegistry:
         """List all registered commands.
 
         Returns:
-            List of SlashCommand instances.
+            List of SlashCommand instances, sorted by name.
+        """
+        return list(self._canonical)
+
+    def complete(self, prefix: str) -> list[str]:
+        """Complete a partial command name.
+
+        Args:
+            prefix: Partial command name (with or without slash).
+
+        Returns:
+            Sorted command names and aliases starting with the prefix.
         """
-        # Return unique commands (avoid duplicates from aliases)
-        seen = set()
-        commands = []
-        for cmd in self.commands.values():
-            if cmd.name not in seen:
-                seen.add(cmd.name)
-                commands.append(cmd)
-        return commands
+        prefix = prefix.lstrip("/")
+        start = bisect.bisect_left(self._sorted_names, prefix)
+        matches = []
+        for name in self._sorted_names[start:]:
+            if not name.startswith(prefix):
+                break
+            matches.append(name)
+        return matches
 
     def _register_default_commands(self) -> None:
         """Register default slash commands."""
-        # Help command
-        self.register(
-            SlashCommand(
-                "help",
-                self._help_handler,
-                "Show all available commands",
-                usage="/help [command]",
-            )
-        )
-        
-        # Exit command
-        self.register(
-            SlashCommand(
-                "exit",
-                self._exit_handler,
-                "Exit interactive mode",
-                aliases=["quit"],
-            )
-        )
-        
-        # Clear command
-        self.register(
-            SlashCommand(
-                "clear",
-                self._clear_handler,
-                "Clear the screen",
+        for name, handler, description, usage, aliases in _DEFAULT_COMMANDS:
+            self.register(
+                SlashCommand(name, getattr(self, handler), description, usage, list(aliases))
             )
-        )
-        
-        # Status command
-        self.register(
-            SlashCommand(
-                "status",
-                self._status_handler,
-                "Show current status",
-            )
-        )
 
-    def _help_handler(self, args: list[str], context: Any = None) -> str:
+    def _help_handler(self, args: Sequence[str], context: Any = None) -> str:
         """Handle /help command.
 
         Args:
@@ -143,14 +159,17 @@ class SlashCommandRegistry:
             # Show help for specific command
             cmd = self.get(args[0])
             if cmd:
-                table = Table(title=f"Help: /{cmd.name}")
-                table.add_column("Property", style="cyan")
-                table.add_column("Value", style="green")
-                
-                table.add_row("Description", cmd.description)
-                table.add_row("Usage", cmd.usage)
-                if cmd.aliases:
-                    table.add_row("Aliases", ", ".join(f"/{a}" for a in cmd.aliases))
+                table = self._help_per_cmd.get(cmd.name)
+                if table is None:
+                    table = Table(title=f"Help: /{cmd.name}")
+                    table.add_column("Property", style="cyan")
+                    table.add_column("Value", style="green")
+                    
+                    table.add_row("Description", cmd.description)
+                    table.add_row("Usage", cmd.usage)
+                    if cmd.aliases:
+                        table.add_row("Aliases", ", ".join(f"/{a}" for a in cmd.aliases))
+                    self._help_per_cmd[cmd.name] = table
                 
                 console.print(table)
                 return ""
@@ -159,18 +178,22 @@ class SlashCommandRegistry:
                 return ""
         
         # Show all commands
-        table = Table(title="Available Commands")
-        table.add_column("Command", style="cyan")
-        table.add_column("Description", style="green")
-        table.add_column("Usage", style="yellow")
-        
-        for cmd in sorted(self.list_all(), key=lambda x: x.name):
-            table.add_row(f"/{cmd.name}", cmd.description, cmd.usage)
+        table = self._help_table_cache
+        if table is None:
+            table = Table(title="Available Commands")
+            table.add_column("Command", style="cyan")
+            table.add_column("Description", style="green")
+            table.add_column("Usage", style="yellow")
+            
+            for cmd in self._canonical:
+                table.add_row(f"/{cmd.name}", cmd.description, cmd.usage)
+            self._help_table_cache = table
         
         console.print(table)
         return ""
 
-    def _exit_handler(self, args: list[str], context: Any = None) -> str:
+    @staticmethod
+    def _exit_handler(args: Sequence[str], context: Any = None) -> str:
         """Handle /exit command.
 
         Args:
@@ -182,7 +205,8 @@ class SlashCommandRegistry:
         """
         return "exit"
 
-    def _clear_handler(self, args: list[str], context: Any = None) -> str:
+    @staticmethod
+    def _clear_handler(args: Sequence[str], context: Any = None) -> str:
         """Handle /clear command.
 
         Args:
@@ -195,7 +219,8 @@ class SlashCommandRegistry:
         console.clear()
         return ""
 
-    def _status_handler(self, args: list[str], context: Any = None) -> str:
+    @staticmethod
+    def _status_handler(args: Sequence[str], context: Any = None) -> str:
         """Handle /status command.
 
         Args:
@@ -238,9 +263,15 @@ class SlashCommandRegistry:
         if not command.startswith("/"):
             return None
         
-        parts = command[1:].split(maxsplit=1)
-        cmd_name = parts[0]
-        args = parts[1].split() if len(parts) > 1 else []
+        # Slice out the name directly; most commands ("/exit", "/help") have no
+        # arguments and share one empty tuple
+        space = command.find(" ", 1)
+        if space == -1:
+            cmd_name = command[1:]
+            args = _NO_ARGS
+        else:
+            cmd_name = command[1:space]
+            args = tuple(command[space + 1 :].split())
         
         cmd = self.get(cmd_name)
         if cmd:
@@ -0,0 +1,55 @@
+"""
+Prompt history storage for OmniDev CLI.
+
+Keeps history file writes off the thread that reads user input.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from prompt_toolkit.history import FileHistory
+
+from omnidev.core.logger import get_logger
+
+logger = get_logger("history")
+
+
+class BackgroundFileHistory(FileHistory):
+    """FileHistory whose appends run on a single background writer thread.
+
+    ``FileHistory.store_string`` opens and appends to the history file on the
+    caller's thread, i.e. right after every submitted prompt. Here each entry
+    is queued to one writer thread instead, which keeps entries in order.
+    Wrap in ``ThreadedHistory`` to also load the file in the background.
+    """
+
+    def __init__(self, filename: str) -> None:
+        """Initialize the history.
+
+        Args:
+            filename: Path to the history file.
+        """
+        super().__init__(filename)
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="omnidev-history")
+
+    def store_string(self, string: str) -> None:
+        """Queue an entry to be appended to the history file.
+
+        Args:
+            string: Submitted input.
+        """
+        self._writer.submit(self._write, string)
+
+    def _write(self, string: str) -> None:
+        """Append an entry to the history file (runs on the writer thread).
+
+        Args:
+            string: Submitted input.
+        """
+        try:
+            super().store_string(string)
+        except OSError as e:
+            logger.debug(f"Failed to write history entry: {e}")
+
+    def close(self) -> None:
+        """Wait for queued entries to be written and stop the writer thread."""
+        self._writer.shutdown(wait=True)
@@ -5,16 +5,19 @@ This module provides the main command-line interface for OmniDev,
 handling command parsing and routing to appropriate handlers.
 """
 
+import os
 import sys
 from pathlib import Path
 from typing import Optional
 
 import click
-from rich.console import Console
 
 from omnidev.cli.commands import config_group, run_command
 from omnidev.core.exceptions import OmniDevError
 
+# Options only the top-level group handles; run_command accepts all the others
+_GROUP_ONLY_OPTIONS = frozenset({"--help", "--version"})
+
 
 @click.group(invoke_without_command=True)
 @click.version_option(version="0.1.0", prog_name="omnidev")
@@ -74,8 +77,8 @@ def setup(project_root: Optional[Path]) -> None:
     """
     from omnidev.core.config import ConfigManager
     from omnidev.cli.ui.components import Logo
+    from omnidev.cli.ui.console import console
     
-    console = Console()
     Logo.render()
     
     console.print("\n[bold cyan]OmniDev Setup Wizard[/bold cyan]")
@@ -142,16 +145,43 @@ def setup(project_root: Optional[Path]) -> None:
         return
 
 
+def _is_fast_run(args: list[str]) -> bool:
+    """Check whether arguments can go straight to the run command.
+
+    ``omnidev`` and ``omnidev "<query>"`` would otherwise be parsed by the group
+    and then re-dispatched to ``run_command`` through a second context. Set
+    ``OMNIDEV_FAST_CLI=0`` to always go through the group.
+
+    Args:
+        args: Command-line arguments (without the program name).
+
+    Returns:
+        True if the arguments are a plain query (or empty), False otherwise.
+    """
+    if os.environ.get("OMNIDEV_FAST_CLI", "1") == "0":
+        return False
+    if any(arg in _GROUP_ONLY_OPTIONS for arg in args):
+        return False
+    return not args or (not args[0].startswith("-") and args[0] not in cli_main.commands)
+
+
 def cli() -> None:
     """Entry point for the CLI."""
     try:
-        cli_main.main(standalone_mode=False)
+        args = sys.argv[1:]
+        if _is_fast_run(args):
+            run_command.main(args=args, prog_name="omnidev", standalone_mode=False)
+        else:
+            cli_main.main(standalone_mode=False)
     except OmniDevError as e:
         click.echo(f"Error: {e.message}", err=True)
         sys.exit(1)
     except KeyboardInterrupt:
         click.echo("\nInterrupted by user", err=True)
         sys.exit(130)
+    except click.Abort:
+        # Cancelled prompts (e.g. the setup wizard) already printed why
+        sys.exit(1)
     except Exception as e:
         click.echo(f"Unexpected error: {e}", err=True)
         sys.exit(1)
@@ -6,37 +6,73 @@ auto-completion, setup wizard, and a status bar.
 """
 
 import asyncio
+import re
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 import click
-from prompt_toolkit import PromptSession
-from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
-from prompt_toolkit.formatted_text import HTML
-from prompt_toolkit.history import FileHistory
-from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.styles import Style
-from rich.console import Console
-from rich.live import Live
-from rich.markdown import Markdown
+from rich.console import Group
+from rich.markup import escape
 from rich.panel import Panel
-from rich.spinner import Spinner
-from rich.table import Table
 from rich.text import Text
 
+from omnidev.cli.ui.console import console
 from omnidev.core.config import ConfigManager
 from omnidev.core.logger import get_logger
 
-console = Console()
+if TYPE_CHECKING:
+    # prompt_toolkit and Rich's Markdown/Table/Live are imported where they are
+    # used, so importing this module stays cheap for non-interactive commands
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.completion import Completer
+    from prompt_toolkit.formatted_text import HTML
+    from prompt_toolkit.key_binding import KeyBindings
+    from prompt_toolkit.styles import Style
+    from rich.table import Table
+
 logger = get_logger("repl")
 
 
-# Custom prompt style with gradient colors
-PROMPT_STYLE = Style.from_dict({
+# Custom prompt style with gradient colors, exposed as PROMPT_STYLE
+_PROMPT_STYLE_RULES = {
     "prompt": "bold #00d4ff",
     "prompt-arrow": "bold #ff6ec7",
     "bottom-toolbar": "bg:#1e1e2e #888899",
-})
+}
+
+
+def _get_prompt_style() -> "Style":
+    """Build the prompt style on first use.
+
+    Returns:
+        The prompt_toolkit Style for the REPL prompt and toolbar.
+    """
+    style = globals().get("PROMPT_STYLE")
+    if style is None:
+        from prompt_toolkit.styles import Style
+
+        style = Style.from_dict(_PROMPT_STYLE_RULES)
+        globals()["PROMPT_STYLE"] = style
+    return style
+
+
+def __getattr__(name: str) -> Any:
+    """Build PROMPT_STYLE on first access (PEP 562).
+
+    Args:
+        name: Attribute name being looked up on the module.
+
+    Returns:
+        The requested attribute.
+
+    Raises:
+        AttributeError: If the name is not provided lazily by this module.
+    """
+    if name == "PROMPT_STYLE":
+        return _get_prompt_style()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Available providers with their models
@@ -85,6 +121,23 @@ MODES = {
     "manual": "Manual Mode - Approve every step",
 }
 
+# Anything Markdown would render differently from plain text: inline markup,
+# headings, quotes, tables, HTML/entities, escapes, line breaks, lists and rules
+_MARKDOWN_HINT_RE = re.compile(r"[`#*_\[>|~<&\\\n]|^\s|^(?:[-+]|\d+[.)])(?:\s|$)|^---")
+
+# Provider errors that are really HTML pages (gateway errors, outages). Markers
+# sit at the start of such bodies, so only a bounded prefix is scanned.
+_HTML_ERROR_RE = re.compile(r"<!DOCTYPE|<html", re.IGNORECASE)
+_HTML_ERROR_SCAN_LIMIT = 4096
+
+# Menu orderings; menu choice N selects entry N - 1
+_PROVIDER_LIST = tuple(PROVIDER_MODELS)
+_MODE_LIST = tuple(MODES)
+
+# Menu line fragments shared by the selection menus
+_CURRENT_MARK = " [green]← current[/green]"
+_CANCEL_OPTION = "  [cyan]0[/cyan]. Cancel"
+
 
 class OmniDevREPL:
     """Interactive REPL for OmniDev with enhanced features."""
@@ -103,6 +156,15 @@ class OmniDevREPL:
         "/exit": "Exit the REPL",
     }
 
+    # Number of conversation messages kept in memory
+    HISTORY_LIMIT = 500
+
+    # Commands that leave the REPL
+    EXIT_COMMANDS = frozenset({"/exit", "/quit", "/q"})
+
+    # /help table and tips, built on first use from SLASH_COMMANDS
+    _help_renderables: Optional[tuple["Table", Text]] = None
+
     def __init__(
         self,
         config: ConfigManager,
@@ -126,14 +188,16 @@ class OmniDevREPL:
         # Get current settings
         cfg = config.get_config()
         self.current_model = cfg.models.preferred or "auto"
-        self.current_provider = cfg.models.fallback or ""
+        self._set_provider(cfg.models.fallback or "")
         self.current_mode = cfg.mode.default_mode or "auto"
         
         # Track if provider changed (need to re-register)
         self._provider_changed = False
+        # Provider this REPL last registered, so repeated saves skip the registry
+        self._last_registered_provider: Optional[str] = None
         
-        # Conversation history for context
-        self.conversation: list[dict[str, str]] = []
+        # Conversation history for context; the oldest messages drop off past the limit
+        self.conversation: deque[dict[str, str]] = deque(maxlen=self.HISTORY_LIMIT)
         
         # History file for prompt_toolkit
         history_dir = project_root / ".omnidev"
@@ -142,12 +206,35 @@ class OmniDevREPL:
         
         # Setup key bindings
         self.bindings = self._create_key_bindings()
+
+        # Completion for slash commands and provider/model names
+        self._completer = self._create_completer()
         
         # Flag to exit
         self._running = True
 
-    def _create_key_bindings(self) -> KeyBindings:
+        # Rendered bottom toolbar; prompt_toolkit asks for it on every redraw
+        self._toolbar_cache: Optional["HTML"] = None
+        # Welcome panel, reprinted by /clear until the settings change
+        self._welcome_panel: Optional[Panel] = None
+
+        # Slash command handlers; a handler returning None means nothing to print
+        self._slash_dispatch: dict[str, Callable[[], Optional[str]]] = {
+            "/help": self._show_help,
+            "/clear": self._cmd_clear,
+            "/reset": self._cmd_reset,
+            "/setup": self._run_setup,
+            "/provider": self._select_provider,
+            "/model": self._select_model,
+            "/mode": self._select_mode,
+            "/status": self._show_status,
+            "/history": self._show_history,
+        }
+
+    def _create_key_bindings(self) -> "KeyBindings":
         """Create custom key bindings."""
+        from prompt_toolkit.key_binding import KeyBindings
+
         bindings = KeyBindings()
 
         @bindings.add("c-c")
@@ -163,21 +250,48 @@ class OmniDevREPL:
 
         return bindings
 
-    def _get_prompt(self) -> HTML:
+    def _create_completer(self) -> "Completer":
+        """Create the completer for slash commands, providers and models.
+
+        Completions are offered only on slash command lines, so ordinary
+        chat messages don't pop up a menu on every keystroke.
+        """
+        from prompt_toolkit.application import get_app
+        from prompt_toolkit.completion import ConditionalCompleter, FuzzyWordCompleter
+        from prompt_toolkit.filters import Condition
+
+        words = list(dict.fromkeys([
+            *self.SLASH_COMMANDS,
+            *PROVIDER_MODELS,
+            *(model for info in PROVIDER_MODELS.values() for model in info["models"]),
+        ]))
+        return ConditionalCompleter(
+            FuzzyWordCompleter(words),
+            filter=Condition(lambda: get_app().current_buffer.text.startswith("/")),
+        )
+
+    def _get_prompt(self) -> "HTML":
         """Get the formatted prompt."""
+        from prompt_toolkit.formatted_text import HTML
+
         return HTML(
             "<prompt>❯</prompt> "
         )
 
-    def _get_bottom_toolbar(self) -> HTML:
+    def _get_bottom_toolbar(self) -> "HTML":
         """Get the bottom toolbar content."""
+        if self._toolbar_cache is not None:
+            return self._toolbar_cache
+
+        from prompt_toolkit.formatted_text import HTML
+
         model_display = self.current_model
         if len(model_display) > 20:
             model_display = model_display[:17] + "..."
         
         provider_display = self.current_provider or "not set"
         
-        return HTML(
+        self._toolbar_cache = HTML(
             f"<bottom-toolbar>"
             f" <b style='color: #00d4ff'>⚡ {provider_display}</b>"
             f" │ <b style='color: #ff6ec7'>{model_display}</b>"
@@ -185,96 +299,105 @@ class OmniDevREPL:
             f" │ /help"
             f"</bottom-toolbar>"
         )
+        return self._toolbar_cache
+
+    def _set_provider(self, name: str) -> None:
+        """Switch the current provider and refresh its cached display name.
+
+        Args:
+            name: Provider key, or an empty string when none is configured.
+        """
+        self.current_provider = name
+        self._provider_display_name = (
+            PROVIDER_MODELS.get(name, {}).get("name", name) if name else "not set"
+        )
+        self._invalidate_toolbar()
+
+    def _invalidate_toolbar(self) -> None:
+        """Drop the cached toolbar and welcome panel after the provider, model or mode changes."""
+        self._toolbar_cache = None
+        self._welcome_panel = None
 
     def _show_welcome(self) -> None:
         """Show welcome message with current status."""
-        # Create a styled welcome box
-        welcome_content = Text()
-        welcome_content.append("Welcome to ", style="dim")
-        welcome_content.append("OmniDev", style="bold bright_blue")
-        welcome_content.append(" Interactive Mode\n\n", style="dim")
-        
-        # Show current config
+        if self._welcome_panel is None:
+            self._welcome_panel = self._build_welcome_panel()
+        console.print(Group(self._welcome_panel, Text()))
+
+    def _build_welcome_panel(self) -> Panel:
+        """Build the welcome panel for the current settings.
+
+        Returns:
+            Panel with the welcome message.
+        """
+        # Show current config, or point at /setup when nothing is configured
         if self.current_provider:
-            welcome_content.append("  ⚡ Provider: ", style="dim")
-            welcome_content.append(f"{self.current_provider}\n", style="bold cyan")
-            welcome_content.append("  🤖 Model:    ", style="dim")
-            welcome_content.append(f"{self.current_model}\n", style="bold magenta")
-            welcome_content.append("  📋 Mode:     ", style="dim")
-            welcome_content.append(f"{self.current_mode}\n", style="bold green")
+            config_markup = (
+                f"[dim]  ⚡ Provider: [/dim][bold cyan]{escape(self.current_provider)}\n[/bold cyan]"
+                f"[dim]  🤖 Model:    [/dim][bold magenta]{escape(self.current_model)}\n[/bold magenta]"
+                f"[dim]  📋 Mode:     [/dim][bold green]{escape(self.current_mode)}\n[/bold green]"
+            )
         else:
-            welcome_content.append("  ⚠️  ", style="yellow")
-            welcome_content.append("No provider configured\n", style="yellow")
-            welcome_content.append("     Run ", style="dim")
-            welcome_content.append("/setup", style="bold cyan")
-            welcome_content.append(" to get started\n", style="dim")
-        
-        welcome_content.append("\n  Type ", style="dim")
-        welcome_content.append("/help", style="bold cyan")
-        welcome_content.append(" for commands, or start chatting!", style="dim")
+            config_markup = (
+                "[yellow]  ⚠️  No provider configured\n[/yellow]"
+                "[dim]     Run [/dim][bold cyan]/setup[/bold cyan][dim] to get started\n[/dim]"
+            )
+
+        # Create a styled welcome box
+        welcome_content = Text.from_markup(
+            "[dim]Welcome to [/dim][bold bright_blue]OmniDev[/bold bright_blue]"
+            "[dim] Interactive Mode\n\n[/dim]"
+            f"{config_markup}"
+            "[dim]\n  Type [/dim][bold cyan]/help[/bold cyan]"
+            "[dim] for commands, or start chatting![/dim]"
+        )
         
-        panel = Panel(
+        return Panel(
             welcome_content,
             border_style="bright_blue",
             padding=(1, 2),
         )
-        console.print(panel)
-        console.print()
 
     def _handle_slash_command(self, command: str) -> Optional[str]:
         """Handle a slash command."""
-        parts = command.split()
-        cmd = parts[0].lower()
-        args = parts[1:] if len(parts) > 1 else []
+        cmd, _, _ = command.partition(" ")
+        cmd = cmd.lower()
 
-        if cmd in ("/exit", "/quit", "/q"):
+        if cmd in self.EXIT_COMMANDS:
             self._running = False
             return None
 
-        elif cmd == "/help":
-            self._show_help()
-            return ""
-
-        elif cmd == "/clear":
-            console.clear()
-            self._show_welcome()
-            return ""
-
-        elif cmd == "/reset":
-            self.conversation = []
-            return "✓ Conversation history cleared"
+        handler = self._slash_dispatch.get(cmd)
+        if handler is None:
+            return f"[yellow]Unknown command: {cmd}[/yellow]\nType /help for available commands."
 
-        elif cmd == "/setup":
-            self._run_setup()
-            return ""
+        result = handler()
+        return "" if result is None else result
 
-        elif cmd == "/provider":
-            self._select_provider()
-            return ""
+    def _cmd_clear(self) -> None:
+        """Clear the screen and show the welcome message again."""
+        console.clear()
+        self._show_welcome()
 
-        elif cmd == "/model":
-            self._select_model()
-            return ""
+    def _cmd_reset(self) -> str:
+        """Forget the conversation history."""
+        self.conversation.clear()
+        return "✓ Conversation history cleared"
 
-        elif cmd == "/mode":
-            self._select_mode()
-            return ""
+    @classmethod
+    def _build_help_renderables(cls) -> tuple["Table", Text]:
+        """Build the /help commands table and tips once per class.
 
-        elif cmd == "/status":
-            self._show_status()
-            return ""
+        Returns:
+            Tuple of (commands table, tips text).
+        """
+        # Looked up on this class only, so a subclass with its own commands builds its own
+        cached = cls.__dict__.get("_help_renderables")
+        if cached is not None:
+            return cached
 
-        elif cmd == "/history":
-            self._show_history()
-            return ""
+        from rich.table import Table
 
-        else:
-            return f"[yellow]Unknown command: {cmd}[/yellow]\nType /help for available commands."
-
-    def _show_help(self) -> None:
-        """Show help information with styled table."""
-        console.print()
-        
         # Create commands table
         table = Table(
             title="[bold bright_blue]📚 Available Commands[/bold bright_blue]",
@@ -286,11 +409,9 @@ class OmniDevREPL:
         table.add_column("Command", style="bold")
         table.add_column("Description", style="dim")
         
-        for cmd, desc in self.SLASH_COMMANDS.items():
+        for cmd, desc in cls.SLASH_COMMANDS.items():
             table.add_row(cmd, desc)
         
-        console.print(table)
-        
         # Tips section
         tips = Text()
         tips.append("\n💡 Tips:\n", style="bold")
@@ -305,13 +426,22 @@ class OmniDevREPL:
         tips.append(" to cancel, ", style="dim")
         tips.append("Ctrl+D", style="bold")
         tips.append(" to exit\n", style="dim")
-        console.print(tips)
+
+        cls._help_renderables = (table, tips)
+        return cls._help_renderables
+
+    def _show_help(self) -> None:
+        """Show help information with styled table."""
+        table, tips = self._build_help_renderables()
+        console.print(Group(Text(), table, tips))
 
     def _run_setup(self) -> None:
         """Run the full setup wizard from within REPL."""
-        console.print()
-        console.print("[bold bright_blue]🔧 OmniDev Setup Wizard[/bold bright_blue]")
-        console.print("[dim]─" * 40 + "[/dim]\n")
+        console.print(Group(
+            Text(),
+            "[bold bright_blue]🔧 OmniDev Setup Wizard[/bold bright_blue]",
+            "[dim]─" * 40 + "[/dim]\n",
+        ))
         
         # Step 1: Select Provider
         self._select_provider()
@@ -336,38 +466,32 @@ class OmniDevREPL:
         # Save configuration
         self._save_config()
         
-        console.print()
-        console.print("[bold green]✓ Setup complete![/bold green]")
+        console.print(Group(Text(), "[bold green]✓ Setup complete![/bold green]"))
         self._show_status()
 
     def _select_provider(self) -> None:
         """Interactive provider selection."""
-        console.print()
-        console.print("[bold]Select AI Provider:[/bold]\n")
-        
-        # Build options list
-        providers = list(PROVIDER_MODELS.keys())
-        for i, provider in enumerate(providers, 1):
-            info = PROVIDER_MODELS[provider]
-            name = info["name"]
-            current = " [green]← current[/green]" if provider == self.current_provider else ""
-            console.print(f"  [cyan]{i}[/cyan]. {name}{current}")
-        
-        console.print(f"  [cyan]0[/cyan]. Cancel")
-        console.print()
+        # Build options list and print the menu in one go
+        lines = [
+            f"  [cyan]{i}[/cyan]. {PROVIDER_MODELS[provider]['name']}"
+            f"{_CURRENT_MARK if provider == self.current_provider else ''}"
+            for i, provider in enumerate(_PROVIDER_LIST, 1)
+        ]
+        lines.append(_CANCEL_OPTION)
+        console.print(Group(Text(), "[bold]Select AI Provider:[/bold]\n", "\n".join(lines), Text()))
         
         try:
             choice = click.prompt(
                 "Select provider",
-                type=click.IntRange(0, len(providers)),
+                type=click.IntRange(0, len(_PROVIDER_LIST)),
                 default=0,
             )
             if choice == 0:
                 return
             
-            selected = providers[choice - 1]
+            selected = _PROVIDER_LIST[choice - 1]
             old_provider = self.current_provider
-            self.current_provider = selected
+            self._set_provider(selected)
             
             # Update model to first available for this provider
             models = PROVIDER_MODELS[selected]["models"]
@@ -378,12 +502,13 @@ class OmniDevREPL:
             if old_provider != selected:
                 self._provider_changed = True
                 # Register the new provider immediately if we have registry access
-                if self.provider_registry:
-                    self.provider_registry.ensure_provider_registered(selected, priority=0)
+                self._register_current_provider()
             
-            console.print(f"[green]✓[/green] Provider: {PROVIDER_MODELS[selected]['name']}")
+            console.print(f"[green]✓[/green] Provider: {self._provider_display_name}")
         except (ValueError, click.Abort):
             return
+        finally:
+            self._invalidate_toolbar()
 
     def _select_model(self) -> None:
         """Interactive model selection based on current provider."""
@@ -401,15 +526,17 @@ class OmniDevREPL:
             console.print("[yellow]No models available for this provider[/yellow]")
             return
         
-        console.print()
-        console.print(f"[bold]Select Model for {provider_info['name']}:[/bold]\n")
-        
-        for i, model in enumerate(models, 1):
-            current = " [green]← current[/green]" if model == self.current_model else ""
-            console.print(f"  [cyan]{i}[/cyan]. {model}{current}")
-        
-        console.print(f"  [cyan]0[/cyan]. Cancel")
-        console.print()
+        lines = [
+            f"  [cyan]{i}[/cyan]. {model}{_CURRENT_MARK if model == self.current_model else ''}"
+            for i, model in enumerate(models, 1)
+        ]
+        lines.append(_CANCEL_OPTION)
+        console.print(Group(
+            Text(),
+            f"[bold]Select Model for {provider_info['name']}:[/bold]\n",
+            "\n".join(lines),
+            Text(),
+        ))
         
         try:
             choice = click.prompt(
@@ -424,34 +551,34 @@ class OmniDevREPL:
             console.print(f"[green]✓[/green] Model: {self.current_model}")
         except (ValueError, click.Abort):
             return
+        finally:
+            self._invalidate_toolbar()
 
     def _select_mode(self) -> None:
         """Interactive mode selection."""
-        console.print()
-        console.print("[bold]Select Operational Mode:[/bold]\n")
-        
-        modes = list(MODES.keys())
-        for i, mode in enumerate(modes, 1):
-            desc = MODES[mode]
-            current = " [green]← current[/green]" if mode == self.current_mode else ""
-            console.print(f"  [cyan]{i}[/cyan]. [bold]{mode}[/bold] - {desc}{current}")
-        
-        console.print(f"  [cyan]0[/cyan]. Cancel")
-        console.print()
+        lines = [
+            f"  [cyan]{i}[/cyan]. [bold]{mode}[/bold] - {MODES[mode]}"
+            f"{_CURRENT_MARK if mode == self.current_mode else ''}"
+            for i, mode in enumerate(_MODE_LIST, 1)
+        ]
+        lines.append(_CANCEL_OPTION)
+        console.print(Group(Text(), "[bold]Select Operational Mode:[/bold]\n", "\n".join(lines), Text()))
         
         try:
             choice = click.prompt(
                 "Select mode",
-                type=click.IntRange(0, len(modes)),
+                type=click.IntRange(0, len(_MODE_LIST)),
                 default=0,
             )
             if choice == 0:
                 return
             
-            self.current_mode = modes[choice - 1]
+            self.current_mode = _MODE_LIST[choice - 1]
             console.print(f"[green]✓[/green] Mode: {self.current_mode}")
         except (ValueError, click.Abort):
             return
+        finally:
+            self._invalidate_toolbar()
 
     def _configure_api_key(self) -> None:
         """Configure API key for the current provider."""
@@ -502,81 +629,84 @@ class OmniDevREPL:
             self._provider_changed = True
             
             # Register the provider immediately if we have registry access
-            if self.provider_registry and self.current_provider:
-                self.provider_registry.ensure_provider_registered(self.current_provider, priority=0)
+            self._register_current_provider()
         except Exception as e:
             logger.warning(f"Failed to save config: {e}")
+        finally:
+            self._invalidate_toolbar()
+
+    def _register_current_provider(self) -> None:
+        """Register the current provider unless this REPL already registered it."""
+        if (
+            self.provider_registry
+            and self.current_provider
+            and self._last_registered_provider != self.current_provider
+        ):
+            if self.provider_registry.ensure_provider_registered(self.current_provider, priority=0):
+                self._last_registered_provider = self.current_provider
 
     def _show_status(self) -> None:
         """Show current status with styled panel."""
-        console.print()
-        
-        # Build status content
-        status = Text()
-        status.append("📊 Current Configuration\n\n", style="bold bright_blue")
-        
-        status.append("  Provider   ", style="dim")
-        if self.current_provider:
-            pname = PROVIDER_MODELS.get(self.current_provider, {}).get("name", self.current_provider)
-            status.append(f"{pname}\n", style="bold cyan")
-        else:
-            status.append("Not configured\n", style="yellow")
-        
-        status.append("  Model      ", style="dim")
-        status.append(f"{self.current_model}\n", style="bold magenta")
-        
-        status.append("  Mode       ", style="dim")
-        status.append(f"{self.current_mode}\n", style="bold green")
-        
-        status.append("  Project    ", style="dim")
-        status.append(f"{self.project_root.name}\n", style="")
-        
-        status.append("  Messages   ", style="dim")
-        status.append(f"{len(self.conversation)}\n", style="")
-        
-        # Check API key status
         if self.current_provider:
-            has_key = bool(self.config.get_api_key(self.current_provider))
-            status.append("\n  API Key    ", style="dim")
-            if has_key:
-                status.append("✓ Configured\n", style="green")
+            provider_markup = f"[bold cyan]{escape(self._provider_display_name)}\n[/bold cyan]"
+            # Check API key status
+            if self.config.get_api_key(self.current_provider):
+                key_markup = "[dim]\n  API Key    [/dim][green]✓ Configured\n[/green]"
             else:
-                status.append("✗ Not set\n", style="red")
+                key_markup = "[dim]\n  API Key    [/dim][red]✗ Not set\n[/red]"
+        else:
+            provider_markup = "[yellow]Not configured\n[/yellow]"
+            key_markup = ""
+
+        # Build status content
+        status = Text.from_markup(
+            "[bold bright_blue]📊 Current Configuration\n\n[/bold bright_blue]"
+            f"[dim]  Provider   [/dim]{provider_markup}"
+            f"[dim]  Model      [/dim][bold magenta]{escape(self.current_model)}\n[/bold magenta]"
+            f"[dim]  Mode       [/dim][bold green]{escape(self.current_mode)}\n[/bold green]"
+            f"[dim]  Project    [/dim]{escape(self.project_root.name)}\n"
+            f"[dim]  Messages   [/dim]{len(self.conversation)}\n"
+            f"{key_markup}"
+        )
         
         panel = Panel(status, border_style="dim", padding=(0, 2))
-        console.print(panel)
+        console.print(Group(Text(), panel))
 
     def _show_history(self) -> None:
         """Show conversation history."""
-        console.print()
-        
         if not self.conversation:
-            console.print("[dim]No conversation history yet.[/dim]")
+            console.print(Group(Text(), "[dim]No conversation history yet.[/dim]"))
             return
 
-        console.print("[bold]📜 Conversation History[/bold]\n")
+        lines = [Text(), "[bold]📜 Conversation History[/bold]\n"]
         
-        for i, msg in enumerate(self.conversation[-10:], 1):
+        # Walk back from the newest message so only the shown ones are visited
+        recent = list(islice(reversed(self.conversation), 10))
+        recent.reverse()
+        for i, msg in enumerate(recent, 1):
             role = msg.get("role", "unknown")
             content = msg.get("content", "")
             if len(content) > 80:
                 content = content[:77] + "..."
             
             if role == "user":
-                console.print(f"  [cyan]You:[/cyan] {content}")
+                lines.append(f"  [cyan]You:[/cyan] {content}")
             else:
-                console.print(f"  [green]AI:[/green]  {content}")
+                lines.append(f"  [green]AI:[/green]  {content}")
         
         if len(self.conversation) > 10:
-            console.print(f"\n  [dim]... and {len(self.conversation) - 10} more messages[/dim]")
+            lines.append(f"\n  [dim]... and {len(self.conversation) - 10} more messages[/dim]")
+        console.print(Group(*lines))
 
     async def _execute_query(self, query: str) -> None:
         """Execute a query and display the result."""
+        from rich.live import Live
+        from rich.spinner import Spinner
+
         # Add to conversation history
         self.conversation.append({"role": "user", "content": query})
 
         # Show processing indicator with spinner
-        provider_name = PROVIDER_MODELS.get(self.current_provider, {}).get("name", self.current_provider)
         console.print()
 
         try:
@@ -584,20 +714,19 @@ class OmniDevREPL:
             provider_to_use = self.current_provider if self._provider_changed else None
             
             # Create a spinner for loading indication
-            spinner_text = Text()
-            spinner_text.append("💭 ", style="")
-            spinner_text.append("Thinking", style="bold cyan")
-            spinner_text.append(f" with ", style="dim")
-            spinner_text.append(f"{self.current_model}", style="bold magenta")
-            spinner_text.append(f" via ", style="dim")
-            spinner_text.append(f"{provider_name}", style="bold blue")
-            spinner_text.append("...", style="dim")
+            spinner_text = Text.from_markup(
+                "💭 [bold cyan]Thinking[/bold cyan][dim] with [/dim]"
+                f"[bold magenta]{escape(self.current_model)}[/bold magenta]"
+                f"[dim] via [/dim][bold blue]{escape(self._provider_display_name)}[/bold blue][dim]...[/dim]"
+            )
             
             # Use Live context for animated spinner
+            # Queries take seconds, so a slower spinner at 4 fps keeps visible
+            # motion while writing far fewer frames to the terminal
             with Live(
-                Spinner("dots", text=spinner_text, style="cyan"),
+                Spinner("dots", text=spinner_text, style="cyan", speed=0.8),
                 console=console,
-                refresh_per_second=10,
+                refresh_per_second=4,
                 transient=True,  # Remove spinner when done
             ):
                 # Execute the query using callback
@@ -609,9 +738,16 @@ class OmniDevREPL:
             if isinstance(result, dict):
                 if result.get("success"):
                     response = result.get("response", "")
+                    # Plain answers skip the Markdown parser entirely
+                    if _MARKDOWN_HINT_RE.search(response):
+                        from rich.markdown import Markdown
+
+                        body: Any = Markdown(response)
+                    else:
+                        body = Text(response)
                     # Render response in a styled panel
                     console.print(Panel(
-                        Markdown(response),
+                        body,
                         border_style="green",
                         padding=(1, 2),
                     ))
@@ -619,7 +755,7 @@ class OmniDevREPL:
                 else:
                     error_msg = result.get("error", "Unknown error")
                     # Extract meaningful error message (avoid showing HTML)
-                    if "<!DOCTYPE" in str(error_msg) or "<html" in str(error_msg):
+                    if _HTML_ERROR_RE.search(str(error_msg)[:_HTML_ERROR_SCAN_LIMIT]):
                         error_msg = "Provider returned an error. The API may be temporarily unavailable."
                     console.print(Panel(
                         f"[red]Error: {error_msg}[/red]",
@@ -631,7 +767,7 @@ class OmniDevREPL:
         except Exception as e:
             error_msg = str(e)
             # Extract meaningful error message (avoid showing HTML)
-            if "<!DOCTYPE" in error_msg or "<html" in error_msg:
+            if _HTML_ERROR_RE.search(error_msg[:_HTML_ERROR_SCAN_LIMIT]):
                 error_msg = "Provider returned an error. The API may be temporarily unavailable."
             console.print(Panel(
                 f"[red]{error_msg}[/red]",
@@ -642,6 +778,12 @@ class OmniDevREPL:
 
     async def run(self) -> None:
         """Run the REPL loop."""
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
+        from prompt_toolkit.history import ThreadedHistory
+
+        from omnidev.cli.history import BackgroundFileHistory
+
         # Show welcome message
         self._show_welcome()
         
@@ -650,14 +792,31 @@ class OmniDevREPL:
             if click.confirm("Would you like to run setup now?", default=True):
                 self._run_setup()
         
-        # Create prompt session
+        # History is loaded by ThreadedHistory and appended by the writer
+        # thread, so neither blocks the prompt
+        file_history = BackgroundFileHistory(str(self.history_file))
         session: PromptSession[str] = PromptSession(
-            history=FileHistory(str(self.history_file)),
+            history=ThreadedHistory(file_history),
             auto_suggest=AutoSuggestFromHistory(),
-            style=PROMPT_STYLE,
+            style=_get_prompt_style(),
             key_bindings=self.bindings,
+            completer=self._completer,
+            complete_while_typing=True,
         )
 
+        try:
+            await self._prompt_loop(session)
+        finally:
+            file_history.close()
+
+        console.print(Group(Text(), "[dim]👋 Goodbye![/dim]", Text()))
+
+    async def _prompt_loop(self, session: "PromptSession[str]") -> None:
+        """Read and handle input until the user exits.
+
+        Args:
+            session: Prompt session to read input from.
+        """
         while self._running:
             try:
                 # Get user input
@@ -666,12 +825,17 @@ class OmniDevREPL:
                     bottom_toolbar=self._get_bottom_toolbar,
                 )
 
+                # Ctrl+D exits the prompt without input; stop right here
+                if not self._running:
+                    break
+
+                # Normalize once; everything below works on the stripped text
+                user_input = user_input.strip() if user_input else ""
+
                 # Skip empty input
-                if not user_input or not user_input.strip():
+                if not user_input:
                     continue
 
-                user_input = user_input.strip()
-
                 # Handle slash commands
                 if user_input.startswith("/"):
                     result = self._handle_slash_command(user_input)
@@ -694,7 +858,3 @@ class OmniDevREPL:
             except Exception as e:
                 logger.error(f"REPL error: {e}")
                 console.print(f"[red]Error: {e}[/red]")
-
-        console.print()
-        console.print("[dim]👋 Goodbye![/dim]")
-        console.print()
@@ -4,21 +4,103 @@ Interactive setup wizard for OmniDev.
 Guides users through provider, model, and mode selection.
 """
 
+import importlib
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 import click
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from omnidev.context.indexer import FileIndexer
+from omnidev.cli.ui.console import console
+from omnidev.context.indexer import CachedFileIndexer, FileIndexer
 from omnidev.core.config import ConfigManager
 from omnidev.core.logger import get_logger
 from omnidev.models.registry import ProviderRegistry
 
-console = Console()
 logger = get_logger("setup_wizard")
 
+# Provider name -> (module, class) of its implementation, imported on first use
+_PROVIDER_DISPATCH = {
+    "groq": ("omnidev.models.providers.groq", "GroqProvider"),
+    "openai": ("omnidev.models.providers.openai", "OpenAIProvider"),
+    "anthropic": ("omnidev.models.providers.anthropic", "AnthropicProvider"),
+    "google": ("omnidev.models.providers.google", "GoogleProvider"),
+    "openrouter": ("omnidev.models.providers.openrouter", "OpenRouterProvider"),
+}
+
+
+# Models offered for each provider, in menu order
+_MODELS: dict[str, tuple[str, ...]] = {
+    "groq": (
+        "llama-3.3-70b-versatile",
+        "llama-3.1-8b-instant",
+        "mixtral-8x7b-32768",
+        "gemma2-9b-it",
+    ),
+    "openai": ("gpt-4o", "gpt-4-turbo", "gpt-4o-mini", "gpt-3.5-turbo"),
+    "anthropic": ("claude-sonnet-4", "claude-opus-4", "claude-haiku-4"),
+    "google": ("gemini-2.0-flash", "gemini-2.5-pro", "gemini-pro"),
+    # OpenRouter has many models, show common ones
+    "openrouter": (
+        "openai/gpt-4o",
+        "anthropic/claude-sonnet-4",
+        "google/gemini-2.0-flash",
+        "mistralai/mistral-large",
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _load_provider_cls(name: str) -> type:
+    """Import and return the provider class for a provider name.
+
+    Args:
+        name: Provider name (a key of _PROVIDER_DISPATCH).
+
+    Returns:
+        Provider class.
+    """
+    module_name, class_name = _PROVIDER_DISPATCH[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _prompt_int_range(label: str, low: int, high: int, default: int = 1) -> int:
+    """Prompt for a number in a range, rejecting other input in place.
+
+    Invalid input is flagged under the prompt line instead of reprinting
+    the prompt, and the default is pre-filled so Enter accepts it.
+
+    Args:
+        label: Prompt text.
+        low: Smallest accepted number.
+        high: Largest accepted number.
+        default: Number pre-filled in the input.
+
+    Returns:
+        The number entered.
+
+    Raises:
+        click.Abort: If the prompt is cancelled with Ctrl+C or Ctrl+D.
+    """
+    from prompt_toolkit import prompt
+    from prompt_toolkit.validation import Validator
+
+    validator = Validator.from_callable(
+        lambda text: text.strip().isdecimal() and low <= int(text) <= high,
+        error_message=f"Enter a number from {low} to {high}",
+        move_cursor_to_end=True,
+    )
+    try:
+        answer = prompt(
+            f"{label}: ",
+            validator=validator,
+            validate_while_typing=False,
+            default=str(default),
+        )
+    except (KeyboardInterrupt, EOFError):
+        raise click.Abort() from None
+    return int(answer)
+
 
 class SetupWizard:
     """Interactive setup wizard for OmniDev configuration."""
@@ -53,6 +135,17 @@ class SetupWizard:
         },
     }
 
+    # Menu order of PROVIDERS; choice N selects entry N - 1
+    _PROVIDER_OPTIONS = tuple(PROVIDERS)
+
+    # Provider menu entries as (numbered name, description) around the API key badge
+    _PROVIDER_MENU = tuple(
+        (f"  {idx}. {info['name']}", f"\n     {info['description']}\n")
+        for idx, info in enumerate(PROVIDERS.values(), 1)
+    )
+    _KEY_CONFIGURED = " [green](API key configured)[/green]"
+    _KEY_NEEDED = " [yellow](API key needed)[/yellow]"
+
     # Available modes
     MODES = {
         "auto": {
@@ -73,6 +166,15 @@ class SetupWizard:
         },
     }
 
+    # Menu order of MODES; choice N selects entry N - 1
+    _MODE_OPTIONS = tuple(MODES)
+
+    # The mode menu has no per-run content, so it is rendered once
+    _MODE_MENU = "\n".join(
+        f"  {idx}. {info['name']}\n     {info['description']}\n"
+        for idx, info in enumerate(MODES.values(), 1)
+    )
+
     def __init__(self, config: ConfigManager, project_root: Path) -> None:
         """Initialize setup wizard.
 
@@ -89,21 +191,28 @@ class SetupWizard:
 
         Returns:
             Dictionary with selected provider, model, and mode.
+
+        Raises:
+            click.Abort: If the user cancels any step with Ctrl+C or Ctrl+D.
         """
         console.print("\n[bold cyan]OmniDev Setup Wizard[/bold cyan]")
         console.print("=" * 60)
 
-        # Step 1: Index files
-        files_indexed = self._index_files()
+        try:
+            # Step 1: Index files
+            files_indexed = self._index_files()
 
-        # Step 2: Select provider
-        provider = self._select_provider()
+            # Step 2: Select provider
+            provider = self._select_provider()
 
-        # Step 3: Select model
-        model = self._select_model(provider)
+            # Step 3: Select model
+            model = self._select_model(provider)
 
-        # Step 4: Select mode
-        mode = self._select_mode()
+            # Step 4: Select mode
+            mode = self._select_mode()
+        except (KeyboardInterrupt, click.Abort):
+            console.print("\n[yellow]Setup cancelled.[/yellow]")
+            raise click.Abort() from None
 
         # Step 5: Save configuration
         self._save_configuration(provider, model, mode)
@@ -127,21 +236,32 @@ class SetupWizard:
         Returns:
             Number of files indexed.
         """
+        from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+
         console.print("\n[bold]Step 1: Indexing Project Files[/bold]")
         console.print("Scanning project structure...\n")
 
         try:
-            indexer = FileIndexer(self.project_root)
+            # Unchanged files reuse metadata cached by earlier wizard runs
+            indexer = CachedFileIndexer(FileIndexer(self.project_root))
             
+            # The bar fills as files are indexed and is cleared when done
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                MofNCompleteColumn(),
                 console=console,
+                transient=True,
+                refresh_per_second=4,
             ) as progress:
                 task = progress.add_task("Indexing files...", total=None)
                 
-                index = indexer.index_project()
-                progress.update(task, completed=True)
+                index = indexer.index_project(
+                    on_progress=lambda done, total: progress.update(
+                        task, completed=done, total=total
+                    )
+                )
 
             files_count = len(index)
             console.print(f"[green]✓[/green] Indexed {files_count} files")
@@ -160,106 +280,64 @@ class SetupWizard:
         console.print("\n[bold]Step 2: Select AI Provider[/bold]")
         console.print("Choose which provider you want to use for code generation:\n")
 
-        # Show available providers
-        provider_options = []
-        for idx, (key, info) in enumerate(self.PROVIDERS.items(), 1):
-            api_key_status = ""
-            if info["requires_api_key"]:
-                api_key = self.config.get_api_key(key)
-                if api_key:
-                    api_key_status = " [green](API key configured)[/green]"
-                else:
-                    api_key_status = " [yellow](API key needed)[/yellow]"
-            
-            console.print(f"  {idx}. {info['name']}{api_key_status}")
-            console.print(f"     {info['description']}\n")
-            provider_options.append(key)
-
-        # Get user selection
+        # Look each key up once; keyring and .env reads are not free
+        api_keys = {key: self.config.get_api_key(key) for key in self.PROVIDERS}
+
+        # Show available providers, rendered as one block; only the badges vary
+        provider_options = self._PROVIDER_OPTIONS
+        api_key_statuses = [
+            (self._KEY_CONFIGURED if api_keys[key] else self._KEY_NEEDED)
+            if info["requires_api_key"]
+            else ""
+            for key, info in self.PROVIDERS.items()
+        ]
+        console.print("\n".join(
+            f"{head}{status}{tail}"
+            for (head, tail), status in zip(self._PROVIDER_MENU, api_key_statuses)
+        ))
+
+        # Get user selection; only a missing API key sends the user back here
         while True:
-            try:
-                choice = click.prompt(
-                    "Select provider (1-5)",
-                    type=click.IntRange(1, len(provider_options)),
-                    default=1,
-                )
-                selected_provider = provider_options[choice - 1]
-                
-                # Check if API key is needed
-                provider_info = self.PROVIDERS[selected_provider]
-                if provider_info["requires_api_key"]:
-                    api_key = self.config.get_api_key(selected_provider)
-                    if not api_key:
-                        console.print(f"\n[yellow]⚠[/yellow] {provider_info['name']} requires an API key.")
-                        if click.confirm("Do you want to configure it now?"):
-                            api_key = click.prompt(
-                                f"Enter your {provider_info['name']} API key",
-                                type=str,
-                                hide_input=True,
-                            )
-                            if api_key:
-                                self.config.set_api_key(selected_provider, api_key)
-                                console.print("[green]✓[/green] API key saved")
-                            else:
-                                console.print("[red]API key cannot be empty[/red]")
-                                continue
-                        else:
-                            console.print("[yellow]Skipping API key configuration. You can set it later with:[/yellow]")
-                            console.print(f"[dim]omnidev config add-key {selected_provider} YOUR_API_KEY[/dim]\n")
-                            if not click.confirm("Continue without API key?"):
-                                continue
-                
-                # Register provider with priority 0 (highest) since it's being selected as primary
-                if selected_provider == "groq":
-                    api_key = self.config.get_api_key("groq")
-                    if api_key:
-                        from omnidev.models.providers.groq import GroqProvider
-                        self.provider_registry.register_provider_lazy(
-                            "groq",
-                            lambda: GroqProvider(api_key=api_key),
-                            priority=0,
-                        )
-                elif selected_provider == "openai":
-                    api_key = self.config.get_api_key("openai")
-                    if api_key:
-                        from omnidev.models.providers.openai import OpenAIProvider
-                        self.provider_registry.register_provider_lazy(
-                            "openai",
-                            lambda: OpenAIProvider(api_key=api_key),
-                            priority=0,  # Primary provider gets highest priority
-                        )
-                elif selected_provider == "anthropic":
-                    api_key = self.config.get_api_key("anthropic")
-                    if api_key:
-                        from omnidev.models.providers.anthropic import AnthropicProvider
-                        self.provider_registry.register_provider_lazy(
-                            "anthropic",
-                            lambda: AnthropicProvider(api_key=api_key),
-                            priority=0,
-                        )
-                elif selected_provider == "google":
-                    api_key = self.config.get_api_key("google")
-                    if api_key:
-                        from omnidev.models.providers.google import GoogleProvider
-                        self.provider_registry.register_provider_lazy(
-                            "google",
-                            lambda: GoogleProvider(api_key=api_key),
-                            priority=0,
-                        )
-                elif selected_provider == "openrouter":
-                    api_key = self.config.get_api_key("openrouter")
-                    if api_key:
-                        from omnidev.models.providers.openrouter import OpenRouterProvider
-                        self.provider_registry.register_provider_lazy(
-                            "openrouter",
-                            lambda: OpenRouterProvider(api_key=api_key),
-                            priority=0,
+            choice = _prompt_int_range(
+                f"Select provider (1-{len(provider_options)})", 1, len(provider_options)
+            )
+            selected_provider = provider_options[choice - 1]
+            
+            # Check if API key is needed
+            provider_info = self.PROVIDERS[selected_provider]
+            api_key = api_keys[selected_provider]
+            if provider_info["requires_api_key"]:
+                if not api_key:
+                    console.print(f"\n[yellow]⚠[/yellow] {provider_info['name']} requires an API key.")
+                    if click.confirm("Do you want to configure it now?"):
+                        api_key = click.prompt(
+                            f"Enter your {provider_info['name']} API key",
+                            type=str,
+                            hide_input=True,
                         )
-                
-                return selected_provider
-            except (ValueError, click.Abort):
-                console.print("[red]Invalid selection. Please try again.[/red]\n")
-                continue
+                        if api_key:
+                            self.config.set_api_key(selected_provider, api_key)
+                            api_keys[selected_provider] = api_key
+                            console.print("[green]✓[/green] API key saved")
+                        else:
+                            console.print("[red]API key cannot be empty[/red]")
+                            continue
+                    else:
+                        console.print("[yellow]Skipping API key configuration. You can set it later with:[/yellow]")
+                        console.print(f"[dim]omnidev config add-key {selected_provider} YOUR_API_KEY[/dim]\n")
+                        if not click.confirm("Continue without API key?"):
+                            continue
+            
+            # Register provider with priority 0 (highest) since it's being selected as primary
+            if api_key and selected_provider in _PROVIDER_DISPATCH:
+                # Importing inside the factory lets the registry log a missing optional SDK
+                self.provider_registry.register_provider_lazy(
+                    selected_provider,
+                    lambda: _load_provider_cls(selected_provider)(api_key=api_key),
+                    priority=0,
+                )
+            
+            return selected_provider
 
     def _select_model(self, provider: str) -> str:
         """Select model from provider.
@@ -285,52 +363,21 @@ class SetupWizard:
             console.print(f"  {idx}. {model}")
 
         # Get user selection
-        while True:
-            try:
-                choice = click.prompt(
-                    f"Select model (1-{len(models)})",
-                    type=click.IntRange(1, len(models)),
-                    default=1,
-                )
-                selected_model = models[choice - 1]
-                console.print(f"[green]✓[/green] Selected: {selected_model}")
-                return selected_model
-            except (ValueError, click.Abort):
-                console.print("[red]Invalid selection. Please try again.[/red]\n")
-                continue
-
-    def _get_provider_models(self, provider: str) -> list[str]:
+        choice = _prompt_int_range(f"Select model (1-{len(models)})", 1, len(models))
+        selected_model = models[choice - 1]
+        console.print(f"[green]✓[/green] Selected: {selected_model}")
+        return selected_model
+
+    def _get_provider_models(self, provider: str) -> tuple[str, ...]:
         """Get available models for a provider.
 
         Args:
             provider: Provider name.
 
         Returns:
-            List of available model names.
+            Available model names; empty for unknown providers.
         """
-        if provider == "groq":
-            return [
-                "llama-3.3-70b-versatile",
-                "llama-3.1-8b-instant",
-                "mixtral-8x7b-32768",
-                "gemma2-9b-it",
-            ]
-        elif provider == "openai":
-            return ["gpt-4o", "gpt-4-turbo", "gpt-4o-mini", "gpt-3.5-turbo"]
-        elif provider == "anthropic":
-            return ["claude-sonnet-4", "claude-opus-4", "claude-haiku-4"]
-        elif provider == "google":
-            return ["gemini-2.0-flash", "gemini-2.5-pro", "gemini-pro"]
-        elif provider == "openrouter":
-            # OpenRouter has many models, show common ones
-            return [
-                "openai/gpt-4o",
-                "anthropic/claude-sonnet-4",
-                "google/gemini-2.0-flash",
-                "mistralai/mistral-large",
-            ]
-        else:
-            return []
+        return _MODELS.get(provider, ())
 
     def _select_mode(self) -> str:
         """Select operational mode.
@@ -341,27 +388,15 @@ class SetupWizard:
         console.print("\n[bold]Step 4: Select Operational Mode[/bold]")
         console.print("Choose how OmniDev should operate:\n")
 
-        # Show available modes
-        mode_options = []
-        for idx, (key, info) in enumerate(self.MODES.items(), 1):
-            console.print(f"  {idx}. {info['name']}")
-            console.print(f"     {info['description']}\n")
-            mode_options.append(key)
+        # Show available modes, rendered as one block
+        mode_options = self._MODE_OPTIONS
+        console.print(self._MODE_MENU)
 
         # Get user selection
-        while True:
-            try:
-                choice = click.prompt(
-                    "Select mode (1-4)",
-                    type=click.IntRange(1, len(mode_options)),
-                    default=1,
-                )
-                selected_mode = mode_options[choice - 1]
-                console.print(f"[green]✓[/green] Selected: {self.MODES[selected_mode]['name']}")
-                return selected_mode
-            except (ValueError, click.Abort):
-                console.print("[red]Invalid selection. Please try again.[/red]\n")
-                continue
+        choice = _prompt_int_range(f"Select mode (1-{len(mode_options)})", 1, len(mode_options))
+        selected_mode = mode_options[choice - 1]
+        console.print(f"[green]✓[/green] Selected: {self.MODES[selected_mode]['name']}")
+        return selected_mode
 
     def _save_configuration(self, provider: str, model: str, mode: str) -> None:
         """Save configuration to project config.
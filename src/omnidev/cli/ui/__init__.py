@@ -2,17 +2,23 @@
 Rich UI components for OmniDev CLI.
 
 Provides modern, colorful terminal interface components using Rich library.
+
+Components are imported on first access (PEP 562), so importing a submodule
+such as ``omnidev.cli.ui.console`` doesn't load Markdown, Syntax and Progress.
 """
 
-from omnidev.cli.ui.components import (
-    ActionBlock,
-    ErrorPanel,
-    Logo,
-    ProgressIndicator,
-    StatusBar,
-    TipsPanel,
-    WarningPanel,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from omnidev.cli.ui.components import (
+        ActionBlock,
+        ErrorPanel,
+        Logo,
+        ProgressIndicator,
+        StatusBar,
+        TipsPanel,
+        WarningPanel,
+    )
 
 __all__ = [
     "Logo",
@@ -24,3 +30,23 @@ __all__ = [
     "WarningPanel",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    """Import a UI component on first access (PEP 562).
+
+    Args:
+        name: Attribute name being looked up on the package.
+
+    Returns:
+        The requested component.
+
+    Raises:
+        AttributeError: If the name is not a UI component.
+    """
+    if name in __all__:
+        from omnidev.cli.ui import components
+
+        value = getattr(components, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
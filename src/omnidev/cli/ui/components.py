@@ -4,19 +4,51 @@ Rich UI components for OmniDev CLI.
 Provides reusable UI components with Rich library for a modern terminal experience.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
-from rich.console import Console
+from pygments.lexer import Lexer
+from pygments.lexers import get_lexer_by_name
+from pygments.util import ClassNotFound
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.syntax import Syntax
 from rich.text import Text
 
+from omnidev.cli.ui.console import console
 from omnidev.core.exceptions import OmniDevError
 
-console = Console()
+# Startup tagline printed under the logo; it never changes
+_TAGLINE = Text.assemble(
+    ("  Your ", "dim"),
+    ("Multi-Model", "bold bright_blue"),
+    (" AI Development Assistant\n", "dim"),
+)
+
+# Fixed parts of the response header, around the model and provider names
+_RESPONSE_PREFIX = ("Responding with ", "dim")
+_RESPONSE_VIA = (" via ", "dim")
+_RESPONSE_SUFFIX = ("...\n", "dim")
+
+
+@lru_cache(maxsize=None)
+def _get_lexer(name: str) -> Union[Lexer, str]:
+    """Look up a Pygments lexer once per language.
+
+    Args:
+        name: Lexer name or alias (e.g. "python").
+
+    Returns:
+        Lexer instance, or the name itself if Pygments doesn't know it
+        (Syntax then falls back to plain text).
+    """
+    try:
+        # Same options Syntax uses when it resolves a lexer name itself
+        return get_lexer_by_name(name, stripnl=False, ensurenl=True, tabsize=4)
+    except ClassNotFound:
+        return name
 
 
 class Logo:
@@ -32,6 +64,32 @@ class Logo:
   \____/|_| |_| |_|_| |_|_|_____/ \___| \_/  
 """
 
+    # Color gradient from blue to magenta, one color per logo line
+    GRADIENT = (
+        "#00aaff",  # Bright blue
+        "#22aaff",
+        "#4499ff",
+        "#6688ff",
+        "#8877ff",
+        "#aa66ff",  # Magenta
+    )
+
+    # Styled logo, built on first render; the art never changes
+    _cached: Optional[Text] = None
+
+    @classmethod
+    def _build_cached(cls) -> Text:
+        """Build the styled ASCII art logo, with a blank line before and after.
+
+        Returns:
+            Logo text.
+        """
+        cached = Text("\n")
+        for i, line in enumerate(cls.ASCII_ART.strip().split("\n")):
+            color = cls.GRADIENT[i % len(cls.GRADIENT)]
+            cached.append(line + "\n", style=f"bold {color}")
+        return cached
+
     @staticmethod
     def render(compact: bool = False) -> None:
         """Render the OmniDev logo.
@@ -48,50 +106,53 @@ class Logo:
             return
 
         # Render large ASCII art with gradient
-        lines = Logo.ASCII_ART.strip().split("\n")
-        
-        # Color gradient from blue to magenta
-        colors = [
-            "#00aaff",  # Bright blue
-            "#22aaff",
-            "#4499ff",
-            "#6688ff",
-            "#8877ff",
-            "#aa66ff",  # Magenta
-        ]
-        
-        console.print()  # Spacing
-        for i, line in enumerate(lines):
-            color = colors[i % len(colors)]
-            console.print(f"[bold {color}]{line}[/bold {color}]")
-        console.print()  # Spacing
+        if Logo._cached is None:
+            Logo._cached = Logo._build_cached()
+        console.print(Logo._cached)
 
     @staticmethod
     def render_with_tagline() -> None:
         """Render logo with tagline for startup."""
         Logo.render()
-        tagline = Text()
-        tagline.append("  Your ", style="dim")
-        tagline.append("Multi-Model", style="bold bright_blue")
-        tagline.append(" AI Development Assistant\n", style="dim")
-        console.print(tagline)
+        console.print(_TAGLINE)
 
 
 class TipsPanel:
     """Simplified tips display - Gemini CLI style."""
 
+    DEFAULT_TIPS = (
+        "Ask questions, edit files, or run commands",
+        "Be specific for best results",
+        "Use -i or --interactive for chat mode",
+        "Type /help for more commands",
+    )
+
+    # Rendered default tips, built on first use
+    _default_text: Optional[Text] = None
+
     def __init__(self, tips: Optional[list[str]] = None) -> None:
         """Initialize tips panel.
 
         Args:
             tips: List of tip strings. If None, uses default tips.
         """
-        self.tips = tips or [
-            "Ask questions, edit files, or run commands",
-            "Be specific for best results",
-            "Use -i or --interactive for chat mode",
-            "Type /help for more commands",
-        ]
+        self._uses_defaults = not tips
+        self.tips = tips or list(self.DEFAULT_TIPS)
+
+    def _build_text(self) -> Text:
+        """Build the numbered tips list, followed by a blank line.
+
+        Returns:
+            Tips text.
+        """
+        text = Text()
+        text.append("Getting started:\n", style="bold")
+        for i, tip in enumerate(self.tips, 1):
+            text.append("  ")
+            text.append(f"{i}.", style="dim")
+            text.append(" ")
+            text.append(tip + "\n", style="cyan")
+        return text
 
     def render(self, collapsed: bool = False) -> None:
         """Render the tips.
@@ -104,10 +165,13 @@ class TipsPanel:
             return
 
         # Simple numbered list format
-        console.print("[bold]Getting started:[/bold]")
-        for i, tip in enumerate(self.tips, 1):
-            console.print(f"  [dim]{i}.[/dim] [cyan]{tip}[/cyan]")
-        console.print()  # Spacing
+        if not self._uses_defaults:
+            console.print(self._build_text())
+            return
+
+        if TipsPanel._default_text is None:
+            TipsPanel._default_text = self._build_text()
+        console.print(TipsPanel._default_text)
 
 
 class ResponseHeader:
@@ -125,23 +189,28 @@ class ResponseHeader:
 
     def render(self) -> None:
         """Render the response header."""
-        header = Text()
-        header.append("\n")
         if self.provider:
-            header.append(f"Responding with ", style="dim")
-            header.append(f"{self.model}", style="bold bright_blue")
-            header.append(f" via ", style="dim")
-            header.append(f"{self.provider}", style="bright_magenta")
+            header = Text.assemble(
+                "\n",
+                _RESPONSE_PREFIX,
+                (self.model, "bold bright_blue"),
+                _RESPONSE_VIA,
+                (self.provider, "bright_magenta"),
+                _RESPONSE_SUFFIX,
+            )
         else:
-            header.append(f"Responding with ", style="dim")
-            header.append(f"{self.model}", style="bold bright_blue")
-        header.append("...\n", style="dim")
+            header = Text.assemble(
+                "\n", _RESPONSE_PREFIX, (self.model, "bold bright_blue"), _RESPONSE_SUFFIX
+            )
         console.print(header)
 
 
 class ActionBlock:
     """Action block showing file operations with syntax highlighting."""
 
+    # Snippets longer than this many lines get line numbers
+    LINE_NUMBERS_MIN_LINES = 20
+
     def __init__(
         self,
         action: str,
@@ -173,9 +242,9 @@ class ActionBlock:
         if self.content:
             syntax = Syntax(
                 self.content,
-                self.language,
+                _get_lexer(self.language),
                 theme="monokai",
-                line_numbers=True,
+                line_numbers=len(self.content.splitlines()) > self.LINE_NUMBERS_MIN_LINES,
                 word_wrap=True,
             )
             panel = Panel(
@@ -217,20 +286,25 @@ class StatusBar:
         status_parts = []
         
         if self.files_indexed > 0:
-            status_parts.append(f"[cyan]{self.files_indexed} files indexed[/cyan]")
+            status_parts.append((f"{self.files_indexed} files indexed", "cyan"))
         
         if self.providers > 0:
-            status_parts.append(f"[green]{self.providers} providers[/green]")
+            status_parts.append((f"{self.providers} providers", "green"))
         
         if self.mode:
-            status_parts.append(f"[yellow]mode: {self.mode}[/yellow]")
+            status_parts.append((f"mode: {self.mode}", "yellow"))
         
         if self.mcp_servers > 0:
-            status_parts.append(f"[magenta]{self.mcp_servers} MCP servers[/magenta]")
+            status_parts.append((f"{self.mcp_servers} MCP servers", "magenta"))
 
         if status_parts:
-            status_text = " | ".join(status_parts)
-            console.print(f"[dim]{status_text}[/dim]")
+            # Styled spans instead of markup, so nothing is re-parsed on redraw
+            status_text = Text(style="dim")
+            for i, part in enumerate(status_parts):
+                if i:
+                    status_text.append(" | ")
+                status_text.append(*part)
+            console.print(status_text)
 
 
 class ProgressIndicator:
@@ -0,0 +1,16 @@
+"""
+Shared Rich console for OmniDev CLI.
+
+Constructing a Console probes the terminal, so every CLI module prints
+through this single instance.
+
+Automatic highlighting is off: output is styled with explicit markup, and the
+highlighters would otherwise run their regexes over every printed string.
+Pass ``highlight=True`` to a single ``print`` call where it is wanted.
+"""
+
+from rich.console import Console
+
+console = Console(highlight=False)
+
+__all__ = ["console"]
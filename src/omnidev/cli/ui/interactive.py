@@ -5,19 +5,20 @@ Provides full-screen interactive mode with command history, auto-completion,
 and real-time suggestions.
 """
 
+import bisect
+import os
 import sys
+from functools import lru_cache
 from typing import Optional
 
 from prompt_toolkit import PromptSession
 from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
 from prompt_toolkit.completion import Completer, Completion
-from prompt_toolkit.history import FileHistory
+from prompt_toolkit.history import FileHistory, ThreadedHistory
 from prompt_toolkit.key_binding import KeyBindings
-from rich.console import Console
 
 from omnidev.cli.ui.components import Logo, TipsPanel
-
-console = Console()
+from omnidev.cli.ui.console import console
 
 
 class OmniDevCompleter(Completer):
@@ -30,6 +31,8 @@ class OmniDevCompleter(Completer):
             commands: List of available commands.
         """
         self.commands = commands
+        # Kept sorted so prefix matches are found by bisection
+        self._sorted = sorted(commands)
 
     def get_completions(self, document, complete_event) -> None:
         """Get completions for current input.
@@ -39,17 +42,32 @@ class OmniDevCompleter(Completer):
             complete_event: Completion event.
         """
         word = document.get_word_before_cursor()
-        
-        # Slash command completions
-        if document.text.startswith("/"):
-            for cmd in self.commands:
-                if cmd.startswith(word):
-                    yield Completion(cmd, start_position=-len(word))
-        else:
-            # Regular command completions
-            for cmd in self.commands:
-                if cmd.startswith(word):
-                    yield Completion(cmd, start_position=-len(word))
+        start = bisect.bisect_left(self._sorted, word)
+        for cmd in self._sorted[start:]:
+            if not cmd.startswith(word):
+                break
+            yield Completion(cmd, start_position=-len(word))
+
+
+@lru_cache(maxsize=4)
+def _make_session(commands: tuple[str, ...], history_file: str) -> PromptSession:
+    """Create a prompt session, reused when interactive mode is re-entered.
+
+    Args:
+        commands: Commands offered for completion.
+        history_file: Path to the history file, with "~" expanded.
+
+    Returns:
+        PromptSession with file history, completion and suggestions.
+    """
+    # The history file is loaded on a background thread so the first prompt
+    # doesn't wait on disk
+    return PromptSession(
+        history=ThreadedHistory(FileHistory(history_file)),
+        completer=OmniDevCompleter(list(commands)),
+        auto_suggest=AutoSuggestFromHistory(),
+        key_bindings=KeyBindings(),
+    )
 
 
 class InteractiveMode:
@@ -69,22 +87,14 @@ class InteractiveMode:
         self.commands = commands or []
         self.history_file = history_file or "~/.omnidev_history"
         
-        # Setup history
-        self.history = FileHistory(self.history_file)
-        
-        # Setup completer
-        self.completer = OmniDevCompleter(self.commands)
-        
-        # Setup key bindings
-        self.bindings = KeyBindings()
-        
-        # Create prompt session
-        self.session = PromptSession(
-            history=self.history,
-            completer=self.completer,
-            auto_suggest=AutoSuggestFromHistory(),
-            key_bindings=self.bindings,
+        # Sessions are shared across instances with the same commands and
+        # history file, so re-entering interactive mode skips terminal setup
+        self.session = _make_session(
+            tuple(self.commands), os.path.expanduser(self.history_file)
         )
+        self.history = self.session.history
+        self.completer = self.session.completer
+        self.bindings = self.session.key_bindings
 
     def show_welcome(self) -> None:
         """Show welcome screen."""
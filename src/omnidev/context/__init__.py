@@ -1,11 +1,12 @@
 """Context management layer for OmniDev."""
 
 from omnidev.context.builder import ContextBuilder
-from omnidev.context.indexer import FileIndexer, FileMetadata
+from omnidev.context.indexer import CachedFileIndexer, FileIndexer, FileMetadata
 from omnidev.context.manager import ContextManager
 from omnidev.context.scorer import RelevanceScorer, RelevanceScore
 
 __all__ = [
+    "CachedFileIndexer",
     "ContextBuilder",
     "ContextManager",
     "FileIndexer",
@@ -6,7 +6,13 @@ and maintains an index for efficient context selection.
 """
 
 import ast
+import hashlib
+import json
+import os
 import re
+import tempfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional
 
@@ -127,6 +133,9 @@ class FileIndexer:
     def index_project(self) -> dict[Path, FileMetadata]:
         """Index all files in the project.
 
+        Files come from iter_files, so entries are classified from the
+        directory listing itself rather than by separate stat calls per path.
+
         Returns:
             Dictionary mapping file paths to metadata.
 
@@ -135,34 +144,43 @@ class FileIndexer:
         """
         try:
             self.index.clear()
-            self._index_directory(self.project_root)
+            for entry in self.iter_files():
+                file_path = Path(entry.path)
+                try:
+                    metadata = self.parse_one(file_path, entry.stat(follow_symlinks=False))
+                    if metadata:
+                        self.index[file_path] = metadata
+                except Exception as e:
+                    self.logger.debug(f"Failed to index {file_path}: {e}")
             self.logger.info(f"Indexed {len(self.index)} files in project")
             return self.index.copy()
         except Exception as e:
             raise ContextError(f"Failed to index project: {e}") from e
 
-    def _index_directory(self, directory: Path) -> None:
-        """Recursively index files in a directory.
+    def iter_files(self) -> Iterator[os.DirEntry[str]]:
+        """Walk the project with os.scandir, yielding regular files not excluded.
 
-        Args:
-            directory: Directory to index.
+        Directory entries carry their type, so files and directories are told
+        apart without extra syscalls. Symlinks are skipped, which also keeps
+        the walk from following link cycles.
+
+        Yields:
+            DirEntry for each file to index.
         """
-        try:
-            for item in directory.iterdir():
-                if self._should_exclude(item):
-                    continue
-
-                if item.is_file():
-                    try:
-                        metadata = self._extract_metadata(item)
-                        if metadata:
-                            self.index[item] = metadata
-                    except Exception as e:
-                        self.logger.debug(f"Failed to index {item}: {e}")
-                elif item.is_dir():
-                    self._index_directory(item)
-        except PermissionError:
-            self.logger.warning(f"Permission denied accessing {directory}")
+        pending = [str(self.project_root)]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_symlink() or self._is_excluded(entry.name, entry.path):
+                            continue
+                        if entry.is_file(follow_symlinks=False):
+                            yield entry
+                        elif entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+            except PermissionError:
+                self.logger.warning(f"Permission denied accessing {directory}")
 
     def _should_exclude(self, path: Path) -> bool:
         """Check if a path should be excluded.
@@ -170,36 +188,52 @@ class FileIndexer:
         Args:
             path: Path to check.
 
+        Returns:
+            True if path should be excluded, False otherwise.
+        """
+        return self._is_excluded(path.name, str(path))
+
+    def _is_excluded(self, name: str, path: str) -> bool:
+        """Check if a path should be excluded, given its name and full path string.
+
+        Args:
+            name: Final path component.
+            path: Full path as a string.
+
         Returns:
             True if path should be excluded, False otherwise.
         """
         # Check exact matches
-        if path.name in self.exclude_patterns:
+        if name in self.exclude_patterns:
             return True
 
         # Check patterns
+        suffix = os.path.splitext(name)[1]
         for pattern in self.exclude_patterns:
             if pattern.startswith("*."):
                 # Extension pattern
-                if path.suffix == pattern[1:]:
+                if suffix == pattern[1:]:
                     return True
-            elif pattern in str(path):
+            elif pattern in path:
                 # Substring match
                 return True
 
         return False
 
-    def _extract_metadata(self, file_path: Path) -> Optional[FileMetadata]:
+    def parse_one(
+        self, file_path: Path, stat_result: Optional[os.stat_result] = None
+    ) -> Optional[FileMetadata]:
         """Extract metadata from a file.
 
         Args:
             file_path: Path to the file.
+            stat_result: Optional stat result already obtained for the file.
 
         Returns:
             FileMetadata if file is processable, None otherwise.
         """
         try:
-            stat = file_path.stat()
+            stat = stat_result if stat_result is not None else file_path.stat()
             language = self._detect_language(file_path)
             imports: list[str] = []
             exports: list[str] = []
@@ -372,7 +406,212 @@ class FileIndexer:
             file_path: Path to the file to update.
         """
         if file_path.exists() and not self._should_exclude(file_path):
-            metadata = self._extract_metadata(file_path)
+            metadata = self.parse_one(file_path)
             if metadata:
                 self.index[file_path] = metadata
 
+
+def _hash_file(path: str) -> str:
+    """Hash a file's contents.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Hex digest of the contents.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class CachedFileIndexer:
+    """Wraps a FileIndexer with an on-disk cache of per-file metadata.
+
+    Files whose modification time and size are unchanged since the last run
+    reuse their cached metadata. When either differs, the content hash
+    decides whether the file actually needs parsing again. Files that could
+    not be parsed are cached too, as skip records, so they are not retried
+    until they change.
+    """
+
+    # Bump when the cache layout changes; older caches are discarded
+    CACHE_VERSION = 3
+
+    # Files are hashed and parsed concurrently; the work is mostly file I/O
+    MAX_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+    # Progress is reported every this many files, so callers redraw sparingly
+    PROGRESS_BATCH = 64
+
+    def __init__(self, indexer: FileIndexer, cache_path: Optional[Path] = None) -> None:
+        """Initialize the cached indexer.
+
+        Args:
+            indexer: FileIndexer that walks and parses the project.
+            cache_path: Optional cache file location. Defaults to
+                .omnidev/cache/index.json under the project root.
+        """
+        self.indexer = indexer
+        self.cache_path = cache_path or indexer.project_root / ".omnidev" / "cache" / "index.json"
+        self.logger = get_logger("indexer")
+
+    def index_project(
+        self, on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> dict[Path, FileMetadata]:
+        """Index all files in the project, reusing cached metadata where possible.
+
+        Args:
+            on_progress: Optional callback invoked with (files done, total
+                files) once the project has been scanned, then after every
+                PROGRESS_BATCH files and after the last one.
+
+        Returns:
+            Dictionary mapping file paths to metadata.
+
+        Raises:
+            ContextError: If indexing fails.
+        """
+        try:
+            cached = self._load()
+            records: dict[str, list[Any]] = {}
+            index = self.indexer.index
+            index.clear()
+            dirty = False
+            parsed = 0
+
+            entries = list(self.indexer.iter_files())
+            total = len(entries)
+            if on_progress:
+                on_progress(0, total)
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                results = executor.map(lambda entry: self._index_entry(entry, cached), entries)
+                for done, result in enumerate(results, 1):
+                    if on_progress and (done % self.PROGRESS_BATCH == 0 or done == total):
+                        on_progress(done, total)
+                    if result is None:
+                        continue
+                    file_path, relative, record, changed, reparsed = result
+                    dirty = dirty or changed
+                    parsed += reparsed
+                    records[relative] = record
+                    if record[7]:
+                        # Skip record for a file that failed to parse
+                        continue
+                    index[file_path] = FileMetadata(
+                        file_path=file_path,
+                        size=record[1],
+                        language=record[3],
+                        imports=list(record[4]),
+                        exports=list(record[5]),
+                        last_modified=record[6],
+                    )
+
+            # Deleted files drop out because only files seen this run are kept
+            if dirty or len(records) != len(cached):
+                self._save(records)
+            self.logger.info(f"Indexed {len(index)} files in project ({parsed} parsed)")
+            return index.copy()
+        except Exception as e:
+            raise ContextError(f"Failed to index project: {e}") from e
+
+    def _index_entry(
+        self, entry: os.DirEntry[str], cached: dict[str, list[Any]]
+    ) -> Optional[tuple[Path, str, list[Any], bool, bool]]:
+        """Build the cache record for one file, parsing it only if its content changed.
+
+        Runs on worker threads; reads ``cached`` but never modifies it.
+
+        Records are lists of [mtime_ns, size, digest, language, imports,
+        exports, mtime, skip]. ``skip`` marks a file that failed to parse;
+        it stays out of the index but is not parsed again while unchanged.
+
+        Args:
+            entry: Directory entry of the file.
+            cached: Records loaded from the cache file.
+
+        Returns:
+            Tuple of (file path, relative path, record, record changed, file
+            parsed), or None if the file could not be stat'ed or hashed.
+        """
+        file_path = Path(entry.path)
+        relative = os.path.relpath(entry.path, self.indexer.project_root)
+        try:
+            stat = entry.stat(follow_symlinks=False)
+            record = cached.get(relative)
+            if record is not None and record[0] == stat.st_mtime_ns and record[1] == stat.st_size:
+                return file_path, relative, record, False, False
+
+            digest = _hash_file(entry.path)
+            if record is not None and record[2] == digest:
+                # Touched but unchanged; keep the parsed metadata
+                record = [
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    digest,
+                    *record[3:6],
+                    stat.st_mtime,
+                    record[7],
+                ]
+                return file_path, relative, record, True, False
+        except Exception as e:
+            self.logger.debug(f"Failed to index {file_path}: {e}")
+            return None
+
+        try:
+            metadata = self.indexer.parse_one(file_path, stat)
+        except Exception as e:
+            self.logger.debug(f"Failed to parse {file_path}: {e}")
+            metadata = None
+        if metadata is None:
+            record = [stat.st_mtime_ns, stat.st_size, digest, None, [], [], stat.st_mtime, True]
+        else:
+            record = [
+                stat.st_mtime_ns,
+                stat.st_size,
+                digest,
+                metadata.language,
+                metadata.imports,
+                metadata.exports,
+                stat.st_mtime,
+                False,
+            ]
+        return file_path, relative, record, True, True
+
+    def _load(self) -> dict[str, list[Any]]:
+        """Load cached records, discarding caches from other versions.
+
+        Returns:
+            Records keyed by path relative to the project root.
+        """
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.CACHE_VERSION:
+            return {}
+        files = data.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def _save(self, records: dict[str, list[Any]]) -> None:
+        """Write cached records, replacing the previous cache file atomically.
+
+        Args:
+            records: Records keyed by path relative to the project root.
+        """
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(
+                dir=self.cache_path.parent, prefix=f".{self.cache_path.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"version": self.CACHE_VERSION, "files": records}, f)
+                os.replace(temp_name, self.cache_path)
+            except BaseException:
+                os.unlink(temp_name)
+                raise
+        except OSError as e:
+            self.logger.debug(f"Failed to write index cache {self.cache_path}: {e}")
@@ -112,6 +112,22 @@ class ProjectConfig(BaseModel):
     mode: ModeConfig = Field(default_factory=ModeConfig, description="Mode configuration")
 
 
+def _file_signature(path: Path) -> Optional[tuple[int, int]]:
+    """Get a cheap change marker for a config file.
+
+    Args:
+        path: File path.
+
+    Returns:
+        (mtime in ns, size) tuple, or None if the file does not exist.
+    """
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 class ConfigManager:
     """Manages configuration for OmniDev.
 
@@ -138,6 +154,8 @@ class ConfigManager:
         self._global_config: Optional[ProjectConfig] = None
         self._project_config: Optional[ProjectConfig] = None
         self._merged_config: Optional[ProjectConfig] = None
+        # Signatures of the global and project config files at the last load
+        self._loaded_signature: Optional[tuple[Any, Any]] = None
         
         # Load .env file from project root if it exists
         self._load_env_file()
@@ -145,16 +163,27 @@ class ConfigManager:
     def load(self) -> ProjectConfig:
         """Load and merge global and project configurations.
 
+        Files are only re-read when their modification time or size changed
+        since the last load.
+
         Returns:
             Merged configuration with project config taking precedence.
 
         Raises:
             ConfigurationError: If configuration loading fails.
         """
+        signature = (
+            _file_signature(self.GLOBAL_CONFIG_FILE),
+            _file_signature(self.project_root / self.PROJECT_CONFIG_FILE),
+        )
+        if self._merged_config is not None and signature == self._loaded_signature:
+            return self._merged_config
+
         try:
             self._global_config = self._load_global_config()
             self._project_config = self._load_project_config()
             self._merged_config = self._merge_configs()
+            self._loaded_signature = signature
             return self._merged_config
         except Exception as e:
             raise ConfigurationError(f"Failed to load configuration: {e}") from e
@@ -258,6 +287,8 @@ class ConfigManager:
             self.GLOBAL_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
             with open(self.GLOBAL_CONFIG_FILE, "w", encoding="utf-8") as f:
                 yaml.dump(config.model_dump(exclude_none=True), f, default_flow_style=False, sort_keys=False)
+            # The rewrite may land within the filesystem's mtime resolution
+            self._loaded_signature = None
         except Exception as e:
             raise ConfigurationError(f"Failed to save global config: {e}") from e
 
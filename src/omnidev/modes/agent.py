@@ -129,32 +129,34 @@ class AgentMode(BaseMode):
             "errors": [],
         }
 
-        for operation in operations:
-            op_type = operation.get("type")
-            file_path_str = operation.get("path")
-
-            if not file_path_str:
-                continue
-
-            try:
-                file_path = Path(file_path_str)
-                if not file_path.is_absolute():
-                    file_path = self.project_root / file_path
-
-                if op_type == "create":
-                    # For now, create empty file (in full implementation, would generate content)
-                    content = f"# Generated by OmniDev\n# Query: {query}\n\n"
-                    created = self.create_file_safe(file_path, content)
-                    results["files_created"].append(str(created))
-                elif op_type == "modify":
-                    # Read existing content and modify (simplified)
-                    if file_path.exists():
-                        existing = self.file_ops.read_file(file_path)
-                        # In full implementation, would use AI to modify content
-                        updated = self.update_file_safe(file_path, existing)
-                        results["files_modified"].append(str(updated))
-            except Exception as e:
-                results["errors"].append(f"{op_type} {file_path_str}: {e}")
+        # Operations share parent directories, so validation reuses stat results
+        with self.file_ops.batch():
+            for operation in operations:
+                op_type = operation.get("type")
+                file_path_str = operation.get("path")
+
+                if not file_path_str:
+                    continue
+
+                try:
+                    file_path = Path(file_path_str)
+                    if not file_path.is_absolute():
+                        file_path = self.project_root / file_path
+
+                    if op_type == "create":
+                        # For now, create empty file (in full implementation, would generate content)
+                        content = f"# Generated by OmniDev\n# Query: {query}\n\n"
+                        created = self.create_file_safe(file_path, content)
+                        results["files_created"].append(str(created))
+                    elif op_type == "modify":
+                        # Read existing content and modify (simplified)
+                        if file_path.exists():
+                            existing = self.file_ops.read_file(file_path)
+                            # In full implementation, would use AI to modify content
+                            updated = self.update_file_safe(file_path, existing)
+                            results["files_modified"].append(str(updated))
+                except Exception as e:
+                    results["errors"].append(f"{op_type} {file_path_str}: {e}")
 
         return results
 
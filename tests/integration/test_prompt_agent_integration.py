@@ -84,9 +84,9 @@ class TestPromptAgentIntegration:
             
             FileProcessingAgent(mock_config, project_root)
             
-            # Verify prompt_name was passed
-            call_kwargs = mock_base_init.call_args[1]
-            assert call_kwargs["prompt_name"] == "file_agent"
+            # Verify the prompt name is declared for the base class to pick up
+            mock_base_init.assert_called_once_with(mock_config)
+            assert FileProcessingAgent.PROMPT_NAME == "file_agent"
 
     def test_prompt_loader_integration(self, mock_config: ConfigManager) -> None:
         """Test PromptLoader integration with agents.
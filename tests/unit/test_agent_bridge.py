@@ -0,0 +1,64 @@
+"""Unit tests for CLIAgentBridge."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from omnidev.cli.agent_bridge import CLIAgentBridge
+
+
+class TestCLIAgentBridge:
+    """Test cases for CLIAgentBridge."""
+
+    @pytest.fixture
+    def bridge(self, tmp_path: Path) -> CLIAgentBridge:
+        """Create a CLIAgentBridge with crews and agent manager mocked out.
+
+        Args:
+            tmp_path: Pytest temporary path fixture.
+
+        Returns:
+            CLIAgentBridge instance.
+        """
+        with patch("omnidev.cli.agent_bridge.AgentManager"), \
+             patch("omnidev.cli.agent_bridge.OmniDevCrews"):
+            bridge = CLIAgentBridge(Mock(), tmp_path, Mock(), Mock())
+        bridge.agent_manager.execute_crew = AsyncMock(return_value="result")
+        return bridge
+
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            ("Create a new module", True),
+            ("please DELETE old logs", True),
+            ("rewrite the README", True),
+            ("list all profiles", True),
+            ("explain this function", False),
+            ("why is it slow?", False),
+            ("", False),
+        ],
+    )
+    def test_is_file_operation(self, bridge: CLIAgentBridge, query: str, expected: bool) -> None:
+        """Test keyword routing matches anywhere in the query, ignoring case.
+
+        Args:
+            bridge: CLIAgentBridge fixture.
+            query: User query.
+            expected: Whether the query should route to file operations.
+        """
+        assert bridge._is_file_operation(query) is expected
+
+    @pytest.mark.asyncio
+    async def test_execute_query_routes_to_crew(self, bridge: CLIAgentBridge) -> None:
+        """Test each query runs the crew its keywords route it to.
+
+        Args:
+            bridge: CLIAgentBridge fixture.
+        """
+        explained = await bridge.execute_query("explain this function")
+        created = await bridge.execute_query("create a file")
+
+        assert explained == {"success": True, "response": "result", "crew": "code_generation"}
+        assert created["crew"] == "file_operations"
+        assert bridge.agent_manager.execute_crew.await_count == 2
@@ -185,3 +185,17 @@ class TestAgentManager:
         assert call_kwargs["param1"] == "value1"
         assert call_kwargs["param2"] == "value2"
 
+    def test_crew_factory_builds_on_first_use(self, agent_manager: AgentManager) -> None:
+        """Test crews registered by factory are built once, when first requested.
+
+        Args:
+            agent_manager: AgentManager fixture.
+        """
+        mock_crew = Mock()
+        factory = Mock(return_value=mock_crew)
+        agent_manager.register_crew_factory("lazy_crew", factory)
+
+        factory.assert_not_called()
+        assert agent_manager.get_crew("lazy_crew") is mock_crew
+        assert agent_manager.get_crew("lazy_crew") is mock_crew
+        factory.assert_called_once()
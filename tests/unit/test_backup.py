@@ -0,0 +1,84 @@
+"""Unit tests for the backup manager."""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from omnidev.actions.backup import BackupManager, _fast_copy
+
+
+class TestBackupManager:
+    """Test cases for BackupManager."""
+
+    def test_create_and_list_backup(self) -> None:
+        """Test that created backups are listed for their file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            manager = BackupManager(project_root)
+            manager.set_session("test")
+
+            file_path = project_root / "src" / "app.py"
+            file_path.parent.mkdir()
+            file_path.write_text("print('hi')")
+
+            backup_path = manager.create_backup(file_path)
+            assert backup_path is not None
+            assert manager.list_backups(file_path) == [backup_path]
+            assert manager.list_backups() == [backup_path]
+
+    def test_restore_round_trips_underscored_paths(self) -> None:
+        """Test that restore recovers paths containing underscores."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir).resolve()
+            manager = BackupManager(project_root)
+            manager.set_session("test")
+
+            file_path = project_root / "my_pkg" / "test_utils.py"
+            file_path.parent.mkdir()
+            file_path.write_text("original")
+
+            backup_path = manager.create_backup(file_path)
+            assert backup_path is not None
+            file_path.unlink()
+
+            restored = manager.restore_backup(backup_path)
+            assert restored == file_path
+            assert restored.read_text() == "original"
+
+    def test_create_backups_preserves_order(self) -> None:
+        """Test bulk backups return results in input order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir).resolve()
+            manager = BackupManager(project_root)
+            manager.set_session("test")
+
+            paths = [project_root / f"file{i}.txt" for i in range(5)]
+            for path in paths:
+                path.write_text(path.name)
+            missing = project_root / "missing.txt"
+
+            backups = manager.create_backups([*paths, missing])
+            assert backups[-1] is None
+            for path, backup_path in zip(paths, backups[:-1]):
+                assert backup_path is not None
+                assert backup_path.read_text() == path.name
+
+    def test_fast_copy_falls_back_when_nothing_copied(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a copy_file_range that copies 0 bytes falls back to a full copy.
+
+        Args:
+            tmp_path: Pytest temporary path fixture.
+            monkeypatch: Pytest monkeypatch fixture.
+        """
+        monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+        src = tmp_path / "src.txt"
+        src.write_text("content")
+        dst = tmp_path / "src.txt.backup"
+
+        _fast_copy(src, dst)
+
+        assert dst.read_text() == "content"
@@ -54,7 +54,7 @@ class TestBaseOmniDevAgent:
                 config=mock_config,
             )
             
-            assert agent.config == mock_config
+            assert agent.omnidev_config == mock_config
             assert agent.agent_model == "mistralai/mistral-7b-instruct"
             mock_agent_init.assert_called_once()
 
@@ -233,5 +233,5 @@ class TestBaseOmniDevAgent:
             from crewai import Agent
             assert isinstance(agent, Agent)
             # Verify config is set
-            assert agent.config == mock_config
+            assert agent.omnidev_config == mock_config
 
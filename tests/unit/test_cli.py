@@ -1,9 +1,12 @@
 """Unit tests for CLI module."""
 
+from unittest.mock import patch
+
+import click
 import pytest
 from click.testing import CliRunner
 
-from omnidev.cli.main import cli_main
+from omnidev.cli.main import _is_fast_run, cli, cli_main
 
 
 class TestCLI:
@@ -30,3 +33,45 @@ class TestCLI:
         assert result.exit_code == 0
         assert "OmniDev" in result.output
 
+    def test_fast_run_detection(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test which arguments bypass the command group."""
+        assert _is_fast_run([])
+        assert _is_fast_run(["explain this code", "--mode", "agent"])
+        assert not _is_fast_run(["config", "list-keys"])
+        assert not _is_fast_run(["--interactive"])
+        assert not _is_fast_run(["query", "--help"])
+
+        monkeypatch.setenv("OMNIDEV_FAST_CLI", "0")
+        assert not _is_fast_run(["explain this code"])
+
+    def test_abort_exits_quietly(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test a cancelled prompt exits with status 1 and no error message."""
+        monkeypatch.setattr("sys.argv", ["omnidev", "explain this"])
+        with patch("omnidev.cli.main.run_command.main", side_effect=click.Abort):
+            with pytest.raises(SystemExit) as exc_info:
+                cli()
+
+        assert exc_info.value.code == 1
+        assert "Unexpected error" not in capsys.readouterr().err
+
+    def test_run_async_cancels_pending_tasks(self) -> None:
+        """Test leftover tasks are cancelled and executor work is joined on exit."""
+        import asyncio
+        import threading
+
+        from omnidev.cli.commands import _run_async
+
+        started = threading.Event()
+        pending: list[asyncio.Task] = []
+
+        async def main() -> str:
+            loop = asyncio.get_running_loop()
+            pending.append(asyncio.ensure_future(asyncio.sleep(3600)))
+            loop.run_in_executor(None, started.set)
+            return "done"
+
+        assert _run_async(main()) == "done"
+        assert pending[0].cancelled()
+        assert started.is_set()
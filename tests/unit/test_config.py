@@ -62,6 +62,21 @@ class TestConfigManager:
             loaded = config.load()
             assert loaded.models.default == "claude-sonnet-4"
 
+    def test_load_skips_unchanged_files(self) -> None:
+        """Test that load reuses the parsed config until a file changes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            config = ConfigManager(project_root)
+
+            first = config.load()
+            assert config.load() is first
+
+            project_file = project_root / ".omnidev.yaml"
+            project_file.write_text(yaml.dump({"models": {"default": "gpt-4o-mini"}}))
+            reloaded = config.load()
+            assert reloaded is not first
+            assert reloaded.models.default == "gpt-4o-mini"
+
     def test_api_key_storage(self) -> None:
         """Test API key storage and retrieval."""
         with tempfile.TemporaryDirectory() as tmpdir:
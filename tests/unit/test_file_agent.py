@@ -5,11 +5,14 @@ Tests file operation decisions, safety checks, backup coordination,
 and error scenarios following AGENTS.md guidelines.
 """
 
+import warnings
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
+from omnidev.actions.file_ops import FileOperations
+from omnidev.agents.base import BaseOmniDevAgent
 from omnidev.agents.file_agent import FileProcessingAgent
 from omnidev.core.config import ConfigManager
 from omnidev.core.exceptions import ValidationError
@@ -164,3 +167,47 @@ class TestFileProcessingAgent:
             
             assert agent.project_root == project_root
 
+
+    def test_crewai_config_field_not_shadowed(
+        self, mock_config: ConfigManager, project_root: Path
+    ) -> None:
+        """Test CrewAI's config field keeps its default and the agent dumps cleanly.
+
+        Args:
+            mock_config: Mock ConfigManager fixture.
+            project_root: Project root fixture.
+        """
+        assert FileProcessingAgent.model_fields["config"].default is None
+
+        agent = FileProcessingAgent(mock_config, project_root)
+
+        assert agent.omnidev_config is mock_config
+        assert agent.config is None
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            agent.model_dump()
+
+    def test_agent_state_uses_private_attrs(
+        self, mock_config: ConfigManager, project_root: Path
+    ) -> None:
+        """Test subclass state is kept in Pydantic private storage.
+
+        Args:
+            mock_config: Mock ConfigManager fixture.
+            project_root: Project root fixture.
+        """
+        agent = FileProcessingAgent(mock_config, project_root)
+
+        assert agent.__pydantic_private__["_omnidev_project_root"] == project_root
+        assert isinstance(agent.__pydantic_private__["_omnidev_file_ops"], FileOperations)
+        with pytest.raises(AttributeError):
+            agent._set_private(_omnidev_undeclared=1)
+
+    def test_base_agent_options_are_keyword_only(self, mock_config: ConfigManager) -> None:
+        """Test role and friends cannot be passed positionally after config.
+
+        Args:
+            mock_config: Mock ConfigManager fixture.
+        """
+        with pytest.raises(TypeError):
+            BaseOmniDevAgent(mock_config, "Role", "Goal", "Backstory")
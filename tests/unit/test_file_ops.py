@@ -1,11 +1,14 @@
 """Unit tests for file operations."""
 
+import os
+import stat
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from omnidev.actions.file_ops import FileOperationError, FileOperations
+from omnidev.actions.file_ops import FileOperationError, FileOperations, _read_umask
 from omnidev.core.exceptions import ValidationError
 
 
@@ -84,3 +87,60 @@ class TestFileOperations:
             with pytest.raises(ValidationError):
                 file_ops.create_file(outside_path, "test")
 
+
+    def test_recreate_after_delete(self) -> None:
+        """Test that cached validation results are invalidated by writes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            file_ops = FileOperations(project_root)
+
+            file_path = project_root / "test.txt"
+            file_ops.create_file(file_path, "first")
+            with pytest.raises(ValidationError):
+                file_ops.create_file(file_path, "again")
+
+            file_ops.delete_file(file_path)
+            file_ops.create_file(file_path, "second")
+            assert file_ops.read_file(file_path) == "second"
+
+    def test_external_create_seen_outside_batch(self) -> None:
+        """Test a file created outside OmniDev is not overwritten by a stale check."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            file_ops = FileOperations(project_root)
+
+            file_path = project_root / "user.txt"
+            with pytest.raises(ValidationError):
+                file_ops.read_file(file_path)
+
+            file_path.write_text("user content")
+            with pytest.raises(ValidationError):
+                file_ops.create_file(file_path, "generated", overwrite=False)
+            assert file_path.read_text() == "user content"
+
+    def test_batch_caches_until_exit(self) -> None:
+        """Test stat results are cached only while a batch is open."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_root = Path(tmpdir)
+            file_ops = FileOperations(project_root)
+
+            with file_ops.batch():
+                with file_ops.batch():
+                    file_ops.create_file(project_root / "a.txt", "a")
+                assert file_ops._stat_cache is not None
+            assert file_ops._stat_cache is None
+
+    def test_new_file_mode_follows_umask(self) -> None:
+        """Test new files get 0o666 minus the umask, and reading it leaves it unchanged."""
+        old_umask = os.umask(0o077)
+        try:
+            assert _read_umask() == 0o077
+            assert _read_umask() == 0o077
+
+            with tempfile.TemporaryDirectory() as tmpdir, patch(
+                "omnidev.actions.file_ops._DEFAULT_FILE_MODE", 0o666 & ~_read_umask()
+            ):
+                file_path = FileOperations(Path(tmpdir)).create_file(Path(tmpdir) / "a.txt", "a")
+                assert stat.S_IMODE(file_path.stat().st_mode) == 0o600
+        finally:
+            os.umask(old_umask)
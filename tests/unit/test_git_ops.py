@@ -0,0 +1,57 @@
+"""Unit tests for Git operations."""
+
+from pathlib import Path
+
+import pytest
+
+from omnidev.actions.git_ops import GitOperations
+
+git = pytest.importorskip("git")
+
+
+class TestGitOperations:
+    """Test cases for GitOperations."""
+
+    @pytest.fixture
+    def git_ops(self, tmp_path: Path) -> GitOperations:
+        """Create GitOperations for a fresh repository with one commit.
+
+        Args:
+            tmp_path: Pytest temporary path fixture.
+
+        Returns:
+            GitOperations instance.
+        """
+        repo = git.Repo.init(tmp_path)
+        with repo.config_writer() as writer:
+            writer.set_value("user", "name", "Test")
+            writer.set_value("user", "email", "test@example.com")
+        (tmp_path / "README.md").write_text("hello\n")
+        repo.index.add(["README.md"])
+        repo.index.commit("initial")
+        return GitOperations(tmp_path)
+
+    @pytest.mark.parametrize("branch_name", ["feature", "count", "index"])
+    def test_create_branch(self, git_ops: GitOperations, branch_name: str) -> None:
+        """Test branches are created, including names that clash with list methods.
+
+        Args:
+            git_ops: GitOperations fixture.
+            branch_name: Branch to create.
+        """
+        assert git_ops.create_branch(branch_name) == branch_name
+
+        assert git_ops.get_current_branch() == branch_name
+        assert branch_name in [head.name for head in git_ops.repo.heads]
+
+    def test_create_branch_checks_out_existing(self, git_ops: GitOperations) -> None:
+        """Test an existing branch is checked out instead of recreated.
+
+        Args:
+            git_ops: GitOperations fixture.
+        """
+        original = git_ops.get_current_branch()
+        git_ops.create_branch("count")
+
+        assert git_ops.create_branch(original) == original
+        assert git_ops.get_current_branch() == original
@@ -0,0 +1,147 @@
+"""Unit tests for the file indexer."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from omnidev.context.indexer import CachedFileIndexer, FileIndexer
+
+
+class TestFileIndexer:
+    """Test cases for FileIndexer."""
+
+    def _make_project(self, root: Path) -> None:
+        """Create a small project tree with excluded and nested entries.
+
+        Args:
+            root: Directory to populate.
+        """
+        (root / "pkg" / "sub").mkdir(parents=True)
+        (root / "pkg" / "__pycache__").mkdir()
+        (root / "node_modules").mkdir()
+        (root / "main.py").write_text("import os\n\ndef run():\n    pass\n")
+        (root / "pkg" / "util.js").write_text("export function helper() {}\n")
+        (root / "pkg" / "sub" / "notes.txt").write_text("notes")
+        (root / "pkg" / "mod.pyc").write_bytes(b"")
+        (root / "pkg" / "__pycache__" / "main.cpython.pyc").write_bytes(b"")
+        (root / "node_modules" / "lib.js").write_text("")
+
+    def test_index_project_skips_excluded(self, tmp_path: Path) -> None:
+        """Test excluded directories and patterns are left out of the index.
+
+        Args:
+            tmp_path: Pytest temporary path fixture.
+        """
+        self._make_project(tmp_path)
+
+        index = FileIndexer(tmp_path).index_project()
+
+        assert {path.name for path in index} == {"main.py", "util.js", "notes.txt"}
+        main = index[tmp_path.resolve() / "main.py"]
+        assert main.imports == ["os"]
+        assert main.exports == ["run"]
+
+    def test_index_project_skips_symlinks(self, tmp_path: Path) -> None:
+        """Test symlinked files and directories are not followed.
+
+        Args:
+            tmp_path: Pytest temporary path fixture.
+        """
+        self._make_project(tmp_path)
+        (tmp_path / "loop").symlink_to(tmp_path, target_is_directory=True)
+        (tmp_path / "alias.py").symlink_to(tmp_path / "main.py")
+
+        index = FileIndexer(tmp_path).index_project()
+
+        assert {path.name for path in index} == {"main.py", "util.js", "notes.txt"}
+
+    def test_cached_indexer_reuses_unchanged_files(self, tmp_path: Path) -> None:
+        """Test warm runs parse only changed files and drop deleted ones.
+
+        Args:
+            tmp_path: Pytest temporary path fixture.
+        """
+        self._make_project(tmp_path)
+        indexer = FileIndexer(tmp_path)
+        cold = CachedFileIndexer(indexer).index_project()
+
+        with patch.object(indexer, "parse_one", wraps=indexer.parse_one) as parse:
+            warm = CachedFileIndexer(indexer).index_project()
+            assert parse.call_count == 0
+
+            main = tmp_path / "main.py"
+            main.write_text("import sys\n")
+            os.utime(main, ns=(1, 1))
+            (tmp_path / "pkg" / "sub" / "notes.txt").unlink()
+            updated = CachedFileIndexer(indexer).index_project()
+            assert parse.call_count == 1
+
+        assert set(warm) == set(cold)
+        assert warm[tmp_path.resolve() / "main.py"].exports == ["run"]
+        assert {path.name for path in updated} == {"main.py", "util.js"}
+        assert updated[tmp_path.resolve() / "main.py"].imports == ["sys"]
+
+    def test_cached_indexer_remembers_unparsable_files(self, tmp_path: Path) -> None:
+        """Test a file that fails to parse is left out and not parsed again while unchanged.
+
+        Args:
+            tmp_path: Pytest temporary path fixture.
+        """
+        self._make_project(tmp_path)
+        indexer = FileIndexer(tmp_path)
+        broken = tmp_path.resolve() / "util.js"
+        parse_one = indexer.parse_one
+
+        def fail_on_broken(file_path: Path, *args: object) -> object:
+            return None if file_path == broken else parse_one(file_path, *args)
+
+        with patch.object(indexer, "parse_one", side_effect=fail_on_broken) as parse:
+            cold = CachedFileIndexer(indexer).index_project()
+            assert parse.call_count == 3
+
+            warm = CachedFileIndexer(indexer).index_project()
+            assert parse.call_count == 3
+
+            broken.write_text("export const fixed = 1;\n")
+            os.utime(broken, ns=(1, 1))
+            CachedFileIndexer(indexer).index_project()
+            assert parse.call_count == 4
+
+        assert broken not in cold
+        assert set(warm) == set(cold)
+
+    def test_cached_indexer_reports_progress(self, tmp_path: Path) -> None:
+        """Test progress is reported in batches, from zero up to the scanned total.
+
+        Args:
+            tmp_path: Pytest temporary path fixture.
+        """
+        self._make_project(tmp_path)
+        calls: list[tuple[int, int]] = []
+        indexer = CachedFileIndexer(FileIndexer(tmp_path))
+        indexer.PROGRESS_BATCH = 2
+
+        indexer.index_project(on_progress=lambda done, total: calls.append((done, total)))
+
+        assert calls == [(0, 3), (2, 3), (3, 3)]
+
+    def test_cached_indexer_save_uses_unique_temp_file(self, tmp_path: Path) -> None:
+        """Test the cache is written via a unique temp file that never lingers.
+
+        Args:
+            tmp_path: Pytest temporary path fixture.
+        """
+        self._make_project(tmp_path)
+        cache_path = tmp_path / "cache" / "index.json"
+        (tmp_path / "cache").mkdir()
+        (tmp_path / "cache" / "index.tmp").write_text("other run")
+        indexer = CachedFileIndexer(FileIndexer(tmp_path), cache_path=cache_path)
+
+        indexer.index_project()
+        assert sorted(p.name for p in cache_path.parent.iterdir()) == ["index.json", "index.tmp"]
+
+        (tmp_path / "pkg" / "sub" / "notes.txt").unlink()
+        with patch("omnidev.context.indexer.os.replace", side_effect=OSError("busy")) as replace:
+            indexer.index_project()
+        replace.assert_called_once()
+        assert sorted(p.name for p in cache_path.parent.iterdir()) == ["index.json", "index.tmp"]
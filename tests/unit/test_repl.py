@@ -0,0 +1,107 @@
+"""Unit tests for the interactive REPL."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from omnidev.cli.repl import OmniDevREPL
+
+
+class TestOmniDevREPL:
+    """Test cases for OmniDevREPL."""
+
+    @pytest.fixture
+    def repl(self, tmp_path: Path) -> OmniDevREPL:
+        """Create a REPL with a mocked configuration.
+
+        Args:
+            tmp_path: Pytest temporary path fixture.
+
+        Returns:
+            OmniDevREPL instance.
+        """
+        config = Mock()
+        cfg = config.get_config.return_value
+        cfg.models.preferred = "llama-3.1-8b-instant"
+        cfg.models.fallback = "groq"
+        cfg.mode.default_mode = "auto"
+        return OmniDevREPL(config, tmp_path, AsyncMock())
+
+    def test_bottom_toolbar_cached_until_change(self, repl: OmniDevREPL) -> None:
+        """Test the toolbar is rendered once and rebuilt after a selection.
+
+        Args:
+            repl: OmniDevREPL fixture.
+        """
+        toolbar = repl._get_bottom_toolbar()
+        assert repl._get_bottom_toolbar() is toolbar
+
+        with patch("omnidev.cli.repl.click.prompt", return_value=3):
+            repl._select_mode()
+
+        assert repl.current_mode == "planning"
+        updated = repl._get_bottom_toolbar()
+        assert updated is not toolbar
+        assert "planning" in updated.value
+
+    def test_slash_command_dispatch(self, repl: OmniDevREPL) -> None:
+        """Test slash commands dispatch case-insensitively and exit cleanly.
+
+        Args:
+            repl: OmniDevREPL fixture.
+        """
+        repl.conversation.append({"role": "user", "content": "hi"})
+
+        assert repl._handle_slash_command("/RESET now") == "✓ Conversation history cleared"
+        assert not repl.conversation
+        assert "Unknown command: /nope" in repl._handle_slash_command("/nope")
+        assert repl._handle_slash_command("/quit") is None
+        assert repl._running is False
+
+    def test_provider_registered_once(self, repl: OmniDevREPL) -> None:
+        """Test saving twice registers an unchanged provider only once.
+
+        Args:
+            repl: OmniDevREPL fixture.
+        """
+        repl.provider_registry = Mock()
+        repl.provider_registry.ensure_provider_registered.return_value = True
+
+        repl._save_config()
+        repl._save_config()
+
+        repl.provider_registry.ensure_provider_registered.assert_called_once_with("groq", priority=0)
+
+
+class TestBackgroundFileHistory:
+    """Test cases for BackgroundFileHistory."""
+
+    def test_entries_written_off_caller_thread(self, tmp_path: Path) -> None:
+        """Test appends run on the writer thread and are flushed in order on close.
+
+        Args:
+            tmp_path: Pytest temporary path fixture.
+        """
+        import threading
+
+        from prompt_toolkit.history import FileHistory
+
+        from omnidev.cli.history import BackgroundFileHistory
+
+        history_file = tmp_path / "history"
+        history = BackgroundFileHistory(str(history_file))
+        writer_threads = []
+        original = FileHistory.store_string
+
+        def record_thread(self: FileHistory, string: str) -> None:
+            writer_threads.append(threading.current_thread())
+            original(self, string)
+
+        with patch.object(FileHistory, "store_string", record_thread):
+            history.store_string("first")
+            history.store_string("second")
+            history.close()
+
+        assert threading.current_thread() not in writer_threads
+        assert list(FileHistory(str(history_file)).load_history_strings()) == ["second", "first"]
@@ -42,13 +42,7 @@ class TestSetupAgent:
         Returns:
             SetupAgent instance.
         """
-        with patch("omnidev.agents.setup_agent.BaseOmniDevAgent.__init__") as mock_init:
-            # Mock the parent __init__ to not call super
-            mock_init.return_value = None
-            agent = SetupAgent.__new__(SetupAgent)  # Create without calling __init__
-            # Manually set attributes for testing
-            agent.config = mock_config
-            return agent
+        return SetupAgent(mock_config)
 
     def test_agent_initialization(self, mock_config: ConfigManager) -> None:
         """Test SetupAgent initialization.
@@ -56,12 +50,9 @@ class TestSetupAgent:
         Args:
             mock_config: Mock ConfigManager fixture.
         """
-        with patch("omnidev.agents.setup_agent.BaseOmniDevAgent.__init__") as mock_init:
-            mock_init.return_value = None
-            agent = SetupAgent.__new__(SetupAgent)
-            agent.config = mock_config
-            
-            assert agent.config == mock_config
+        agent = SetupAgent(mock_config)
+
+        assert agent.omnidev_config == mock_config
 
     def test_run_setup_wizard_returns_structure(self, setup_agent: SetupAgent) -> None:
         """Test run_setup_wizard returns proper structure.
@@ -108,10 +99,9 @@ class TestSetupAgent:
         Args:
             mock_config: Mock ConfigManager fixture.
         """
-        with patch("omnidev.agents.setup_agent.BaseOmniDevAgent.__init__") as mock_init:
-            mock_init.return_value = None
-            agent = SetupAgent.__new__(SetupAgent)
-            agent.config = mock_config
-            
-            assert agent.config == mock_config
+        agent = SetupAgent(mock_config)
+        replacement = Mock(spec=ConfigManager)
+        agent.omnidev_config = replacement
+
+        assert agent.omnidev_config is replacement
 
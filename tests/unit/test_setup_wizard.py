@@ -0,0 +1,57 @@
+"""Unit tests for the setup wizard."""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import click
+import pytest
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+
+from omnidev.cli.setup_wizard import SetupWizard, _prompt_int_range
+
+
+class TestSetupWizard:
+    """Test cases for SetupWizard helpers."""
+
+    def test_prompt_int_range_rejects_out_of_range(self) -> None:
+        """Test out-of-range input is rejected until a valid number is entered."""
+        with create_pipe_input() as pipe_input:
+            # Clear the pre-filled default, try 9, then clear and enter 3
+            pipe_input.send_text("\x7f9\r\x7f3\r")
+            with create_app_session(input=pipe_input, output=DummyOutput()):
+                assert _prompt_int_range("Select", 1, 5) == 3
+
+    def test_prompt_int_range_rejects_non_decimal_digits(self) -> None:
+        """Test Unicode digits such as superscripts are rejected rather than crashing."""
+        with create_pipe_input() as pipe_input:
+            pipe_input.send_text("\x7f\u00b2\r\x7f2\r")
+            with create_app_session(input=pipe_input, output=DummyOutput()):
+                assert _prompt_int_range("Select", 1, 5) == 2
+
+    def test_prompt_int_range_accepts_default(self) -> None:
+        """Test pressing Enter accepts the pre-filled default."""
+        with create_pipe_input() as pipe_input:
+            pipe_input.send_text("\r")
+            with create_app_session(input=pipe_input, output=DummyOutput()):
+                assert _prompt_int_range("Select", 1, 5, default=2) == 2
+
+    def test_run_cancel_aborts_wizard(self, tmp_path: Path) -> None:
+        """Test cancelling a selection prompt aborts the whole wizard.
+
+        Args:
+            tmp_path: Pytest temporary path fixture.
+        """
+        config = Mock()
+        config.get_api_key.return_value = "key"
+        wizard = SetupWizard(config, tmp_path)
+
+        with patch.object(wizard, "_index_files", return_value=0), patch(
+            "omnidev.cli.setup_wizard._prompt_int_range", side_effect=click.Abort
+        ) as prompt:
+            with pytest.raises(click.Abort):
+                wizard.run()
+
+        prompt.assert_called_once()
+        config.save_project_config.assert_not_called()
@@ -43,3 +43,15 @@ class TestSlashCommands:
         result = registry.execute("/help")
         assert result == ""
 
+
+    def test_complete_and_list_all(self) -> None:
+        """Test prefix completion and alias-free command listing."""
+        registry = SlashCommandRegistry()
+
+        assert registry.complete("/e") == ["exit"]
+        assert registry.complete("q") == ["quit"]
+        assert registry.complete("zz") == []
+
+        names = [cmd.name for cmd in registry.list_all()]
+        assert "quit" not in names
+        assert names == sorted(set(names))
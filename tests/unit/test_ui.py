@@ -1,5 +1,7 @@
 """Unit tests for UI components."""
 
+from pathlib import Path
+
 import pytest
 
 from omnidev.cli.ui.components import (
@@ -35,6 +37,14 @@ class TestUIComponents:
         )
         block.render()
 
+    def test_action_block_reuses_lexer(self) -> None:
+        """Test lexers are looked up once per language, unknown names pass through."""
+        from omnidev.cli.ui.components import _get_lexer
+
+        assert _get_lexer("python") is _get_lexer("python")
+        assert _get_lexer("no-such-language") == "no-such-language"
+        ActionBlock(action="Write", content="x = 1\n", language="no-such-language").render()
+
     def test_status_bar(self) -> None:
         """Test status bar."""
         status = StatusBar(files_indexed=10, providers=2, mode="auto")
@@ -56,3 +66,47 @@ class TestUIComponents:
         panel = WarningPanel("Test warning")
         panel.render()
 
+
+
+class TestOmniDevCompleter:
+    """Test cases for OmniDevCompleter."""
+
+    def test_prefix_completions(self) -> None:
+        """Test only commands sharing the typed prefix are offered, in order."""
+        from prompt_toolkit.document import Document
+
+        from omnidev.cli.ui.interactive import OmniDevCompleter
+
+        completer = OmniDevCompleter(["status", "help", "history", "exit"])
+
+        def complete(text: str) -> list[str]:
+            return [c.text for c in completer.get_completions(Document(text), None)]
+
+        assert complete("h") == ["help", "history"]
+        assert complete("/his") == ["history"]
+        assert complete("zz") == []
+        assert complete("") == ["exit", "help", "history", "status"]
+
+
+class TestInteractiveMode:
+    """Test cases for InteractiveMode."""
+
+    def test_session_shared_between_instances(self, tmp_path: Path) -> None:
+        """Test instances with the same commands and history reuse one session.
+
+        Args:
+            tmp_path: Pytest temporary path fixture.
+        """
+        from prompt_toolkit.application import create_app_session
+        from prompt_toolkit.output import DummyOutput
+
+        from omnidev.cli.ui.interactive import InteractiveMode
+
+        history_file = str(tmp_path / "history")
+        with create_app_session(output=DummyOutput()):
+            first = InteractiveMode(["help"], history_file)
+            second = InteractiveMode(["help"], history_file)
+            other = InteractiveMode(["help", "exit"], history_file)
+
+        assert first.session is second.session
+        assert other.session is not first.session
@@ -0,0 +1,180 @@
+"""Unit tests for the code validator."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from omnidev.actions.validator import (
+    _RESOLVED_IMPORTS,
+    CodeValidator,
+    _can_import_cached,
+    _is_nonblank_file,
+)
+from omnidev.core.exceptions import ValidationError
+
+
+class TestCodeValidator:
+    """Test cases for CodeValidator."""
+
+    @pytest.fixture
+    def validator(self, tmp_path: Path) -> CodeValidator:
+        """Create a validator rooted in a temporary project.
+
+        Args:
+            tmp_path: Pytest temporary path fixture.
+
+        Returns:
+            CodeValidator instance.
+        """
+        _RESOLVED_IMPORTS.clear()
+        return CodeValidator(tmp_path)
+
+    def test_validate_python_ignores_coding_cookie(self, validator: CodeValidator) -> None:
+        """Test already-decoded source isn't re-decoded with its coding cookie.
+
+        Args:
+            validator: CodeValidator fixture.
+        """
+        assert validator.validate_python('# coding: ascii\nx = "é"\n')
+        tree = validator._parse_cached('# -*- coding: latin-1 -*-\nx = "é"\n')
+        assert tree.body[0].value.value == "é"
+
+    def test_validate_python_reports_syntax_error(self, validator: CodeValidator) -> None:
+        """Test syntax errors are raised as ValidationError with the line.
+
+        Args:
+            validator: CodeValidator fixture.
+        """
+        with pytest.raises(ValidationError, match="line 2"):
+            validator.validate_python("x = 1\ndef (:\n")
+
+    def test_import_prefilter_skips_parsing(self, validator: CodeValidator) -> None:
+        """Test sources without the import keyword are not parsed.
+
+        Args:
+            validator: CodeValidator fixture.
+        """
+        with patch.object(validator, "_parse_cached") as parse:
+            assert validator.validate_imports("x = 1\nimported = 2\n") == []
+            parse.assert_not_called()
+
+        assert validator.validate_imports("if True: import no_such_module_xyz\n") == [
+            "no_such_module_xyz"
+        ]
+
+    def test_validate_imports_collects_unresolved(self, validator: CodeValidator) -> None:
+        """Test every distinct unresolved import is reported once, in order.
+
+        Args:
+            validator: CodeValidator fixture.
+        """
+        source = (
+            "import os\nimport missing_b_xyz\nfrom missing_a_xyz import y\nimport missing_b_xyz\n"
+        )
+
+        assert validator.validate_imports(source) == ["missing_b_xyz", "missing_a_xyz"]
+
+    def test_validate_imports_fast_stops_at_first(self, validator: CodeValidator) -> None:
+        """Test fast mode raises on the first unresolved import without resolving later ones.
+
+        Args:
+            validator: CodeValidator fixture.
+        """
+        source = "import missing_a_xyz\nimport missing_b_xyz\n"
+
+        with patch.object(validator, "_can_import", return_value=False) as can_import:
+            with pytest.raises(ValidationError, match="missing_a_xyz"):
+                validator.validate_imports(source, fast=True)
+        can_import.assert_called_once_with("missing_a_xyz")
+
+        assert validator.validate_imports("import os\nimport os\n", fast=True) == []
+
+    def test_stdlib_imports_skip_lookup(self, validator: CodeValidator) -> None:
+        """Test standard library modules resolve without a find_spec lookup.
+
+        Args:
+            validator: CodeValidator fixture.
+        """
+        with patch("omnidev.actions.validator._can_import_cached") as cached:
+            assert validator._can_import("json")
+            cached.assert_not_called()
+
+    def test_can_import_cached_checks_local_files(self, tmp_path: Path) -> None:
+        """Test local project modules are found and only hits are remembered.
+
+        Args:
+            tmp_path: Pytest temporary path fixture.
+        """
+        _RESOLVED_IMPORTS.clear()
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "local_mod.py").write_text("")
+
+        assert _can_import_cached("pkg.local_mod", str(tmp_path))
+        assert not _can_import_cached("missing_pkg_xyz.sub", str(tmp_path))
+        assert _RESOLVED_IMPORTS == {("pkg.local_mod", str(tmp_path))}
+
+        # A module created later in the session is found on the next check
+        (tmp_path / "missing_pkg_xyz").mkdir()
+        (tmp_path / "missing_pkg_xyz" / "sub.py").write_text("")
+        assert _can_import_cached("missing_pkg_xyz.sub", str(tmp_path))
+
+    @pytest.mark.parametrize(
+        "source",
+        ["f(a[1], {b: (c)})", "((((((((x))))))))", "'é' + g([{}])", "(" * 40 + ")" * 40],
+    )
+    def test_js_brackets_balanced(self, validator: CodeValidator, source: str) -> None:
+        """Test balanced brackets pass, including nesting deeper than the reduction limit.
+
+        Args:
+            validator: CodeValidator fixture.
+            source: JavaScript snippet.
+        """
+        assert validator._validate_js_basic(source)
+
+    @pytest.mark.parametrize("source", ["f(a[1)]", "{", "}", "(" * 40 + ")" * 39, "[(])"])
+    def test_js_brackets_unbalanced(self, validator: CodeValidator, source: str) -> None:
+        """Test mismatched or unclosed brackets are rejected.
+
+        Args:
+            validator: CodeValidator fixture.
+            source: JavaScript snippet.
+        """
+        with pytest.raises(ValidationError):
+            validator._validate_js_basic(source)
+
+    def test_is_nonblank_file(self, tmp_path: Path) -> None:
+        """Test blank detection across chunk boundaries.
+
+        Args:
+            tmp_path: Pytest temporary path fixture.
+        """
+        blank = tmp_path / "blank.txt"
+        blank.write_bytes(b" \n\t" * 50000)
+        late = tmp_path / "late.txt"
+        late.write_bytes(b" " * 200000 + b"x")
+
+        empty = tmp_path / "empty.txt"
+        empty.touch()
+
+        assert not _is_nonblank_file(blank)
+        assert _is_nonblank_file(late)
+        assert not _is_nonblank_file(empty)
+
+    def test_validate_file_reads_non_code_lazily(
+        self, validator: CodeValidator, tmp_path: Path
+    ) -> None:
+        """Test non-code files are checked for content without being decoded.
+
+        Args:
+            validator: CodeValidator fixture.
+            tmp_path: Pytest temporary path fixture.
+        """
+        notes = tmp_path / "notes.txt"
+        notes.write_text("   \n")
+        assert not validator.validate_file(notes)
+
+        notes.write_text("hello")
+        with patch.object(Path, "read_text") as read_text:
+            assert validator.validate_file(notes)
+            read_text.assert_not_called()